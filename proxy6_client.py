@@ -8,20 +8,814 @@ Copyright (c) 2026 Alexsey Novikov
 """
 
 
+import abc
+import asyncio
+import random
+import ssl
+import sys
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from urllib.parse import urlencode
+from collections.abc import AsyncIterator, Iterable, Iterator
+
 import requests
 import aiohttp 
+from requests.adapters import HTTPAdapter
 
 
 class Proxy6Error(Exception):
     """
     Исключение, возникающее при ошибках взаимодействия с API Proxy6.
 
-    Используется для обозначения:
-    - сетевых ошибок (таймауты, обрывы соединения);
-    - ошибок HTTP-уровня;
-    - ошибок, возвращаемых самим API Proxy6.
+    Базовый класс иерархии ошибок клиента:
+    - `Proxy6NetworkError` — сетевые ошибки (обрывы соединения),
+      `Proxy6TimeoutError` — таймауты;
+    - `Proxy6HTTPError` — ошибки HTTP-уровня,
+      `Proxy6RateLimitError` — превышение частоты запросов;
+    - `Proxy6APIError` — ошибки, возвращаемые самим API Proxy6, и его
+      подклассы по коду `error_id`.
+
+    Attributes
+    ----------
+    retryable : bool
+        Является ли ошибка временной, т.е. имеет ли смысл повторить запрос.
+    """
+
+    retryable: bool = False
+
+
+class Proxy6NetworkError(Proxy6Error):
+    """Сетевая ошибка: не удалось установить соединение или оно оборвалось."""
+
+    retryable = True
+
+
+class Proxy6TimeoutError(Proxy6NetworkError):
+    """Превышено время ожидания соединения или ответа API."""
+
+
+class Proxy6HTTPError(Proxy6Error):
+    """
+    Ошибка HTTP-уровня: API ответил статусом 4xx или 5xx.
+
+    Parameters
+    ----------
+    message : str
+        Текст ошибки.
+    status : int
+        HTTP-статус ответа.
+    """
+
+    def __init__(self, message: str, *, status: int) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retryable = status == 429 or status >= 500
+
+
+class Proxy6RateLimitError(Proxy6HTTPError):
+    """Превышена допустимая частота запросов (HTTP 429)."""
+
+    def __init__(self, message: str, *, status: int = 429) -> None:
+        super().__init__(message, status=status)
+
+
+class Proxy6APIError(Proxy6Error):
+    """
+    Ошибка, возвращенная API Proxy6 в ответе со статусом, отличным от 'yes'.
+
+    Parameters
+    ----------
+    message : str
+        Текст ошибки из поля `error`.
+    error_id : int | None, optional
+        Код ошибки из поля `error_id`.
+    """
+
+    def __init__(self, message: str, *, error_id: int | None = None) -> None:
+        super().__init__(message)
+        self.error_id = error_id
+
+    @classmethod
+    def from_response(cls, data: dict) -> 'Proxy6APIError':
+        """
+        Создает исключение подходящего класса по ответу API.
+
+        Parameters
+        ----------
+        data : dict
+            Ответ API с полями `error_id` и `error`.
+
+        Returns
+        -------
+        Proxy6APIError
+            Экземпляр подкласса, соответствующего `error_id`,
+            либо самого `Proxy6APIError` для неизвестных кодов.
+        """
+        try:
+            error_id = int(data.get('error_id'))
+        except (TypeError, ValueError):
+            error_id = None
+        error_class = API_ERRORS.get(error_id, Proxy6APIError)
+        return error_class(data.get('error', 'Unknown API error'), error_id=error_id)
+
+
+class Proxy6AuthError(Proxy6APIError):
+    """Неверный API-ключ или запрос с неразрешенного IP-адреса."""
+
+
+class Proxy6InsufficientBalanceError(Proxy6APIError):
+    """Недостаточно средств на балансе для покупки или продления."""
+
+
+class Proxy6NoProxiesError(Proxy6APIError):
+    """Запрошено больше прокси, чем доступно для покупки."""
+
+
+class Proxy6InvalidParamsError(Proxy6APIError):
+    """Неверные параметры запроса: метод, количество, период, страна, ids и т.п."""
+
+
+class Proxy6PartialError(Proxy6Error):
+    """
+    Запрос, разбитый на части по ID, выполнен не полностью.
+
+    Возникает, только если часть запросов завершилась успешно: изменения
+    для `succeeded_ids` уже применены, для `failed_ids` — нет. Если
+    не удалась ни одна часть, выбрасывается исходная ошибка первой части.
+
+    Parameters
+    ----------
+    message : str
+        Текст ошибки.
+    responses : list[dict]
+        Ответы API успешно выполненных частей.
+    succeeded_ids : tuple[int, ...]
+        ID из успешно выполненных частей.
+    failed_ids : tuple[int, ...]
+        ID из частей, завершившихся ошибкой.
+    errors : list[Proxy6Error]
+        Ошибки неудавшихся частей.
+    """
+
+    def __init__(self, message: str, *, responses: list[dict], succeeded_ids: tuple[int, ...],
+                 failed_ids: tuple[int, ...], errors: list[Proxy6Error]) -> None:
+        super().__init__(message)
+        self.responses = responses
+        self.succeeded_ids = succeeded_ids
+        self.failed_ids = failed_ids
+        self.errors = errors
+        self.retryable = all(error.retryable for error in errors)
+
+
+# Коды error_id из документации API Proxy6: https://px6.me/ru/developers
+API_ERRORS: dict[int, type[Proxy6APIError]] = {
+    100: Proxy6AuthError,           # Error key
+    105: Proxy6AuthError,           # Error ip
+    110: Proxy6InvalidParamsError,  # Error method
+    200: Proxy6InvalidParamsError,  # Error count
+    210: Proxy6InvalidParamsError,  # Error period
+    220: Proxy6InvalidParamsError,  # Error country
+    230: Proxy6InvalidParamsError,  # Error ids
+    240: Proxy6InvalidParamsError,  # Error version
+    250: Proxy6InvalidParamsError,  # Error descr
+    260: Proxy6InvalidParamsError,  # Error type
+    300: Proxy6NoProxiesError,      # Error active proxy allow
+    400: Proxy6InsufficientBalanceError,  # Error no money
+    404: Proxy6InvalidParamsError,  # Error not found
+    410: Proxy6InvalidParamsError,  # Error price calculation
+}
+
+
+class Proxy:
+    """
+    Компактная типизированная запись прокси из ответа `getproxy`.
+
+    Числовые поля и флаги разбираются один раз при создании, повторяющиеся
+    строки (страна, тип, комментарий) интернируются, а даты хранятся
+    в виде unixtime и преобразуются в datetime только при обращении.
+
+    Attributes
+    ----------
+    id : int
+        Внутренний номер прокси.
+    version : int
+        Версия прокси: 4 - IPv4, 3 - IPv4 Shared, 6 - IPv6.
+    ip : str
+        Выходной IP-адрес прокси.
+    host : str
+        Адрес для подключения к прокси.
+    port : int
+        Порт для подключения к прокси.
+    user : str
+        Логин.
+    password : str
+        Пароль (поле `pass` в ответе API).
+    type : str
+        Тип прокси: 'http' или 'socks'.
+    country : str
+        Код страны (ISO2).
+    unixtime : int
+        Время покупки (unixtime).
+    unixtime_end : int
+        Время окончания (unixtime).
+    descr : str
+        Технический комментарий.
+    active : bool
+        Активен ли прокси.
+    """
+
+    __slots__ = (
+        'id', 'version', 'ip', 'host', 'port', 'user', 'password', 'type',
+        'country', 'unixtime', 'unixtime_end', 'descr', 'active',
+    )
+
+    def __init__(
+        self,
+        *,
+        id: int,
+        host: str,
+        port: int,
+        user: str = '',
+        password: str = '',
+        type: str = 'http',
+        version: int = 6,
+        ip: str = '',
+        country: str = '',
+        unixtime: int = 0,
+        unixtime_end: int = 0,
+        descr: str = '',
+        active: bool = True,
+    ) -> None:
+        self.id = id
+        self.version = version
+        self.ip = ip
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.type = sys.intern(type)
+        self.country = sys.intern(country)
+        self.unixtime = unixtime
+        self.unixtime_end = unixtime_end
+        self.descr = sys.intern(descr)
+        self.active = active
+
+    @classmethod
+    def from_api(cls, record: dict) -> 'Proxy':
+        """
+        Создает запись из элемента списка `getproxy`.
+
+        Parameters
+        ----------
+        record : dict[str, object]
+            Данные одного прокси в формате API.
+
+        Returns
+        -------
+        Proxy
+            Типизированная запись прокси.
+        """
+        return cls(
+            id=int(record['id']),
+            version=int(record.get('version') or 6),
+            ip=record.get('ip') or '',
+            host=record['host'],
+            port=int(record['port']),
+            user=record.get('user') or '',
+            password=record.get('pass') or '',
+            type=record.get('type') or 'http',
+            country=record.get('country') or '',
+            unixtime=int(record.get('unixtime') or 0),
+            unixtime_end=int(record.get('unixtime_end') or 0),
+            descr=record.get('descr') or '',
+            active=str(record.get('active', '1')) in ('1', 'True', 'true'),
+        )
+
+    @classmethod
+    def from_list(cls, proxies: dict | list) -> list['Proxy']:
+        """
+        Преобразует поле `list` ответа `getproxy` в список записей.
+
+        Parameters
+        ----------
+        proxies : dict | list
+            Словарь прокси по ID либо пустой список, который API
+            возвращает при отсутствии прокси.
+
+        Returns
+        -------
+        list[Proxy]
+            Типизированные записи прокси.
+        """
+        records = proxies.values() if isinstance(proxies, dict) else proxies
+        return [cls.from_api(record) for record in records]
+
+    @property
+    def date(self) -> datetime:
+        """Время покупки (UTC)."""
+        return datetime.fromtimestamp(self.unixtime, tz=timezone.utc)
+
+    @property
+    def date_end(self) -> datetime:
+        """Время окончания (UTC)."""
+        return datetime.fromtimestamp(self.unixtime_end, tz=timezone.utc)
+
+    def to_dict(self) -> dict[str, object]:
+        """
+        Возвращает запись в формате элемента списка `getproxy`.
+
+        Returns
+        -------
+        dict[str, object]
+            Данные прокси с ключами API, включая `pass` и `date_end`.
+        """
+        return {
+            'id': str(self.id),
+            'version': str(self.version),
+            'ip': self.ip,
+            'host': self.host,
+            'port': str(self.port),
+            'user': self.user,
+            'pass': self.password,
+            'type': self.type,
+            'country': self.country,
+            'date': self.date.strftime('%Y-%m-%d %H:%M:%S'),
+            'date_end': self.date_end.strftime('%Y-%m-%d %H:%M:%S'),
+            'unixtime': self.unixtime,
+            'unixtime_end': self.unixtime_end,
+            'descr': self.descr,
+            'active': '1' if self.active else '0',
+        }
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Proxy):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f'Proxy(id={self.id}, host={self.host!r}, port={self.port}, type={self.type!r})'
+
+
+class Proxy6Cache:
+    """
+    Потокобезопасный LRU-кеш ответов справочных методов API Proxy6.
+
+    Ключом записи служит пара (метод API, нормализованные параметры). Каждому
+    методу задается собственное время жизни записи; методы, отсутствующие в
+    `ttl`, не кешируются. Успешный вызов любого метода из `invalidated_by`
+    очищает кеш целиком.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        Максимальное количество записей. По умолчанию 1024.
+    ttl : dict[str, float] | None, optional
+        Время жизни записей в секундах по названиям методов API.
+        По умолчанию `DEFAULT_TTL`.
+
+    Notes
+    -----
+    Из кеша возвращается тот же объект ответа, что был сохранен,
+    поэтому изменять его на стороне вызывающего кода не следует.
+    """
+
+    DEFAULT_TTL: dict[str, float] = {
+        'getcountry': 3600.0,
+        'getcount': 60.0,
+        'getprice': 300.0,
+    }
+    invalidated_by: frozenset[str] = frozenset({'buy', 'prolong', 'delete'})
+
+    def __init__(self, *, maxsize: int = 1024, ttl: dict[str, float] | None = None) -> None:
+        self.maxsize = maxsize
+        self.ttl: dict[str, float] = dict(self.DEFAULT_TTL if ttl is None else ttl)
+        self._entries: OrderedDict[tuple, tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, method_name: str, params: dict) -> tuple | None:
+        """
+        Строит ключ кеша для вызова метода API.
+
+        Parameters
+        ----------
+        method_name : str
+            Название метода API.
+        params : dict[str, object]
+            Подготовленные параметры запроса.
+
+        Returns
+        -------
+        tuple | None
+            Ключ записи или None, если метод не кешируется.
+        """
+        if method_name not in self.ttl:
+            return None
+        return method_name, tuple(sorted((key, str(value)) for key, value in params.items()))
+
+    def get(self, key: tuple) -> dict | None:
+        """
+        Возвращает сохраненный ответ, если запись существует и не устарела.
+
+        Parameters
+        ----------
+        key : tuple
+            Ключ записи, полученный из `make_key`.
+
+        Returns
+        -------
+        dict | None
+            Ответ API или None при промахе.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, data = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return data
+
+    def set(self, key: tuple, data: dict) -> None:
+        """
+        Сохраняет ответ API, вытесняя самые давно использованные записи.
+
+        Parameters
+        ----------
+        key : tuple
+            Ключ записи, полученный из `make_key`.
+        data : dict
+            Ответ API.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl[key[0]], data)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, method_name: str | None = None) -> None:
+        """
+        Удаляет записи кеша.
+
+        Parameters
+        ----------
+        method_name : str | None, optional
+            Название метода API, записи которого нужно удалить.
+            По умолчанию очищается весь кеш.
+        """
+        with self._lock:
+            if method_name is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[0] == method_name]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class RateLimiter(abc.ABC):
+    """
+    Базовый клиентский ограничитель частоты запросов к API Proxy6.
+
+    Потокобезопасен и может одновременно использоваться синхронным и
+    асинхронным клиентами с одним API-ключом. Каждый вызов `acquire`
+    резервирует право на запрос и ожидает наступления своей очереди,
+    поэтому всплески запросов сглаживаются вместо получения ошибок от API.
+
+    Parameters
+    ----------
+    rate : float, optional
+        Допустимое число запросов в секунду. По умолчанию `DEFAULT_RATE`.
+
+    Attributes
+    ----------
+    acquired : int
+        Количество выданных разрешений.
+    delayed : int
+        Количество разрешений, которых пришлось ждать.
+    wait_time : float
+        Суммарное время ожидания в секундах.
+    """
+
+    # Лимит API Proxy6 на количество запросов в секунду с одного ключа
+    DEFAULT_RATE: float = 3.0
+
+    def __init__(self, rate: float = DEFAULT_RATE) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be positive')
+        self.rate = rate
+        self.acquired = 0
+        self.delayed = 0
+        self.wait_time = 0.0
+        self._lock = threading.Lock()
+
+    @abc.abstractmethod
+    def _reserve(self, now: float) -> float:
+        """
+        Резервирует разрешение на запрос.
+
+        Parameters
+        ----------
+        now : float
+            Текущее значение `time.monotonic()`.
+
+        Returns
+        -------
+        float
+            Время в секундах, которое нужно подождать перед запросом.
+        """
+
+    def _take(self) -> float:
+        with self._lock:
+            delay = self._reserve(time.monotonic())
+            self.acquired += 1
+            if delay > 0:
+                self.delayed += 1
+                self.wait_time += delay
+            return delay
+
+    def acquire(self) -> float:
+        """
+        Блокирует текущий поток до получения разрешения на запрос.
+
+        Returns
+        -------
+        float
+            Время ожидания в секундах.
+        """
+        delay = self._take()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Приостанавливает корутину до получения разрешения на запрос.
+
+        Returns
+        -------
+        float
+            Время ожидания в секундах.
+        """
+        delay = self._take()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """
+        Метрики ожидания ограничителя.
+
+        Returns
+        -------
+        dict[str, float]
+            Количество выданных и отложенных разрешений, суммарное и среднее
+            время ожидания.
+        """
+        with self._lock:
+            return {
+                'acquired': self.acquired,
+                'delayed': self.delayed,
+                'wait_time': self.wait_time,
+                'avg_wait': self.wait_time / self.acquired if self.acquired else 0.0,
+            }
+
+
+class TokenBucket(RateLimiter):
+    """
+    Ограничитель «маркерная корзина»: допускает всплески до `capacity`
+    запросов, после чего выдает разрешения со скоростью `rate` в секунду.
+
+    Parameters
+    ----------
+    rate : float, optional
+        Скорость пополнения корзины, запросов в секунду.
+    capacity : float | None, optional
+        Емкость корзины (максимальный всплеск). По умолчанию равна `rate`.
+    """
+
+    def __init__(self, rate: float = RateLimiter.DEFAULT_RATE, capacity: float | None = None) -> None:
+        super().__init__(rate)
+        self.capacity = max(1.0, rate if capacity is None else capacity)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _reserve(self, now: float) -> float:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+        self._tokens -= 1
+        return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+class LeakyBucket(RateLimiter):
     """
-    ...
+    Ограничитель «дырявое ведро»: выдает разрешения строго равномерно,
+    не чаще одного раза в `1 / rate` секунд, без всплесков.
+
+    Parameters
+    ----------
+    rate : float, optional
+        Допустимое число запросов в секунду.
+    """
+
+    def __init__(self, rate: float = RateLimiter.DEFAULT_RATE) -> None:
+        super().__init__(rate)
+        self._next = 0.0
+
+    def _reserve(self, now: float) -> float:
+        slot = max(now, self._next)
+        self._next = slot + 1 / self.rate
+        return slot - now
+
+
+class RetryPolicy:
+    """
+    Политика повторных попыток при временных сбоях, общая для обоих клиентов.
+
+    Повторяются только запросы к идемпотентным методам API и только при
+    временных ошибках: обрывах соединения, таймаутах и HTTP-статусах из
+    `retry_statuses`. Пауза перед очередной попыткой растет экспоненциально
+    от `backoff_base` до `backoff_cap` и при `jitter` выбирается случайно
+    в диапазоне от нуля до этого значения.
+
+    Parameters
+    ----------
+    max_attempts : int, optional
+        Максимальное число попыток, включая первую. По умолчанию 3.
+    backoff_base : float, optional
+        Пауза перед второй попыткой в секундах. По умолчанию 0.5.
+    backoff_cap : float, optional
+        Максимальная пауза между попытками в секундах. По умолчанию 10.
+    jitter : bool, optional
+        Использовать случайную паузу (full jitter). По умолчанию True.
+    retry_statuses : frozenset[int] | None, optional
+        HTTP-статусы, считающиеся временными. По умолчанию `RETRY_STATUSES`.
+    idempotent_methods : frozenset[str] | None, optional
+        Методы API, которые можно безопасно повторять.
+        По умолчанию `IDEMPOTENT_METHODS`.
+
+    Notes
+    -----
+    `buy` и `prolong` списывают средства при каждом выполнении, поэтому
+    по умолчанию никогда не повторяются.
+    """
+
+    RETRY_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+    IDEMPOTENT_METHODS: frozenset[str] = frozenset({
+        'getprice', 'getcount', 'getcountry', 'getproxy', 'check',
+        'settype', 'setdescr', 'delete',
+    })
+
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 10.0,
+        jitter: bool = True,
+        retry_statuses: frozenset[int] | None = None,
+        idempotent_methods: frozenset[str] | None = None,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError('max_attempts must be at least 1')
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.jitter = jitter
+        self.retry_statuses = self.RETRY_STATUSES if retry_statuses is None else frozenset(retry_statuses)
+        self.idempotent_methods = (
+            self.IDEMPOTENT_METHODS if idempotent_methods is None else frozenset(idempotent_methods)
+        )
+
+    def is_transient(self, error: Proxy6Error) -> bool:
+        """
+        Определяет, является ли ошибка временной.
+
+        Parameters
+        ----------
+        error : Proxy6Error
+            Ошибка запроса.
+
+        Returns
+        -------
+        bool
+            True для сетевых ошибок, таймаутов и HTTP-статусов из `retry_statuses`.
+        """
+        if isinstance(error, Proxy6HTTPError):
+            return error.status in self.retry_statuses
+        return isinstance(error, Proxy6NetworkError)
+
+    def should_retry(self, method_name: str, attempt: int, transient: bool) -> bool:
+        """
+        Определяет, нужно ли повторить неудавшийся запрос.
+
+        Parameters
+        ----------
+        method_name : str
+            Название метода API.
+        attempt : int
+            Номер завершившейся неудачей попытки, начиная с 1.
+        transient : bool
+            Является ли ошибка временной.
+
+        Returns
+        -------
+        bool
+            True, если запрос следует повторить.
+        """
+        return transient and attempt < self.max_attempts and method_name in self.idempotent_methods
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Вычисляет паузу перед следующей попыткой.
+
+        Parameters
+        ----------
+        attempt : int
+            Номер завершившейся неудачей попытки, начиная с 1.
+
+        Returns
+        -------
+        float
+            Пауза в секундах.
+        """
+        delay = min(self.backoff_cap, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+# Безопасная длина URL GET-запроса к API, включая список ids
+MAX_URL_LENGTH = 2048
+
+
+def chunk_ids(ids: Iterable[int], *, max_length: int, max_count: int | None = None) -> list[tuple[int, ...]]:
+    """
+    Разбивает ID прокси на кортежи, укладывающиеся в ограничение длины URL.
+
+    Длина считается для значения параметра `ids` в URL-кодировке, где каждый
+    разделитель ',' кодируется как '%2C'.
+
+    Parameters
+    ----------
+    ids : Iterable[int]
+        ID прокси в нужном порядке.
+    max_length : int
+        Максимальная длина закодированного значения `ids` в символах.
+    max_count : int | None, optional
+        Максимальное количество ID в одном кортеже.
+
+    Returns
+    -------
+    list[tuple[int, ...]]
+        Кортежи ID в исходном порядке.
+
+    Raises
+    ------
+    ValueError
+        Если отдельный ID не укладывается в `max_length`.
+    """
+    chunks: list[tuple[int, ...]] = []
+    chunk: list[int] = []
+    length = 0
+    for proxy_id in ids:
+        size = len(str(proxy_id))
+        if size > max_length:
+            raise ValueError(f'id {proxy_id} does not fit into {max_length} characters')
+        extra = size + 3 if chunk else size
+        if chunk and (length + extra > max_length or (max_count is not None and len(chunk) >= max_count)):
+            chunks.append(tuple(chunk))
+            chunk, length, extra = [], 0, size
+        chunk.append(proxy_id)
+        length += extra
+    if chunk:
+        chunks.append(tuple(chunk))
+    return chunks
+
+
+def _merge_chunks(chunks: list, outcomes: list) -> list[dict]:
+    """Возвращает ответы всех частей либо выбрасывает ошибку с частичными результатами."""
+    responses = [outcome for outcome in outcomes if not isinstance(outcome, Proxy6Error)]
+    errors = [outcome for outcome in outcomes if isinstance(outcome, Proxy6Error)]
+    if not errors:
+        return responses
+    if not responses:
+        raise errors[0]
+    succeeded: list[int] = []
+    failed: list[int] = []
+    for chunk, outcome in zip(chunks, outcomes):
+        (failed if isinstance(outcome, Proxy6Error) else succeeded).extend(chunk)
+    raise Proxy6PartialError(
+        f'{len(failed)} of {len(succeeded) + len(failed)} ids failed: {errors[0]}',
+        responses=responses, succeeded_ids=tuple(succeeded), failed_ids=tuple(failed), errors=errors,
+    ) from errors[0]
 
 
 class Proxy6:
@@ -34,11 +828,52 @@ class Proxy6:
     ----------
     api : str
         API-ключ для аутентификации в сервисе Proxy6.
+    cache : Proxy6Cache | None, optional
+        Кеш ответов справочных методов. По умолчанию кеширование отключено.
+    rate_limiter : RateLimiter | None, optional
+        Ограничитель частоты запросов. По умолчанию запросы не ограничиваются.
+    retry_policy : RetryPolicy | None, optional
+        Политика повторных попыток. По умолчанию запросы не повторяются.
+    timeout : float | tuple[float, float], optional
+        Таймаут запроса в секундах либо пара (connect, read). По умолчанию 15.
+    pool_connections : int, optional
+        Количество кешируемых пулов соединений (по хостам). По умолчанию 10.
+    pool_maxsize : int, optional
+        Максимальное число соединений в пуле. По умолчанию 10.
+    pool_block : bool, optional
+        Ждать освобождения соединения при исчерпании пула вместо открытия
+        нового. По умолчанию False.
+    keep_alive : bool, optional
+        Переиспользовать соединения между запросами. По умолчанию True.
+    session : requests.Session | None, optional
+        Внешняя HTTP-сессия, например общая для нескольких API-ключей.
+        Параметры пула при этом игнорируются, и клиент не закрывает сессию.
+
+    Notes
+    -----
+    При использовании одного клиента из пула потоков `pool_maxsize` следует
+    задавать не меньше числа потоков, иначе лишние соединения будут
+    закрываться после каждого запроса.
     """
 
     BASE_URL = 'https://px6.link/api'
+    MAX_IDS_PER_REQUEST = 1000
+    MAX_PAGE_SIZE = 1000
 
-    def __init__(self, api: str) -> None:
+    def __init__(
+        self,
+        api: str,
+        *,
+        cache: Proxy6Cache | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float, float] = 15,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        session: requests.Session | None = None,
+    ) -> None:
         """
         Инициализация клиента.
 
@@ -46,10 +881,77 @@ class Proxy6:
         ----------
         api : str
             API-ключ для Proxy6.
+        cache : Proxy6Cache | None, optional
+            Кеш ответов справочных методов.
+        rate_limiter : RateLimiter | None, optional
+            Ограничитель частоты запросов.
+        retry_policy : RetryPolicy | None, optional
+            Политика повторных попыток.
+        timeout : float | tuple[float, float], optional
+            Таймаут запроса либо пара (connect, read).
+        pool_connections : int, optional
+            Количество кешируемых пулов соединений.
+        pool_maxsize : int, optional
+            Максимальное число соединений в пуле.
+        pool_block : bool, optional
+            Блокироваться при исчерпании пула.
+        keep_alive : bool, optional
+            Переиспользовать соединения между запросами.
+        session : requests.Session | None, optional
+            Внешняя HTTP-сессия.
         """
         self.api = api
         self.url = f'{self.BASE_URL}/{self.api}/'
-        self.session: requests.Session = requests.Session()
+        self._owns_session = session is None
+        self.session: requests.Session = session or self.create_session(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            keep_alive=keep_alive,
+        )
+        self.timeout = timeout
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+
+    @staticmethod
+    def create_session(
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+    ) -> requests.Session:
+        """
+        Создает HTTP-сессию с настроенным пулом соединений.
+
+        Parameters
+        ----------
+        pool_connections : int, optional
+            Количество кешируемых пулов соединений. По умолчанию 10.
+        pool_maxsize : int, optional
+            Максимальное число соединений в пуле. По умолчанию 10.
+        pool_block : bool, optional
+            Блокироваться при исчерпании пула. По умолчанию False.
+        keep_alive : bool, optional
+            Переиспользовать соединения между запросами. По умолчанию True.
+
+        Returns
+        -------
+        requests.Session
+            Новая HTTP-сессия.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        if not keep_alive:
+            session.headers['Connection'] = 'close'
+        return session
 
     def _prepare_params(self, params: dict) -> dict:
         """
@@ -104,20 +1006,112 @@ class Proxy6:
         url: str = f'{self.url}{method_name}'
         prepared_params = self._prepare_params(params)
 
-        try:
-            response = self.session.get(url, params=prepared_params, timeout=15)
-            response.raise_for_status()
-            data: dict[str, object] = response.json()
-        except requests.RequestException as e:
-            raise Proxy6Error(f'HTTP error: {e}') from e
-        except ValueError:
-            raise Proxy6Error('Invalid JSON response from API')
+        cache_key = self.cache.make_key(method_name, prepared_params) if self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+
+            try:
+                response = self.session.get(url, params=prepared_params, timeout=self.timeout)
+                response.raise_for_status()
+                data: dict[str, object] = response.json()
+            except requests.RequestException as e:
+                error = self._wrap_error(e)
+                if self.retry_policy is not None and self.retry_policy.should_retry(
+                    method_name, attempt, self.retry_policy.is_transient(error)
+                ):
+                    time.sleep(self.retry_policy.backoff(attempt))
+                    continue
+                raise error from e
+            except ValueError:
+                raise Proxy6Error('Invalid JSON response from API')
+            break
 
         if data.get('status') != 'yes':
-            raise Proxy6Error(data.get('error', 'Unknown API error'))
+            raise Proxy6APIError.from_response(data)
+
+        if cache_key is not None:
+            self.cache.set(cache_key, data)
+        elif self.cache is not None and method_name in self.cache.invalidated_by:
+            self.cache.invalidate()
 
         return data
 
+    def _make_chunked_request(self, method_name: str, ids: object, **params: object) -> list[dict]:
+        """
+        Выполняет запрос, разбивая длинный список ID на несколько запросов.
+
+        Каждая часть ограничена `MAX_IDS_PER_REQUEST` ID и длиной URL
+        `MAX_URL_LENGTH`; части выполняются последовательно, и ошибка одной
+        части не прерывает выполнение остальных.
+
+        Parameters
+        ----------
+        method_name : str
+            Название метода API.
+        ids : object
+            ID прокси: кортеж или список разбиваются на части,
+            остальные значения передаются как есть.
+        **params
+            Остальные параметры запроса.
+
+        Returns
+        -------
+        list[dict[str, object]]
+            Ответы API по частям.
+
+        Raises
+        ------
+        Proxy6PartialError
+            Если часть запросов выполнена успешно, а часть — с ошибкой.
+        Proxy6Error
+            Если с ошибкой завершились все части.
+        """
+        if not isinstance(ids, (tuple, list)) or not ids:
+            return [self._make_request(method_name, ids=ids, **params)]
+        overhead = len(f'{self.url}{method_name}?{urlencode(self._prepare_params(params))}&ids=')
+        chunks = chunk_ids(ids, max_length=MAX_URL_LENGTH - overhead, max_count=self.MAX_IDS_PER_REQUEST)
+        outcomes: list[dict | Proxy6Error] = []
+        for chunk in chunks:
+            try:
+                outcomes.append(self._make_request(method_name, ids=chunk, **params))
+            except Proxy6Error as e:
+                outcomes.append(e)
+        return _merge_chunks(chunks, outcomes)
+
+    def _wrap_error(self, error: requests.RequestException) -> Proxy6Error:
+        """
+        Преобразует исключение requests в исключение иерархии Proxy6Error.
+
+        Parameters
+        ----------
+        error : requests.RequestException
+            Исключение, возникшее при выполнении запроса.
+
+        Returns
+        -------
+        Proxy6Error
+            Исключение соответствующего подкласса.
+        """
+        message = f'HTTP error: {error}'
+        if isinstance(error, requests.Timeout):
+            return Proxy6TimeoutError(message)
+        if isinstance(error, requests.ConnectionError):
+            return Proxy6NetworkError(message)
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            status = error.response.status_code
+            if status == 429:
+                return Proxy6RateLimitError(message)
+            return Proxy6HTTPError(message, status=status)
+        return Proxy6Error(message)
+
     def get_price(self, *, count: int, period: int, version: int = 6) -> float | int:
         """
         Получает стоимость покупки прокси.
@@ -182,7 +1176,8 @@ class Proxy6:
         descr: str | None = None,
         page: int = 1,
         limit: int = 1000,
-    ) -> dict:
+        typed: bool = False,
+    ) -> dict | list[Proxy]:
         """
         Получает список прокси пользователя.
 
@@ -196,10 +1191,12 @@ class Proxy6:
             Номер страницы. По умолчанию 1.
         limit : int, optional
             Количество прокси на страницу. По умолчанию 1000.
+        typed : bool, optional
+            Вернуть список записей `Proxy` вместо ответа API. По умолчанию False.
 
         Returns
         -------
-        dict[str, object]
+        dict[str, object] | list[Proxy]
             Список прокси.
         """
         data = self._make_request(
@@ -209,8 +1206,55 @@ class Proxy6:
             page=page,
             limit=limit,
         )
+        if typed:
+            return Proxy.from_list(data['list'])
         return data['list']
 
+    def iter_proxies(
+        self,
+        *,
+        state: str = 'all',
+        descr: str | None = None,
+        limit: int = 1000,
+        typed: bool = False,
+    ) -> Iterator[dict | Proxy]:
+        """
+        Лениво обходит все страницы списка прокси пользователя.
+
+        Страницы запрашиваются по одной через `get_proxy` по мере
+        потребления записей; обход прекращается на первой неполной странице.
+        Размер страницы не превышает `MAX_PAGE_SIZE` — больший `limit`
+        API все равно усечет, и обход оборвался бы после первой страницы.
+
+        Parameters
+        ----------
+        state : str, optional
+            Статус прокси: 'active', 'expired', 'expiring' или 'all'. По умолчанию 'all'.
+        descr : str | None, optional
+            Фильтр по комментарию.
+        limit : int, optional
+            Количество прокси на страницу, не больше `MAX_PAGE_SIZE`. По умолчанию 1000.
+        typed : bool, optional
+            Выдавать записи `Proxy` вместо словарей. По умолчанию False.
+
+        Yields
+        ------
+        dict[str, object] | Proxy
+            Данные одного прокси.
+        """
+        limit = max(1, min(limit, self.MAX_PAGE_SIZE))
+        page = 1
+        while True:
+            proxies = self.get_proxy(state=state, descr=descr, page=page, limit=limit, typed=typed)
+            records = proxies.values() if isinstance(proxies, dict) else proxies
+            count = 0
+            for record in records:
+                count += 1
+                yield record
+            if count < limit:
+                return
+            page += 1
+
     def set_type(self, *, ids: tuple[int, ...], type: str) -> bool:
         """
         Изменяет тип протокола прокси.
@@ -218,7 +1262,7 @@ class Proxy6:
         Parameters
         ----------
         ids : tuple[int, ...]
-            Внутренние ID прокси.
+            Внутренние ID прокси. Длинный список разбивается на несколько запросов.
         type : str
             Устанавливаемый тип (протокол): http - HTTPS, либо socks - SOCKS5
 
@@ -227,7 +1271,7 @@ class Proxy6:
         bool
             True при успешной смене типа.
         """
-        self._make_request('settype', ids=ids, type=type)
+        self._make_chunked_request('settype', ids=ids, type=type)
         return True
 
     def set_descr(
@@ -247,7 +1291,7 @@ class Proxy6:
         old : str | None, optional
             Старый комментарий.
         ids : tuple[int, ...] | None, optional
-            ID прокси.
+            ID прокси. Длинный список разбивается на несколько запросов.
 
         Returns
         -------
@@ -258,8 +1302,8 @@ class Proxy6:
         -----
         Обязательно должен присутствовать один из параметров: либо 'ids', либо 'old'.
         """
-        data = self._make_request('setdescr', new=new, old=old, ids=ids)
-        return True, data['count']
+        responses = self._make_chunked_request('setdescr', ids=ids, new=new, old=old)
+        return True, sum(int(data['count']) for data in responses)
 
     def buy(
         self,
@@ -318,24 +1362,24 @@ class Proxy6:
         period : int
             Период продления в днях.
         ids : int | tuple[int, ...]
-            ID прокси.
+            ID прокси. Длинный список разбивается на несколько запросов.
 
         Returns
         -------
         bool
             True при успешном продлении.
         """
-        self._make_request('prolong', period=period, ids=ids)
+        self._make_chunked_request('prolong', ids=ids, period=period)
         return True
 
-    def delete(self, *, ids: int | None = None, descr: str | None = None) -> bool:
+    def delete(self, *, ids: int | tuple[int, ...] | None = None, descr: str | None = None) -> bool:
         """
         Удаляет прокси.
 
         Parameters
         ----------
-        ids : int | None, optional
-            ID прокси.
+        ids : int | tuple[int, ...] | None, optional
+            ID прокси. Длинный список разбивается на несколько запросов.
         descr : str | None, optional
             Комментарий для фильтрации.
 
@@ -348,7 +1392,7 @@ class Proxy6:
         -----
         Обязательно должен присутствовать один из параметров: либо 'ids', либо 'old'.
         """
-        self._make_request('delete', ids=ids, descr=descr)
+        self._make_chunked_request('delete', ids=ids, descr=descr)
         return True
 
     def check(self, *, ids: int | None = None, proxy: str | None = None) -> bool:
@@ -372,9 +1416,10 @@ class Proxy6:
 
     def close(self) -> None:
         """
-        Закрывает HTTP-сессию.
+        Закрывает HTTP-сессию. Внешняя сессия не закрывается.
         """
-        self.session.close()
+        if self._owns_session:
+            self.session.close()
 
     def __str__(self) -> str:
         """
@@ -385,11 +1430,146 @@ class Proxy6:
         str
             Информация об аккаунте в формате JSON.
         """
-        response = self.session.get(f'{self.BASE_URL}/{self.api}')
+        response = self.session.get(f'{self.BASE_URL}/{self.api}', timeout=self.timeout)
         response.raise_for_status()
         return str(response.json())
 
 
+class Proxy6AccountManager:
+    """
+    Потокобезопасный менеджер клиентов Proxy6 для множества API-ключей.
+
+    Все клиенты работают через одну HTTP-сессию с общим пулом соединений,
+    а у каждого аккаунта есть собственный ограничитель частоты запросов,
+    метрики которого доступны через `stats`.
+
+    Parameters
+    ----------
+    api_keys : Iterable[str], optional
+        API-ключи, добавляемые при создании.
+    rate : float | None, optional
+        Лимит запросов в секунду для каждого аккаунта по умолчанию,
+        None — без ограничения. По умолчанию `RateLimiter.DEFAULT_RATE`.
+    retry_policy : RetryPolicy | None, optional
+        Политика повторных попыток, общая для всех клиентов.
+    timeout : float | tuple[float, float], optional
+        Таймаут запроса либо пара (connect, read). По умолчанию 15.
+    pool_maxsize : int, optional
+        Максимальное число соединений в общем пуле. По умолчанию 100.
+    pool_block : bool, optional
+        Блокироваться при исчерпании пула. По умолчанию False.
+    """
+
+    def __init__(
+        self,
+        api_keys: Iterable[str] = (),
+        *,
+        rate: float | None = RateLimiter.DEFAULT_RATE,
+        retry_policy: RetryPolicy | None = None,
+        timeout: float | tuple[float, float] = 15,
+        pool_maxsize: int = 100,
+        pool_block: bool = False,
+    ) -> None:
+        self.rate = rate
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        self.session = Proxy6.create_session(pool_maxsize=pool_maxsize, pool_block=pool_block)
+        self._clients: dict[str, Proxy6] = {}
+        self._lock = threading.Lock()
+        for api in api_keys:
+            self.add(api)
+
+    def add(self, api: str, *, rate_limiter: RateLimiter | None = None) -> Proxy6:
+        """
+        Добавляет аккаунт или возвращает уже добавленный.
+
+        Parameters
+        ----------
+        api : str
+            API-ключ аккаунта.
+        rate_limiter : RateLimiter | None, optional
+            Ограничитель частоты запросов аккаунта. По умолчанию
+            `TokenBucket` с лимитом `rate` менеджера.
+
+        Returns
+        -------
+        Proxy6
+            Клиент аккаунта, использующий общую сессию.
+        """
+        with self._lock:
+            client = self._clients.get(api)
+            if client is None:
+                if rate_limiter is None and self.rate is not None:
+                    rate_limiter = TokenBucket(self.rate)
+                client = Proxy6(
+                    api,
+                    session=self.session,
+                    timeout=self.timeout,
+                    rate_limiter=rate_limiter,
+                    retry_policy=self.retry_policy,
+                )
+                self._clients[api] = client
+            return client
+
+    def remove(self, api: str) -> None:
+        """
+        Удаляет аккаунт из менеджера.
+
+        Parameters
+        ----------
+        api : str
+            API-ключ аккаунта.
+        """
+        with self._lock:
+            self._clients.pop(api, None)
+
+    def __getitem__(self, api: str) -> Proxy6:
+        with self._lock:
+            return self._clients[api]
+
+    def __contains__(self, api: object) -> bool:
+        with self._lock:
+            return api in self._clients
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._clients)
+
+    def __iter__(self) -> Iterator[str]:
+        with self._lock:
+            return iter(list(self._clients))
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Возвращает метрики ограничителей частоты по аккаунтам.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            Для каждого API-ключа — лимит `rate` и метрики `RateLimiter.stats`.
+            Аккаунты без ограничителя не включаются.
+        """
+        with self._lock:
+            clients = list(self._clients.items())
+        return {
+            api: {'rate': client.rate_limiter.rate, **client.rate_limiter.stats}
+            for api, client in clients
+            if client.rate_limiter is not None
+        }
+
+    def close(self) -> None:
+        """
+        Закрывает общую HTTP-сессию.
+        """
+        self.session.close()
+
+    def __enter__(self) -> 'Proxy6AccountManager':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
 class AsyncProxy6:
     """
     Асинхронный класс для взаимодействия с API PROXY6. Сайт (https://px6.me/ru/)
@@ -398,12 +1578,82 @@ class AsyncProxy6:
     ----------
     api : str
         API-ключ для аутентификации в сервисе Proxy6.
+    cache : Proxy6Cache | None, optional
+        Кеш ответов справочных методов. По умолчанию кеширование отключено.
+    coalesce : bool, optional
+        Объединять одновременные одинаковые запросы к методам из
+        `COALESCED_METHODS` в один HTTP-запрос (по умолчанию False).
+        Это только методы чтения: в отличие от
+        `RetryPolicy.IDEMPOTENT_METHODS`, сюда не входят 'settype',
+        'setdescr' и 'delete': их безопасно повторять, но изменяющие
+        вызовы всегда отправляются отдельно.
+    rate_limiter : RateLimiter | None, optional
+        Ограничитель частоты запросов. По умолчанию запросы не ограничиваются.
+    retry_policy : RetryPolicy | None, optional
+        Политика повторных попыток. По умолчанию запросы не повторяются.
+    session : aiohttp.ClientSession | None, optional
+        Внешняя HTTP-сессия, например общая для нескольких API-ключей.
+        Клиент использует ее без `async with` и не закрывает.
+    connector : aiohttp.BaseConnector | None, optional
+        Внешний коннектор для собственной сессии клиента. Клиент не
+        закрывает его, поэтому один пул соединений можно разделить между
+        несколькими клиентами.
+    timeout : aiohttp.ClientTimeout | None, optional
+        Таймауты собственной сессии клиента
+        (по умолчанию total=30, connect=10, sock_read=30).
+    method_timeouts : dict[str, aiohttp.ClientTimeout] | None, optional
+        Таймауты отдельных методов API, например {'getproxy': ClientTimeout(total=60)}.
+    limit : int, optional
+        Общий лимит одновременных соединений собственного коннектора (по умолчанию 100).
+    limit_per_host : int, optional
+        Лимит соединений к одному хосту, 0 — без ограничения (по умолчанию 0).
+    ttl_dns_cache : int | None, optional
+        Время жизни кеша DNS в секундах, None — бессрочно (по умолчанию 10).
+    keepalive_timeout : float, optional
+        Время удержания простаивающего соединения в секундах (по умолчанию 15).
+    ssl_context : ssl.SSLContext | bool, optional
+        TLS-контекст, переиспользуемый всеми соединениями коннектора
+        (по умолчанию True — стандартная проверка сертификатов).
     """
+
+    BASE_URL = 'https://px6.link/api'
+    MAX_IDS_PER_REQUEST = 1000
+    MAX_PAGE_SIZE = 1000
+    # Число одновременных запросов при разбиении длинного списка ID на части
+    MAX_CHUNK_CONCURRENCY = 4
+
+    # Методы только для чтения, ответы которых можно разделить между вызовами
+    COALESCED_METHODS: frozenset[str] = frozenset({
+        'getprice', 'getcount', 'getcountry', 'getproxy', 'check',
+    })
     
-    def __init__(self, api: str):
+    def __init__(self, api: str, *, cache: Proxy6Cache | None = None, coalesce: bool = False,
+                 rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None,
+                 session: aiohttp.ClientSession | None = None,
+                 connector: aiohttp.BaseConnector | None = None,
+                 timeout: aiohttp.ClientTimeout | None = None,
+                 method_timeouts: dict[str, aiohttp.ClientTimeout] | None = None,
+                 limit: int = 100, limit_per_host: int = 0, ttl_dns_cache: int | None = 10,
+                 keepalive_timeout: float = 15.0, ssl_context: ssl.SSLContext | bool = True):
         self.api = api
-        self.url = f'https://px6.link/api/{self.api}/'
-        self.session: aiohttp.ClientSession | None = None
+        self.url = f'{self.BASE_URL}/{self.api}/'
+        self.session: aiohttp.ClientSession | None = session
+        self.__owns_session = session is None
+        self.connector = connector
+        self.timeout = timeout or aiohttp.ClientTimeout(total=30, connect=10, sock_read=30)
+        self.method_timeouts = dict(method_timeouts or {})
+        self.__connector_options = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'ttl_dns_cache': ttl_dns_cache,
+            'keepalive_timeout': keepalive_timeout,
+            'ssl': ssl_context,
+        }
+        self.cache = cache
+        self.coalesce = coalesce
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.__inflight: dict[tuple, asyncio.Future] = {}
 
     async def __aenter__(self):
         """
@@ -411,19 +1661,21 @@ class AsyncProxy6:
 
         Создает aiohttp.ClientSession с настроенным таймаутом,
         чтобы предотвратить зависание запросов при проблемах с сетью
-        или медленном ответе API.
+        или медленном ответе API. Если клиенту передана внешняя сессия,
+        используется она.
 
         Returns
         -------
         AsyncProxy6
             Экземпляр клиента Proxy6 с активной HTTP-сессией.
         """
-        timeout = aiohttp.ClientTimeout(
-                                        total=30,
-                                        connect=10,
-                                        sock_read=30
-                                        )
-        self.session = aiohttp.ClientSession(timeout=timeout)
+        if self.session is None:
+            connector = self.connector or aiohttp.TCPConnector(**self.__connector_options)
+            self.session = aiohttp.ClientSession(
+                timeout=self.timeout,
+                connector=connector,
+                connector_owner=self.connector is None,
+            )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -432,10 +1684,9 @@ class AsyncProxy6:
 
         Гарантирует освобождение сетевых ресурсов независимо от того,
         завершился ли блок `async with` успешно или с исключением.
+        Внешняя сессия не закрывается.
         """
-        if self.session:
-            await self.session.close()
-            self.session = None
+        await self.close()
 
 
     async def __get_session(self) -> aiohttp.ClientSession:
@@ -457,7 +1708,9 @@ class AsyncProxy6:
         Выполняет асинхронный HTTP-запрос к API Proxy6.
 
         Формирует GET-запрос к указанному методу API, подготавливает параметры
-        и обрабатывает сетевые ошибки.
+        и обрабатывает сетевые ошибки. При включенном `coalesce` одновременные
+        одинаковые запросы к методам `COALESCED_METHODS` разделяют один HTTP-запрос,
+        и все ожидающие получают один и тот же ответ.
 
         Parameters
         ----------
@@ -479,7 +1732,6 @@ class AsyncProxy6:
             Если HTTP-сессия не была инициализирована.
         """
         session = await self.__get_session()
-        url = f'{self.url}{method_name}'
 
         prepared_params = {}
         for key, value in params.items():
@@ -488,14 +1740,178 @@ class AsyncProxy6:
                     value = ','.join(map(str, value))
                 prepared_params[key] = value
 
-        try:
-            async with session.get(url, params=prepared_params) as response:
-                response.raise_for_status()
-                return await response.json()
-        except aiohttp.ClientError as e:
-            raise Proxy6Error(f'HTTP error while calling {method_name}: {e}')
+        cache_key = self.cache.make_key(method_name, prepared_params) if self.cache is not None else None
+        if cache_key is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        if not (self.coalesce and method_name in self.COALESCED_METHODS):
+            return await self.__send_request(session, method_name, prepared_params, cache_key)
+
+        inflight_key = (method_name, tuple(sorted((key, str(value)) for key, value in prepared_params.items())))
+        task = self.__inflight.get(inflight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.__send_request(session, method_name, prepared_params, cache_key)
+            )
+            self.__inflight[inflight_key] = task
+            task.add_done_callback(lambda done: self.__release_inflight(inflight_key, done))
+        # shield: отмена одного из ожидающих не должна прерывать общий запрос
+        return await asyncio.shield(task)
+
+    async def __send_request(self, session: aiohttp.ClientSession, method_name: str,
+                             prepared_params: dict, cache_key: tuple | None) -> dict:
+        """
+        Отправляет подготовленный запрос и сохраняет успешный ответ в кеш.
+
+        Parameters
+        ----------
+        session : aiohttp.ClientSession
+            Активная HTTP-сессия.
+        method_name : str
+            Название метода API Proxy6.
+        prepared_params : dict
+            Подготовленные параметры запроса.
+        cache_key : tuple | None
+            Ключ кеша или None, если ответ не кешируется.
+
+        Returns
+        -------
+        dict
+            Ответ API в формате JSON.
+        """
+        url = f'{self.url}{method_name}'
+        request_options = {}
+        if method_name in self.method_timeouts:
+            request_options['timeout'] = self.method_timeouts[method_name]
+
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+
+            try:
+                async with session.get(url, params=prepared_params, **request_options) as response:
+                    response.raise_for_status()
+                    data = await response.json()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = self.__wrap_error(method_name, e)
+                if self.retry_policy is not None and self.retry_policy.should_retry(
+                    method_name, attempt, self.retry_policy.is_transient(error)
+                ):
+                    await asyncio.sleep(self.retry_policy.backoff(attempt))
+                    continue
+                raise error from e
+            break
+
+        if self.cache is not None and data.get('status') == 'yes':
+            if cache_key is not None:
+                self.cache.set(cache_key, data)
+            elif method_name in self.cache.invalidated_by:
+                self.cache.invalidate()
+
+        return data
+
+    def __wrap_error(self, method_name: str, error: Exception) -> Proxy6Error:
+        """
+        Преобразует исключение aiohttp или таймаут asyncio в исключение
+        иерархии Proxy6Error.
+
+        Parameters
+        ----------
+        method_name : str
+            Название метода API Proxy6.
+        error : Exception
+            Исключение, возникшее при выполнении запроса.
+
+        Returns
+        -------
+        Proxy6Error
+            Исключение соответствующего подкласса.
+        """
+        message = f'HTTP error while calling {method_name}: {error}'
+        if isinstance(error, asyncio.TimeoutError):
+            return Proxy6TimeoutError(message)
+        if isinstance(error, aiohttp.ClientConnectionError):
+            return Proxy6NetworkError(message)
+        if isinstance(error, aiohttp.ClientResponseError):
+            if error.status == 429:
+                return Proxy6RateLimitError(message)
+            return Proxy6HTTPError(message, status=error.status)
+        return Proxy6Error(message)
+
+    def __release_inflight(self, key: tuple, task: asyncio.Future) -> None:
+        """
+        Снимает завершенный запрос с учета одновременных запросов.
+
+        Исключение задачи помечается как полученное, чтобы отмена всех
+        ожидающих не приводила к предупреждению asyncio.
+        """
+        if self.__inflight.get(key) is task:
+            del self.__inflight[key]
+        if not task.cancelled():
+            task.exception()
 
 
+    async def __make_chunked_request(self, method_name: str, ids: object, **params) -> list[dict]:
+        """
+        Выполняет запрос, разбивая длинный список ID на несколько запросов.
+
+        Каждая часть ограничена `MAX_IDS_PER_REQUEST` ID и длиной URL
+        `MAX_URL_LENGTH`; части выполняются конкурентно, не более
+        `MAX_CHUNK_CONCURRENCY` одновременно, и ошибка одной части
+        не прерывает выполнение остальных.
+
+        Parameters
+        ----------
+        method_name : str
+            Название метода API Proxy6.
+        ids : object
+            ID прокси: кортеж или список разбиваются на части,
+            остальные значения передаются как есть.
+        **params : dict
+            Остальные параметры запроса.
+
+        Returns
+        -------
+        list[dict]
+            Успешные ответы API по частям.
+
+        Raises
+        ------
+        Proxy6PartialError
+            Если часть запросов выполнена успешно, а часть — с ошибкой.
+        Proxy6Error
+            Если с ошибкой завершились все части.
+        """
+        if not isinstance(ids, (tuple, list)) or not ids:
+            chunks = [ids]
+        else:
+            query = urlencode({key: value for key, value in params.items() if value is not None})
+            overhead = len(f'{self.url}{method_name}?{query}&ids=')
+            chunks = chunk_ids(ids, max_length=MAX_URL_LENGTH - overhead,
+                               max_count=self.MAX_IDS_PER_REQUEST)
+
+        if len(chunks) == 1:
+            data = await self.__make_request(method_name, ids=chunks[0], **params)
+            self.__check_status(data)
+            return [data]
+
+        semaphore = asyncio.Semaphore(self.MAX_CHUNK_CONCURRENCY)
+
+        async def request(chunk: tuple[int, ...]) -> dict | Proxy6Error:
+            async with semaphore:
+                try:
+                    data = await self.__make_request(method_name, ids=chunk, **params)
+                    self.__check_status(data)
+                except Proxy6Error as e:
+                    return e
+            return data
+
+        return _merge_chunks(chunks, await asyncio.gather(*(request(chunk) for chunk in chunks)))
+
     def __check_status(self, data: dict) -> None:
         """
         Проверяет успешность ответа API Proxy6.
@@ -510,11 +1926,12 @@ class AsyncProxy6:
 
         Raises
         ------
-        Proxy6Error
-            Если API вернул статус, отличный от успешного.
+        Proxy6APIError
+            Если API вернул статус, отличный от успешного. Класс исключения
+            определяется по полю `error_id`.
         """
         if data.get('status') != 'yes':
-            raise Proxy6Error(f'API error: {data}')
+            raise Proxy6APIError.from_response(data)
 
     
     async def get_price(self, *, count: int, period: int, version: int = 6) -> int | float:
@@ -592,7 +2009,7 @@ class AsyncProxy6:
         return data['list']
 
     async def get_proxy(self, *, state: str = 'all', descr: str = None, 
-                       page: int = 1, limit: int = 1000) -> dict:
+                       page: int = 1, limit: int = 1000, typed: bool = False) -> dict | list[Proxy]:
         """
         Получает информацию о прокси объекта класса AsyncProxy6.
 
@@ -607,18 +2024,111 @@ class AsyncProxy6:
             Номер страницы для пагинации (по умолчанию 1).
         limit : int, optional
             Количество прокси для вывода (по умолчанию 1000, максимальное).
+        typed : bool, optional
+            Вернуть список записей `Proxy` вместо ответа API (по умолчанию False).
 
         Returns
         -------
-        dict
+        dict | list[Proxy]
             Информация о прокси.
         """
         data = await self.__make_request('getproxy', state=state, descr=descr, 
                                         page=page, limit=limit)
 
         self.__check_status(data)
+        if typed:
+            return Proxy.from_list(data['list'])
         return data['list']
-        
+
+    async def aiter_proxies(self, *, state: str = 'all', descr: str = None,
+                            limit: int = 1000, prefetch: int = 0,
+                            typed: bool = False) -> AsyncIterator[dict | Proxy]:
+        """
+        Лениво обходит все страницы списка прокси пользователя.
+
+        Без `prefetch` следующая страница запрашивается только после того, как
+        все записи текущей выданы потребителю. С `prefetch` > 0 общее число
+        страниц вычисляется по `list_count` первого ответа, и до `prefetch`
+        следующих страниц загружаются параллельно с опережением. Записи в обоих
+        режимах выдаются в порядке страниц; обход прекращается на первой
+        неполной странице. Размер страницы не превышает `MAX_PAGE_SIZE`.
+
+        Parameters
+        ----------
+        state : str, optional
+            Состояние прокси: 'active', 'expired', 'expiring', 'all' (по умолчанию 'all').
+        descr : str, optional
+            Технический комментарий, указанный при покупке прокси.
+        limit : int, optional
+            Количество прокси на страницу (по умолчанию 1000, максимальное;
+            большие значения уменьшаются до `MAX_PAGE_SIZE`).
+        prefetch : int, optional
+            Максимальное число одновременно загружаемых страниц (по умолчанию 0 —
+            без опережающей загрузки).
+        typed : bool, optional
+            Выдавать записи `Proxy` вместо словарей (по умолчанию False).
+
+        Yields
+        ------
+        dict | Proxy
+            Информация об одном прокси.
+        """
+        limit = max(1, min(limit, self.MAX_PAGE_SIZE))
+        if prefetch <= 0:
+            page = 1
+            while True:
+                proxies = await self.get_proxy(state=state, descr=descr, page=page,
+                                               limit=limit, typed=typed)
+                records = proxies.values() if isinstance(proxies, dict) else proxies
+                count = 0
+                for record in records:
+                    count += 1
+                    yield record
+                if count < limit:
+                    return
+                page += 1
+
+        data = await self.__make_request('getproxy', state=state, descr=descr,
+                                        page=1, limit=limit)
+        self.__check_status(data)
+
+        proxies = Proxy.from_list(data['list']) if typed else data['list']
+        records = proxies.values() if isinstance(proxies, dict) else proxies
+        count = 0
+        for record in records:
+            count += 1
+            yield record
+        if count < limit:
+            return
+
+        last_page = max(1, -(-int(data.get('list_count', 0)) // limit))
+        next_page = 2
+        pending: deque[asyncio.Future] = deque()
+        try:
+            while True:
+                while len(pending) < prefetch and next_page <= last_page:
+                    pending.append(asyncio.ensure_future(
+                        self.get_proxy(state=state, descr=descr, page=next_page,
+                                       limit=limit, typed=typed)
+                    ))
+                    next_page += 1
+                if not pending:
+                    # list_count оказался меньше фактического объема — догружаем дальше
+                    last_page = next_page
+                    continue
+
+                proxies = await pending.popleft()
+                records = proxies.values() if isinstance(proxies, dict) else proxies
+                count = 0
+                for record in records:
+                    count += 1
+                    yield record
+                if count < limit:
+                    return
+        finally:
+            for task in pending:
+                task.cancel()
+
     async def set_type(self, *, ids: tuple, type: str) -> bool:
         """
         Изменяет тип (протокол) ваших прокси.
@@ -627,6 +2137,7 @@ class AsyncProxy6:
         ----------
         ids : tuple
             Внутренние номера прокси в системе, кортежем (обязательный параметр).
+            Длинный список разбивается на несколько конкурентных запросов.
         type : str
             Устанавливаемый тип: 'http' - HTTPS, или 'socks' - SOCKS5 (обязательный параметр).
 
@@ -634,9 +2145,7 @@ class AsyncProxy6:
         -------
         True, если успешно.
         """
-        data = await self.__make_request('settype', ids=ids, type=type)
-
-        self.__check_status(data)
+        await self.__make_chunked_request('settype', ids=ids, type=type)
         return True
 
     async def set_descr(self, *, new: str, old: str = None, ids: tuple = None) -> tuple:
@@ -650,7 +2159,8 @@ class AsyncProxy6:
         old : str, optional
             Старый технический комментарий для изменения.
         ids : tuple, optional
-            Внутренние номера прокси в системе.
+            Внутренние номера прокси в системе. Длинный список разбивается
+            на несколько конкурентных запросов.
 
         Returns
         -------
@@ -661,10 +2171,8 @@ class AsyncProxy6:
         -----
         Обязательно должен присутствовать один из параметров: либо 'ids', либо 'old'.
         """
-        data = await self.__make_request('setdescr', new=new, old=old, ids=ids)
-
-        self.__check_status(data)
-        return True, data['count']
+        responses = await self.__make_chunked_request('setdescr', ids=ids, new=new, old=old)
+        return True, sum(int(data['count']) for data in responses)
                 
     async def buy(self, *, count: int, period: int, country: str, version: int = 6, 
                   type: str = 'http', descr: str = None, auto_prolong: bool = False) -> dict:
@@ -712,24 +2220,24 @@ class AsyncProxy6:
             Период продления в днях (обязательный параметр).
         ids : int or tuple
             Внутренние номера прокси в системе (обязательный параметр).
+            Длинный список разбивается на несколько конкурентных запросов.
 
         Returns
         -------
         True, если успешно.
         """
-        data = await self.__make_request('prolong', period=period, ids=ids)
-        
-        self.__check_status(data)
+        await self.__make_chunked_request('prolong', ids=ids, period=period)
         return True
         
-    async def delete(self, *, ids: int = None, descr: str = None) -> bool:
+    async def delete(self, *, ids: int | tuple = None, descr: str = None) -> bool:
         """
         Удаляет прокси.
 
         Parameters
         ----------
-        ids : int, optional
-            Внутренние номера прокси в системе.
+        ids : int or tuple, optional
+            Внутренние номера прокси в системе. Длинный список разбивается
+            на несколько конкурентных запросов.
         descr : str, optional
             Технический комментарий, указанный при покупке прокси.
 
@@ -741,9 +2249,7 @@ class AsyncProxy6:
         -----
         Обязательно должен присутствовать один из параметров: либо 'ids', либо 'descr'.
         """
-        data = await self.__make_request('delete', ids=ids, descr=descr)
-
-        self.__check_status(data)
+        await self.__make_chunked_request('delete', ids=ids, descr=descr)
         return True
         
     async def check(self, *, ids: int = None, proxy: str = None) -> bool:
@@ -782,12 +2288,165 @@ class AsyncProxy6:
             При сетевой ошибке или ошибке API.
         """
         session = await self.__get_session()
-        async with session.get(f'https://px6.link/api/{self.api}') as response:
+        async with session.get(f'{self.BASE_URL}/{self.api}') as response:
             response.raise_for_status()
             return await response.json()
 
     async def close(self):
-        """Закрывает сессию вручную."""
+        """Закрывает сессию вручную. Внешняя сессия не закрывается."""
+        if self.session and self.__owns_session:
+            await self.session.close()
+            self.session = None
+
+
+class AsyncProxy6AccountManager:
+    """
+    Менеджер асинхронных клиентов Proxy6 для множества API-ключей.
+
+    Все клиенты работают через одну aiohttp.ClientSession с общим пулом
+    соединений, которая создается при входе в `async with`. У каждого
+    аккаунта есть собственный ограничитель частоты запросов, метрики
+    которого доступны через `stats`.
+
+    Parameters
+    ----------
+    api_keys : Iterable[str], optional
+        API-ключи, добавляемые при создании.
+    rate : float | None, optional
+        Лимит запросов в секунду для каждого аккаунта по умолчанию,
+        None — без ограничения. По умолчанию `RateLimiter.DEFAULT_RATE`.
+    retry_policy : RetryPolicy | None, optional
+        Политика повторных попыток, общая для всех клиентов.
+    timeout : aiohttp.ClientTimeout | None, optional
+        Таймауты общей сессии (по умолчанию total=30, connect=10, sock_read=30).
+    limit : int, optional
+        Общий лимит одновременных соединений (по умолчанию 100).
+    limit_per_host : int, optional
+        Лимит соединений к одному хосту, 0 — без ограничения (по умолчанию 0).
+    """
+
+    def __init__(self, api_keys: Iterable[str] = (), *,
+                 rate: float | None = RateLimiter.DEFAULT_RATE,
+                 retry_policy: RetryPolicy | None = None,
+                 timeout: aiohttp.ClientTimeout | None = None,
+                 limit: int = 100, limit_per_host: int = 0):
+        self.rate = rate
+        self.retry_policy = retry_policy
+        self.timeout = timeout or aiohttp.ClientTimeout(total=30, connect=10, sock_read=30)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.session: aiohttp.ClientSession | None = None
+        self.__limiters: dict[str, RateLimiter | None] = {}
+        self.__clients: dict[str, AsyncProxy6] = {}
+        for api in api_keys:
+            self.add(api)
+
+    async def __aenter__(self):
+        """
+        Создает общую HTTP-сессию и клиенты для всех добавленных аккаунтов.
+
+        Returns
+        -------
+        AsyncProxy6AccountManager
+            Менеджер с активной HTTP-сессией.
+        """
+        if self.session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit, limit_per_host=self.limit_per_host)
+            self.session = aiohttp.ClientSession(timeout=self.timeout, connector=connector)
+            for api in self.__limiters:
+                self.__clients[api] = self.__create_client(api)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def __create_client(self, api: str) -> AsyncProxy6:
+        return AsyncProxy6(api, session=self.session, rate_limiter=self.__limiters[api],
+                           retry_policy=self.retry_policy)
+
+    def add(self, api: str, *, rate_limiter: RateLimiter | None = None) -> AsyncProxy6 | None:
+        """
+        Добавляет аккаунт или возвращает уже добавленный.
+
+        Parameters
+        ----------
+        api : str
+            API-ключ аккаунта.
+        rate_limiter : RateLimiter | None, optional
+            Ограничитель частоты запросов аккаунта. По умолчанию
+            `TokenBucket` с лимитом `rate` менеджера.
+
+        Returns
+        -------
+        AsyncProxy6 | None
+            Клиент аккаунта, использующий общую сессию, или None, если
+            сессия еще не создана.
+        """
+        if api not in self.__limiters:
+            if rate_limiter is None and self.rate is not None:
+                rate_limiter = TokenBucket(self.rate)
+            self.__limiters[api] = rate_limiter
+        if self.session is not None and api not in self.__clients:
+            self.__clients[api] = self.__create_client(api)
+        return self.__clients.get(api)
+
+    def remove(self, api: str) -> None:
+        """
+        Удаляет аккаунт из менеджера.
+
+        Parameters
+        ----------
+        api : str
+            API-ключ аккаунта.
+        """
+        self.__limiters.pop(api, None)
+        self.__clients.pop(api, None)
+
+    def __getitem__(self, api: str) -> AsyncProxy6:
+        """
+        Возвращает клиент аккаунта.
+
+        Raises
+        ------
+        KeyError
+            Если аккаунт не добавлен.
+        RuntimeError
+            Если общая сессия не была инициализирована.
+        """
+        if api not in self.__limiters:
+            raise KeyError(api)
+        if self.session is None:
+            raise RuntimeError("ClientSession not initialized. Use 'async with AsyncProxy6AccountManager(...)'")
+        return self.__clients[api]
+
+    def __contains__(self, api: object) -> bool:
+        return api in self.__limiters
+
+    def __len__(self) -> int:
+        return len(self.__limiters)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self.__limiters))
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Возвращает метрики ограничителей частоты по аккаунтам.
+
+        Returns
+        -------
+        dict[str, dict[str, float]]
+            Для каждого API-ключа — лимит `rate` и метрики `RateLimiter.stats`.
+            Аккаунты без ограничителя не включаются.
+        """
+        return {
+            api: {'rate': limiter.rate, **limiter.stats}
+            for api, limiter in self.__limiters.items()
+            if limiter is not None
+        }
+
+    async def close(self):
+        """Закрывает общую HTTP-сессию."""
         if self.session:
             await self.session.close()
             self.session = None
+            self.__clients.clear()
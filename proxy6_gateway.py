@@ -0,0 +1,869 @@
+"""
+Proxy6 API Client — локальный шлюз с балансировкой нагрузки по прокси аккаунта
+
+Copyright (c) 2026 Alexsey Novikov
+
+Распространяется под лицензией MIT.
+Подробнее см. в файле LICENSE или на https://opensource.org/licenses/MIT.
+"""
+
+
+import asyncio
+import base64
+import ipaddress
+import struct
+import time
+from urllib.parse import urlsplit
+
+from proxy6_client import AsyncProxy6, Proxy
+from proxy6_pool import AsyncProxyPool, CircuitBreaker, RotationStrategy
+from proxy6_probe import ProbeError, ProxyProber, open_tunnel
+
+
+# Заголовки, относящиеся к одному соединению (RFC 9110, раздел 7.6.1)
+HOP_BY_HOP_HEADERS = frozenset({
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization',
+    'proxy-connection', 'te', 'trailer', 'upgrade',
+})
+
+# Заголовок запроса с ключом привязки к прокси; шлюз не пересылает его дальше
+SESSION_HEADER = 'X-Proxy6-Session'
+
+Headers = list[tuple[str, str]]
+
+
+def _upstream(proxy: Proxy) -> dict[str, object]:
+    """Возвращает параметры подключения к прокси в формате `open_tunnel`."""
+    return {'host': proxy.host, 'port': proxy.port, 'user': proxy.user or None,
+            'pass': proxy.password, 'type': proxy.type}
+
+
+def _header(headers: Headers, name: str) -> str | None:
+    """Возвращает значение заголовка без учета регистра имени."""
+    for key, value in headers:
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _split_host_port(authority: str, default_port: int) -> tuple[str, int]:
+    """Разбирает `host:port`, в том числе `[ipv6]:port`."""
+    if authority.startswith('['):
+        host, _, rest = authority[1:].partition(']')
+        return host, int(rest[1:]) if rest.startswith(':') else default_port
+    host, sep, port = authority.rpartition(':')
+    if not sep or not port.isdigit():
+        return authority, default_port
+    return host, int(port)
+
+
+async def _read_head(reader: asyncio.StreamReader) -> tuple[str, Headers] | None:
+    """
+    Читает стартовую строку и заголовки HTTP-сообщения.
+
+    Returns
+    -------
+    tuple[str, Headers] | None
+        Стартовая строка и заголовки; None, если соединение закрыто
+        до начала сообщения.
+    """
+    try:
+        head = await reader.readuntil(b'\r\n\r\n')
+    except asyncio.IncompleteReadError as e:
+        if not e.partial:
+            return None
+        raise
+    lines = head[:-4].decode('latin-1').split('\r\n')
+    headers = []
+    for line in lines[1:]:
+        name, _, value = line.partition(':')
+        headers.append((name.strip(), value.strip()))
+    return lines[0], headers
+
+
+def _status(status_line: str) -> int:
+    """Возвращает код статуса из стартовой строки ответа; 0, если он не разобран."""
+    parts = status_line.split(' ', 2)
+    return int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else 0
+
+
+def _encode_head(start_line: str, headers: Headers) -> bytes:
+    """Собирает стартовую строку и заголовки HTTP-сообщения."""
+    lines = [start_line] + [f'{name}: {value}' for name, value in headers]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+def _strip_hop_by_hop(headers: Headers) -> Headers:
+    """Удаляет заголовки, относящиеся к одному соединению."""
+    listed = {token.strip().lower() for token in (_header(headers, 'connection') or '').split(',')}
+    return [(name, value) for name, value in headers
+            if name.lower() not in HOP_BY_HOP_HEADERS and name.lower() not in listed]
+
+
+def _keep_alive(version: str, headers: Headers) -> bool:
+    """Определяет, сохраняется ли соединение после сообщения."""
+    tokens = {token.strip().lower() for token in
+              ((_header(headers, 'connection') or '') + ',' + (_header(headers, 'proxy-connection') or '')).split(',')}
+    if 'close' in tokens:
+        return False
+    return version == 'HTTP/1.1' or 'keep-alive' in tokens
+
+
+async def _relay_body(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                      headers: Headers, *, until_eof: bool = False) -> bool:
+    """
+    Пересылает тело HTTP-сообщения согласно его заголовкам.
+
+    Parameters
+    ----------
+    until_eof : bool, optional
+        Читать тело без длины до закрытия соединения (для ответов).
+
+    Returns
+    -------
+    bool
+        True, если граница сообщения определена и соединение можно
+        использовать повторно.
+    """
+    if 'chunked' in (_header(headers, 'transfer-encoding') or '').lower():
+        while True:
+            line = await reader.readuntil(b'\r\n')
+            writer.write(line)
+            size = int(line.split(b';', 1)[0].strip(), 16)
+            if size == 0:
+                while True:
+                    trailer = await reader.readuntil(b'\r\n')
+                    writer.write(trailer)
+                    if trailer == b'\r\n':
+                        break
+                break
+            writer.write(await reader.readexactly(size + 2))
+            await writer.drain()
+        await writer.drain()
+        return True
+
+    length = _header(headers, 'content-length')
+    if length is not None:
+        remaining = int(length)
+        while remaining:
+            data = await reader.read(min(remaining, 65536))
+            if not data:
+                raise asyncio.IncompleteReadError(b'', remaining)
+            writer.write(data)
+            remaining -= len(data)
+            await writer.drain()
+        return True
+
+    if not until_eof:
+        return True
+    while data := await reader.read(65536):
+        writer.write(data)
+        await writer.drain()
+    return False
+
+
+class RelayMeter:
+    """
+    Счетчики трафика, пересланного через туннели шлюза.
+
+    Attributes
+    ----------
+    bytes_up : int
+        Байт, переданных от клиентов к вышестоящим прокси.
+    bytes_down : int
+        Байт, переданных от вышестоящих прокси к клиентам.
+    """
+
+    def __init__(self) -> None:
+        self.bytes_up = 0
+        self.bytes_down = 0
+        self.started = time.monotonic()
+        self._sampled_at = self.started
+        self._sampled_bytes = 0
+
+    @property
+    def total(self) -> int:
+        """Всего пересланных байт в обоих направлениях."""
+        return self.bytes_up + self.bytes_down
+
+    @property
+    def throughput(self) -> float:
+        """Средняя пропускная способность с момента создания, байт в секунду."""
+        elapsed = time.monotonic() - self.started
+        return self.total / elapsed if elapsed > 0 else 0.0
+
+    def sample(self) -> float:
+        """
+        Возвращает пропускную способность с момента предыдущего вызова.
+
+        Returns
+        -------
+        float
+            Байт в секунду за интервал между вызовами `sample`.
+        """
+        now = time.monotonic()
+        total = self.total
+        elapsed = now - self._sampled_at
+        rate = (total - self._sampled_bytes) / elapsed if elapsed > 0 else 0.0
+        self._sampled_at, self._sampled_bytes = now, total
+        return rate
+
+
+class _RelayProtocol(asyncio.BufferedProtocol):
+    """
+    Протокол пересылки данных из одного транспорта в другой.
+
+    Данные принимаются в заранее выделенный буфер и сразу передаются
+    в транспорт другой стороны, минуя `StreamReader`. Если транспорт
+    другой стороны не отправил данные сразу и сохранил ссылку на них,
+    для следующего чтения выделяется новый буфер.
+    """
+
+    def __init__(self, relay: '_Relay', peer: asyncio.Transport, upstream: bool, buffer_size: int) -> None:
+        self.relay = relay
+        self.peer = peer
+        self.upstream = upstream
+        self.buffer_size = buffer_size
+        self.buffer = memoryview(bytearray(buffer_size))
+
+    def get_buffer(self, sizehint: int) -> memoryview:
+        return self.buffer
+
+    def buffer_updated(self, nbytes: int) -> None:
+        self.peer.write(self.buffer[:nbytes])
+        if self.peer.get_write_buffer_size():
+            self.buffer = memoryview(bytearray(self.buffer_size))
+        if self.upstream:
+            self.relay.meter.bytes_up += nbytes
+        else:
+            self.relay.meter.bytes_down += nbytes
+
+    def eof_received(self) -> bool:
+        self.relay.eof(self.peer)
+        return True
+
+    def pause_writing(self) -> None:
+        # Буфер записи этой стороны переполнен: приостанавливаем чтение другой
+        if self.peer.is_reading():
+            self.peer.pause_reading()
+
+    def resume_writing(self) -> None:
+        if not self.peer.is_reading() and not self.peer.is_closing():
+            self.peer.resume_reading()
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        self.relay.close()
+
+
+class _Relay:
+    """Двунаправленная пересылка между клиентским и вышестоящим соединениями."""
+
+    def __init__(self, meter: RelayMeter) -> None:
+        self.meter = meter
+        self.done = asyncio.get_running_loop().create_future()
+        self.transports: list[asyncio.Transport] = []
+        self.half_closed = 0
+
+    def eof(self, peer: asyncio.Transport) -> None:
+        """Передает признак конца данных другой стороне."""
+        self.half_closed += 1
+        if self.half_closed == 2 or not peer.can_write_eof():
+            self.close()
+        elif not peer.is_closing():
+            peer.write_eof()
+
+    def close(self) -> None:
+        for transport in self.transports:
+            transport.close()
+        if not self.done.done():
+            self.done.set_result(None)
+
+
+async def _detach(reader: asyncio.StreamReader, transport: asyncio.Transport,
+                  size: int = 64 * 1024) -> bytes:
+    """
+    Забирает данные, уже прочитанные `StreamReader` сверх рукопожатия.
+
+    Чтение транспорта приостанавливается, после чего `read` повторяется,
+    пока завершается за один шаг цикла событий, то есть пока в буфере
+    есть данные или получен конец потока.
+    """
+    if not transport.is_closing():
+        transport.pause_reading()
+    chunks = []
+    while True:
+        read = asyncio.ensure_future(reader.read(size))
+        await asyncio.sleep(0)
+        if not read.done():
+            read.cancel()
+            await asyncio.wait([read])
+            break
+        data = read.result()
+        if not data:
+            break
+        chunks.append(data)
+    return b''.join(chunks)
+
+
+async def relay(client: tuple[asyncio.StreamReader, asyncio.StreamWriter],
+                upstream: tuple[asyncio.StreamReader, asyncio.StreamWriter], *,
+                meter: RelayMeter | None = None, buffer_size: int = 256 * 1024) -> None:
+    """
+    Пересылает данные между двумя установленными соединениями до их закрытия.
+
+    После рукопожатия транспорты соединений переключаются на протокол
+    пересылки: данные читаются в переиспользуемый буфер и передаются
+    напрямую в транспорт другой стороны, без промежуточных копий
+    `StreamReader`/`StreamWriter`.
+
+    Parameters
+    ----------
+    client : tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        Потоки клиентского соединения.
+    upstream : tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        Потоки соединения с вышестоящим прокси, например из `open_tunnel`.
+    meter : RelayMeter | None, optional
+        Счетчики трафика.
+    buffer_size : int, optional
+        Размер буфера чтения на каждое направление в байтах. По умолчанию 256 КиБ.
+    """
+    state = _Relay(meter or RelayMeter())
+    (client_reader, client_writer), (upstream_reader, upstream_writer) = client, upstream
+    client_transport, upstream_transport = client_writer.transport, upstream_writer.transport
+    state.transports = [client_transport, upstream_transport]
+
+    # Данные, прочитанные сверх рукопожатия, пересылаются до смены протокола
+    data_up = await _detach(client_reader, client_transport)
+    data_down = await _detach(upstream_reader, upstream_transport)
+    if data_up:
+        upstream_transport.write(data_up)
+        state.meter.bytes_up += len(data_up)
+    if data_down:
+        client_transport.write(data_down)
+        state.meter.bytes_down += len(data_down)
+    client_transport.set_protocol(_RelayProtocol(state, upstream_transport, True, buffer_size))
+    upstream_transport.set_protocol(_RelayProtocol(state, client_transport, False, buffer_size))
+    for reader, transport, peer in ((client_reader, client_transport, upstream_transport),
+                                    (upstream_reader, upstream_transport, client_transport)):
+        if reader.at_eof():
+            state.eof(peer)
+        elif not transport.is_closing() and not transport.is_reading():
+            transport.resume_reading()
+    if client_transport.is_closing() or upstream_transport.is_closing():
+        state.close()
+    await state.done
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, reason: str) -> None:
+    """Отправляет клиенту ответ без тела и закрывает соединение."""
+    writer.write(f'HTTP/1.1 {status} {reason}\r\nContent-Length: 0\r\nConnection: close\r\n\r\n'.encode())
+    try:
+        await writer.drain()
+    except OSError:
+        pass
+
+
+class ProxyGateway:
+    """
+    Локальный HTTP-шлюз, распределяющий соединения по прокси аккаунта.
+
+    Шлюз принимает на одном локальном порту запросы CONNECT (HTTPS и любые
+    TCP-туннели) и обычные HTTP-запросы в абсолютной форме и пересылает
+    каждый через прокси, выбранный из пула. Соединения с вышестоящими
+    прокси для HTTP-запросов переиспользуются (keep-alive).
+
+    Parameters
+    ----------
+    pool : AsyncProxyPool
+        Пул прокси, из которого выбирается вышестоящий прокси.
+    host : str, optional
+        Локальный адрес. По умолчанию '127.0.0.1'.
+    port : int, optional
+        Локальный порт; 0 — выбрать свободный. По умолчанию 8080.
+    connect_timeout : float, optional
+        Таймаут подключения к вышестоящему прокси в секундах. По умолчанию 10.
+    idle_timeout : float, optional
+        Время ожидания следующего запроса клиента и время жизни
+        простаивающего соединения с прокси в секундах. По умолчанию 60.
+    retries : int, optional
+        Число попыток подключения через другие прокси при ошибке. По умолчанию 2.
+    max_idle : int, optional
+        Максимальное число простаивающих соединений на один прокси. По умолчанию 8.
+    buffer_size : int, optional
+        Размер буфера пересылки туннеля на каждое направление в байтах.
+        По умолчанию 256 КиБ.
+    sticky : bool, optional
+        Закреплять прокси за целевым хостом (или значением заголовка
+        `X-Proxy6-Session`) консистентным хешированием, см. `ProxyPool.sticky`.
+        Повторные попытки после ошибки выполняются через другие прокси.
+        По умолчанию False.
+    prober : AsyncProxy6 | ProxyProber | None, optional
+        Средство повторной проверки прокси в карантине автоматических
+        выключателей пула (`ProxyPool.breaker`). По умолчанию — клиент из
+        `from_client` (метод API `check`), иначе `ProxyProber()`.
+    reprobe_interval : float, optional
+        Период повторной проверки прокси в карантине в секундах. По умолчанию 30.
+
+    Examples
+    --------
+    >>> async with AsyncProxy6(api='ваш_api_ключ') as client:
+    ...     async with await ProxyGateway.from_client(client, port=8080) as gateway:
+    ...         await gateway.serve_forever()
+    """
+
+    def __init__(self, pool: AsyncProxyPool, *, host: str = '127.0.0.1', port: int = 8080,
+                 connect_timeout: float = 10.0, idle_timeout: float = 60.0,
+                 retries: int = 2, max_idle: int = 8, buffer_size: int = 256 * 1024,
+                 sticky: bool = False, prober: AsyncProxy6 | ProxyProber | None = None,
+                 reprobe_interval: float = 30.0):
+        self.pool = pool
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.idle_timeout = idle_timeout
+        self.retries = retries
+        self.max_idle = max_idle
+        self.buffer_size = buffer_size
+        self.sticky = sticky
+        self.prober = prober
+        self.reprobe_interval = reprobe_interval
+        self.client: AsyncProxy6 | None = None
+        self.refresh_interval: float | None = None
+        self.descr: str | None = None
+        self.connections = 0
+        self.active = 0
+        self.requests = 0
+        self.tunnels = 0
+        self.errors = 0
+        self.meter = RelayMeter()
+        self._server: asyncio.Server | None = None
+        self._refresher: asyncio.Task | None = None
+        self._reprober: asyncio.Task | None = None
+        self._idle: dict[tuple, list[tuple[asyncio.StreamReader, asyncio.StreamWriter, float]]] = {}
+        self._connections: dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    @classmethod
+    async def from_client(cls, client: AsyncProxy6, *, descr: str | None = None,
+                          strategy: str | RotationStrategy = 'round_robin', min_ttl: float = 3600.0,
+                          replicas: int = 100, breaker: CircuitBreaker | None = None,
+                          refresh_interval: float | None = 300.0, **options) -> 'ProxyGateway':
+        """
+        Создает шлюз по активным прокси аккаунта.
+
+        Parameters
+        ----------
+        client : AsyncProxy6
+            Асинхронный клиент с активной HTTP-сессией.
+        descr : str | None, optional
+            Технический комментарий для фильтрации прокси.
+        strategy : str | RotationStrategy, optional
+            Стратегия выбора прокси, см. `ProxyPool`.
+        min_ttl : float, optional
+            Минимальное оставшееся время жизни прокси в секундах.
+        replicas : int, optional
+            Количество виртуальных узлов на прокси для режима `sticky`.
+        breaker : CircuitBreaker | None, optional
+            Автоматические выключатели прокси пула, см. `ProxyPool`.
+        refresh_interval : float | None, optional
+            Период обновления списка прокси через `get_proxy` в секундах;
+            None — не обновлять. По умолчанию 300.
+        **options
+            Параметры конструктора шлюза.
+
+        Returns
+        -------
+        ProxyGateway
+            Шлюз; для приема соединений вызовите `start`.
+        """
+        pool = await AsyncProxyPool.from_client(client, descr=descr, strategy=strategy,
+                                                min_ttl=min_ttl, replicas=replicas, breaker=breaker)
+        gateway = cls(pool, **options)
+        gateway.client = client
+        gateway.refresh_interval = refresh_interval
+        gateway.descr = descr
+        return gateway
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Счетчики соединений, запросов, туннелей, ошибок, трафика и выключателей прокси."""
+        stats = {
+            'connections': self.connections,
+            'active': self.active,
+            'requests': self.requests,
+            'tunnels': self.tunnels,
+            'errors': self.errors,
+            'idle_upstreams': sum(len(idle) for idle in self._idle.values()),
+            'bytes_up': self.meter.bytes_up,
+            'bytes_down': self.meter.bytes_down,
+            'throughput': self.meter.throughput,
+        }
+        if self.pool.breaker is not None:
+            stats.update({f'breaker_{state}': count for state, count in self.pool.breaker.counts().items()})
+        return stats
+
+    async def start(self) -> None:
+        """Начинает прием соединений."""
+        self._server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        if self.client is not None and self.refresh_interval:
+            self._refresher = asyncio.ensure_future(self._refresh_loop())
+        if self.pool.breaker is not None and self.reprobe_interval:
+            self._reprober = asyncio.ensure_future(self._reprobe_loop())
+
+    async def serve_forever(self) -> None:
+        """Принимает соединения до отмены задачи или вызова `close`."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Останавливает прием соединений и закрывает все соединения шлюза."""
+        for task in (self._refresher, self._reprober):
+            if task is not None:
+                task.cancel()
+        self._refresher = self._reprober = None
+        if self._server is not None:
+            self._server.close()
+        handlers = list(self._connections.values())
+        for writer in list(self._connections):
+            writer.close()
+        for idle in self._idle.values():
+            for _, writer, _ in idle:
+                writer.close()
+        self._idle.clear()
+        await asyncio.gather(*handlers, return_exceptions=True)
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def _refresh_loop(self) -> None:
+        """Периодически обновляет состав пула из `get_proxy`."""
+        while True:
+            await asyncio.sleep(self.refresh_interval)
+            try:
+                await self.pool.refresh(self.client, descr=self.descr)
+            except Exception:
+                self.errors += 1
+
+    async def _reprobe_loop(self) -> None:
+        """Периодически проверяет прокси в карантине выключателей."""
+        prober = self.prober or self.client or ProxyProber()
+        while True:
+            await asyncio.sleep(self.reprobe_interval)
+            try:
+                await self.pool.reprobe(prober)
+            except Exception:
+                self.errors += 1
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Учитывает клиентское соединение и обслуживает его."""
+        self.connections += 1
+        self.active += 1
+        self._connections[writer] = asyncio.current_task()
+        try:
+            await self._handle(reader, writer)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ProbeError, ValueError):
+            self.errors += 1
+        finally:
+            self.active -= 1
+            self._connections.pop(writer, None)
+            writer.close()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Обслуживает одно клиентское соединение HTTP-прокси."""
+        try:
+            while True:
+                try:
+                    message = await asyncio.wait_for(_read_head(reader), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    break
+                if message is None:
+                    break
+                request_line, headers = message
+                parts = request_line.split(' ')
+                if len(parts) != 3:
+                    await _respond(writer, 400, 'Bad Request')
+                    break
+                method, target, version = parts
+                self.requests += 1
+                if method == 'CONNECT':
+                    await self._tunnel(target, headers, reader, writer)
+                    break
+                if not await self._forward(method, target, version, headers, reader, writer):
+                    break
+        except asyncio.LimitOverrunError:
+            await _respond(writer, 431, 'Request Header Fields Too Large')
+
+    def _checkout(self, affinity: str | None = None) -> Proxy | None:
+        """Выбирает прокси из пула, закрепленный за `affinity` при `sticky`; None, если пул пуст."""
+        try:
+            if self.sticky and affinity is not None:
+                return self.pool.sticky(affinity)
+            return self.pool.checkout()
+        except LookupError:
+            return None
+
+    async def _open_tunnel(self, host: str, port: int,
+                           affinity: str | None = None) -> tuple[asyncio.StreamReader, asyncio.StreamWriter] | None:
+        """Открывает туннель к `host:port` через прокси из пула с повторами; None при неудаче."""
+        for attempt in range(self.retries + 1):
+            proxy = self._checkout(affinity if attempt == 0 else None)
+            if proxy is None:
+                return None
+            started = time.monotonic()
+            try:
+                upstream = await open_tunnel(_upstream(proxy), host, port, timeout=self.connect_timeout)
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ProbeError):
+                self.errors += 1
+                self.pool.report(proxy, ok=False)
+                continue
+            self.pool.report(proxy, time.monotonic() - started)
+            return upstream
+        return None
+
+    async def _relay(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                     upstream: tuple[asyncio.StreamReader, asyncio.StreamWriter]) -> None:
+        """Пересылает данные туннеля до закрытия одной из сторон."""
+        self.tunnels += 1
+        try:
+            await relay((reader, writer), upstream, meter=self.meter, buffer_size=self.buffer_size)
+        finally:
+            upstream[1].close()
+
+    async def _tunnel(self, target: str, headers: Headers, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        """Устанавливает туннель CONNECT через выбранный прокси."""
+        host, port = _split_host_port(target, 443)
+        upstream = await self._open_tunnel(host, port, _header(headers, SESSION_HEADER.lower()) or host)
+        if upstream is None:
+            await _respond(writer, 502, 'Bad Gateway')
+            return
+        writer.write(b'HTTP/1.1 200 Connection Established\r\n\r\n')
+        await writer.drain()
+        await self._relay(reader, writer, upstream)
+
+    async def _open_upstream(self, proxy: Proxy, host: str,
+                             port: int) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Открывает соединение для HTTP-запросов к `host:port` через прокси."""
+        if proxy.type == 'socks':
+            return await open_tunnel(_upstream(proxy), host, port, timeout=self.connect_timeout)
+        return await asyncio.wait_for(asyncio.open_connection(proxy.host, proxy.port), self.connect_timeout)
+
+    def _take_idle(self, key: tuple) -> tuple[asyncio.StreamReader, asyncio.StreamWriter] | None:
+        """Возвращает живое простаивающее соединение с прокси, если оно есть."""
+        idle = self._idle.get(key)
+        now = time.monotonic()
+        while idle:
+            reader, writer, since = idle.pop()
+            if not writer.is_closing() and not reader.at_eof() and now - since < self.idle_timeout:
+                return reader, writer
+            writer.close()
+        return None
+
+    def _put_idle(self, key: tuple, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Возвращает соединение с прокси в список простаивающих."""
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.max_idle:
+            idle.append((reader, writer, time.monotonic()))
+        else:
+            writer.close()
+
+    async def _forward(self, method: str, target: str, version: str, headers: Headers,
+                       reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """
+        Пересылает HTTP-запрос через выбранный прокси.
+
+        Returns
+        -------
+        bool
+            True, если клиентское соединение можно использовать для следующего запроса.
+        """
+        url = urlsplit(target)
+        if url.scheme != 'http' or not url.netloc:
+            await _respond(writer, 400, 'Bad Request')
+            return False
+        host, port = _split_host_port(url.netloc, 80)
+        client_keep_alive = _keep_alive(version, headers)
+        has_body = _header(headers, 'content-length') not in (None, '0') or \
+            _header(headers, 'transfer-encoding') is not None
+        affinity = _header(headers, SESSION_HEADER.lower()) or host
+        request_headers = [(name, value) for name, value in _strip_hop_by_hop(headers)
+                           if name.lower() != SESSION_HEADER.lower()]
+
+        for attempt in range(self.retries + 1):
+            proxy = self._checkout(affinity if attempt == 0 else None)
+            if proxy is None:
+                break
+            key = (proxy.id,) if proxy.type != 'socks' else (proxy.id, host, port)
+            upstream = self._take_idle(key)
+            reused = upstream is not None
+            started = time.monotonic()
+            if upstream is None:
+                try:
+                    upstream = await self._open_upstream(proxy, host, port)
+                except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ProbeError):
+                    self.errors += 1
+                    self.pool.report(proxy, ok=False)
+                    continue
+            upstream_reader, upstream_writer = upstream
+
+            outgoing = list(request_headers)
+            if proxy.type == 'socks':
+                start_line = f'{method} {url.path or "/"}{"?" + url.query if url.query else ""} HTTP/1.1'
+            else:
+                start_line = f'{method} {target} HTTP/1.1'
+                if proxy.user:
+                    credentials = base64.b64encode(f'{proxy.user}:{proxy.password}'.encode()).decode()
+                    outgoing.append(('Proxy-Authorization', f'Basic {credentials}'))
+            outgoing.append(('Connection', 'keep-alive'))
+
+            try:
+                upstream_writer.write(_encode_head(start_line, outgoing))
+                await _relay_body(reader, upstream_writer, headers)
+                while True:
+                    response = await asyncio.wait_for(_read_head(upstream_reader), self.connect_timeout)
+                    if response is None:
+                        raise asyncio.IncompleteReadError(b'', None)
+                    status = _status(response[0])
+                    if not 100 <= status < 200 or status == 101:
+                        break
+                    # Промежуточный ответ (100 Continue, 103 Early Hints): клиентам HTTP/1.1
+                    # передаем его как есть и ждем окончательного
+                    if version == 'HTTP/1.1':
+                        writer.write(_encode_head(response[0], _strip_hop_by_hop(response[1])))
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError):
+                upstream_writer.close()
+                # Простаивающее соединение могло быть закрыто прокси: повторяем запрос без тела
+                if reused and not has_body:
+                    self.pool.release(proxy)
+                    continue
+                self.errors += 1
+                self.pool.report(proxy, ok=False)
+                await _respond(writer, 502, 'Bad Gateway')
+                return False
+            self.pool.report(proxy, time.monotonic() - started)
+
+            status_line, response_headers = response
+            if status == 101:
+                # Соединение сменило протокол: дальше только пересылка байтов, в пул оно не вернется
+                writer.write(_encode_head(status_line, response_headers))
+                await writer.drain()
+                await self._relay(reader, writer, upstream)
+                return False
+            upstream_keep_alive = _keep_alive(status_line.split(' ', 1)[0], response_headers)
+
+            client_headers = _strip_hop_by_hop(response_headers)
+            no_body = method == 'HEAD' or status in (204, 304)
+            framed = no_body or _header(response_headers, 'content-length') is not None or \
+                'chunked' in (_header(response_headers, 'transfer-encoding') or '').lower()
+            keep_alive = client_keep_alive and framed
+            client_headers.append(('Connection', 'keep-alive' if keep_alive else 'close'))
+            writer.write(_encode_head(status_line, client_headers))
+            try:
+                if not no_body:
+                    framed = await _relay_body(upstream_reader, writer, response_headers, until_eof=True)
+                else:
+                    await writer.drain()
+            except BaseException:
+                upstream_writer.close()
+                raise
+
+            if framed and upstream_keep_alive:
+                self._put_idle(key, upstream_reader, upstream_writer)
+            else:
+                upstream_writer.close()
+            return keep_alive
+
+        await _respond(writer, 502, 'Bad Gateway')
+        return False
+
+
+class Socks5Gateway(ProxyGateway):
+    """
+    Локальный SOCKS5-сервер (RFC 1928), распределяющий соединения по прокси аккаунта.
+
+    Поддерживается команда CONNECT с адресами IPv4, IPv6 и доменными
+    именами; каждое соединение пересылается через прокси из пула —
+    SOCKS5 или HTTPS, в зависимости от его типа.
+
+    Parameters
+    ----------
+    pool : AsyncProxyPool
+        Пул прокси, из которого выбирается вышестоящий прокси.
+    credentials : tuple[str, str] | None, optional
+        Логин и пароль для подключения клиентов (RFC 1929); None — без авторизации.
+    **options
+        Остальные параметры `ProxyGateway`; порт по умолчанию 1080.
+    """
+
+    def __init__(self, pool: AsyncProxyPool, *, port: int = 1080,
+                 credentials: tuple[str, str] | None = None, **options):
+        super().__init__(pool, port=port, **options)
+        self.credentials = credentials
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Обслуживает одно клиентское соединение SOCKS5."""
+        version, count = await asyncio.wait_for(reader.readexactly(2), self.idle_timeout)
+        methods = await self._read_exactly(reader, count)
+        if version != 5:
+            return
+        method = 0x02 if self.credentials is not None else 0x00
+        if method not in methods:
+            writer.write(b'\x05\xff')
+            await writer.drain()
+            return
+        writer.write(bytes([5, method]))
+        await writer.drain()
+        if method == 0x02 and not await self._authenticate(reader, writer):
+            return
+
+        _, command, _, address_type = await self._read_exactly(reader, 4)
+        if address_type == 0x01:
+            host = str(ipaddress.IPv4Address(await self._read_exactly(reader, 4)))
+        elif address_type == 0x04:
+            host = str(ipaddress.IPv6Address(await self._read_exactly(reader, 16)))
+        elif address_type == 0x03:
+            length = (await self._read_exactly(reader, 1))[0]
+            host = (await self._read_exactly(reader, length)).decode('idna')
+        else:
+            await self._reply(writer, 0x08)
+            return
+        port, = struct.unpack('!H', await self._read_exactly(reader, 2))
+        self.requests += 1
+        if command != 0x01:
+            await self._reply(writer, 0x07)
+            return
+
+        upstream = await self._open_tunnel(host, port, host)
+        if upstream is None:
+            await self._reply(writer, 0x01)
+            return
+        await self._reply(writer, 0x00)
+        await self._relay(reader, writer, upstream)
+
+    async def _authenticate(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """Проверяет логин и пароль клиента (RFC 1929)."""
+        _, length = await self._read_exactly(reader, 2)
+        username = (await self._read_exactly(reader, length)).decode()
+        length = (await self._read_exactly(reader, 1))[0]
+        password = (await self._read_exactly(reader, length)).decode()
+        ok = (username, password) == self.credentials
+        writer.write(b'\x01\x00' if ok else b'\x01\x01')
+        await writer.drain()
+        return ok
+
+    async def _read_exactly(self, reader: asyncio.StreamReader, size: int) -> bytes:
+        """Читает часть рукопожатия, ожидая клиента не дольше `connect_timeout`."""
+        return await asyncio.wait_for(reader.readexactly(size), self.connect_timeout)
+
+    async def _reply(self, writer: asyncio.StreamWriter, code: int) -> None:
+        """Отправляет ответ на запрос CONNECT с нулевым адресом привязки."""
+        writer.write(bytes([5, code, 0, 1]) + bytes(4) + bytes(2))
+        await writer.drain()
@@ -0,0 +1,300 @@
+"""
+Proxy6 API Client — массовая проверка прокси через метод API `check`
+
+Copyright (c) 2026 Alexsey Novikov
+
+Распространяется под лицензией MIT.
+Подробнее см. в файле LICENSE или на https://opensource.org/licenses/MIT.
+"""
+
+
+import asyncio
+import itertools
+import math
+import time
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from proxy6_client import AsyncProxy6, Proxy6, Proxy6Error
+
+
+class CheckResult:
+    """
+    Результат проверки одного прокси.
+
+    Parameters
+    ----------
+    target : int | str
+        ID прокси или строка формата ip:port:user:pass.
+    valid : bool
+        True, если API подтвердил работоспособность прокси.
+    latency : float
+        Длительность вызова `check` в секундах.
+    error : Proxy6Error | None, optional
+        Ошибка вызова API, если проверка не состоялась.
+    """
+
+    __slots__ = ('target', 'valid', 'latency', 'error')
+
+    def __init__(self, target: int | str, valid: bool, latency: float,
+                 error: Proxy6Error | None = None) -> None:
+        self.target = target
+        self.valid = valid
+        self.latency = latency
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f'CheckResult(target={self.target!r}, valid={self.valid}, latency={self.latency:.3f})'
+
+
+class CheckStats:
+    """
+    Сводная статистика массовой проверки: пропускная способность
+    и перцентили задержки вызовов `check`.
+
+    Attributes
+    ----------
+    valid : int
+        Количество работоспособных прокси.
+    invalid : int
+        Количество неработоспособных прокси.
+    errors : int
+        Количество проверок, завершившихся ошибкой API.
+    latencies : list[float]
+        Длительности всех вызовов `check` в секундах.
+    """
+
+    def __init__(self) -> None:
+        self.valid = 0
+        self.invalid = 0
+        self.errors = 0
+        self.latencies: list[float] = []
+        self.started = time.monotonic()
+        self.finished: float | None = None
+
+    def add(self, result: CheckResult) -> None:
+        """
+        Учитывает результат проверки.
+
+        Parameters
+        ----------
+        result : CheckResult
+            Результат проверки одного прокси.
+        """
+        self.latencies.append(result.latency)
+        if result.error is not None:
+            self.errors += 1
+        elif result.valid:
+            self.valid += 1
+        else:
+            self.invalid += 1
+
+    @property
+    def total(self) -> int:
+        """Общее количество выполненных проверок."""
+        return len(self.latencies)
+
+    @property
+    def elapsed(self) -> float:
+        """Длительность проверки в секундах."""
+        return (self.finished or time.monotonic()) - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Количество проверок в секунду."""
+        elapsed = self.elapsed
+        return self.total / elapsed if elapsed > 0 else 0.0
+
+    def percentile(self, q: float) -> float:
+        """
+        Возвращает перцентиль задержки методом ближайшего ранга.
+
+        Parameters
+        ----------
+        q : float
+            Перцентиль от 0 до 100.
+
+        Returns
+        -------
+        float
+            Задержка в секундах или 0.0, если проверок не было.
+        """
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def summary(self) -> dict[str, float]:
+        """
+        Возвращает сводку статистики.
+
+        Returns
+        -------
+        dict[str, float]
+            Счетчики результатов, длительность, пропускная способность
+            и перцентили задержки p50, p90, p99.
+        """
+        return {
+            'total': self.total,
+            'valid': self.valid,
+            'invalid': self.invalid,
+            'errors': self.errors,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+        }
+
+
+def _check_params(target: int | str) -> dict[str, int | str]:
+    """
+    Преобразует цель проверки в параметры метода `check`.
+
+    Строки вида ip:port:user:pass передаются как `proxy`,
+    числа и строки из цифр — как `ids`.
+    """
+    if isinstance(target, str) and not target.isdigit():
+        return {'proxy': target}
+    return {'ids': int(target)}
+
+
+class ProxyChecker:
+    """
+    Массовая проверка прокси синхронным клиентом в пуле потоков.
+
+    Parameters
+    ----------
+    client : Proxy6
+        Клиент, через который выполняются вызовы `check`. Для полной
+        загрузки потоков его `pool_maxsize` должен быть не меньше `workers`.
+    workers : int, optional
+        Количество потоков. По умолчанию 16.
+
+    Attributes
+    ----------
+    stats : CheckStats
+        Статистика последнего запуска `run`.
+    """
+
+    def __init__(self, client: Proxy6, *, workers: int = 16) -> None:
+        self.client = client
+        self.workers = workers
+        self.stats = CheckStats()
+
+    def _check(self, target: int | str) -> CheckResult:
+        started = time.monotonic()
+        try:
+            valid = self.client.check(**_check_params(target))
+        except Proxy6Error as e:
+            return CheckResult(target, False, time.monotonic() - started, e)
+        return CheckResult(target, valid, time.monotonic() - started)
+
+    def run(self, targets: Iterable[int | str]) -> Iterator[CheckResult]:
+        """
+        Проверяет прокси и выдает результаты по мере их готовности.
+
+        Одновременно в работе находится не больше `workers` проверок,
+        поэтому входной итератор потребляется постепенно.
+
+        Parameters
+        ----------
+        targets : Iterable[int | str]
+            ID прокси или строки формата ip:port:user:pass.
+
+        Yields
+        ------
+        CheckResult
+            Результат проверки в порядке завершения.
+        """
+        self.stats = CheckStats()
+        targets = iter(targets)
+        pending: set[Future] = set()
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            try:
+                for target in targets:
+                    pending.add(executor.submit(self._check, target))
+                    if len(pending) >= self.workers:
+                        break
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for target in itertools.islice(targets, len(done)):
+                        pending.add(executor.submit(self._check, target))
+                    for future in done:
+                        result = future.result()
+                        self.stats.add(result)
+                        yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+                self.stats.finished = time.monotonic()
+
+
+class AsyncProxyChecker:
+    """
+    Массовая конкурентная проверка прокси асинхронным клиентом.
+
+    Parameters
+    ----------
+    client : AsyncProxy6
+        Клиент с активной HTTP-сессией, через который выполняются вызовы `check`.
+    concurrency : int, optional
+        Максимальное число одновременных проверок. По умолчанию 50.
+
+    Attributes
+    ----------
+    stats : CheckStats
+        Статистика последнего запуска `run`.
+    """
+
+    def __init__(self, client: AsyncProxy6, *, concurrency: int = 50):
+        self.client = client
+        self.concurrency = concurrency
+        self.stats = CheckStats()
+
+    async def _check(self, target: int | str) -> CheckResult:
+        started = time.monotonic()
+        try:
+            status = await self.client.check(**_check_params(target))
+        except Proxy6Error as e:
+            return CheckResult(target, False, time.monotonic() - started, e)
+        return CheckResult(target, status is True or status == 'true', time.monotonic() - started)
+
+    async def run(self, targets: Iterable[int | str]) -> AsyncIterator[CheckResult]:
+        """
+        Проверяет прокси и выдает результаты по мере их готовности.
+
+        Одновременно в работе находится не больше `concurrency` проверок,
+        поэтому входной итератор потребляется постепенно.
+
+        Parameters
+        ----------
+        targets : Iterable[int | str]
+            ID прокси или строки формата ip:port:user:pass.
+
+        Yields
+        ------
+        CheckResult
+            Результат проверки в порядке завершения.
+        """
+        self.stats = CheckStats()
+        targets = iter(targets)
+        pending: set[asyncio.Task] = set()
+        try:
+            for target in targets:
+                pending.add(asyncio.ensure_future(self._check(target)))
+                if len(pending) >= self.concurrency:
+                    break
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for target in itertools.islice(targets, len(done)):
+                    pending.add(asyncio.ensure_future(self._check(target)))
+                for task in done:
+                    result = task.result()
+                    self.stats.add(result)
+                    yield result
+        finally:
+            for task in pending:
+                task.cancel()
+            self.stats.finished = time.monotonic()
@@ -0,0 +1,555 @@
+"""
+Proxy6 API Client — локальное зеркало прокси аккаунта и пакетное продление
+
+Copyright (c) 2026 Alexsey Novikov
+
+Распространяется под лицензией MIT.
+Подробнее см. в файле LICENSE или на https://opensource.org/licenses/MIT.
+"""
+
+
+import asyncio
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from datetime import datetime
+
+from proxy6_client import MAX_URL_LENGTH, AsyncProxy6, Proxy, Proxy6, Proxy6Error, chunk_ids
+from proxy6_table import unixtime
+
+
+class SyncResult:
+    """
+    Итог синхронизации локального зеркала с аккаунтом.
+
+    Parameters
+    ----------
+    added : int
+        Количество новых прокси.
+    updated : int
+        Количество прокси с измененными данными.
+    removed : int
+        Количество прокси, исчезнувших из аккаунта.
+    total : int
+        Количество прокси в зеркале после синхронизации.
+    """
+
+    __slots__ = ('added', 'updated', 'removed', 'total')
+
+    def __init__(self, added: int, updated: int, removed: int, total: int) -> None:
+        self.added = added
+        self.updated = updated
+        self.removed = removed
+        self.total = total
+
+    @property
+    def changed(self) -> bool:
+        """Были ли изменения."""
+        return bool(self.added or self.updated or self.removed)
+
+    def __repr__(self) -> str:
+        return (f'SyncResult(added={self.added}, updated={self.updated}, '
+                f'removed={self.removed}, total={self.total})')
+
+
+class InventoryStore:
+    """
+    Потокобезопасное локальное зеркало прокси аккаунта в SQLite.
+
+    Синхронизация постранично обходит `getproxy`, сравнивает полученные
+    записи с сохраненными и записывает только новые, измененные и удаленные
+    прокси. Поиск по ID, комментарию, стране и сроку окончания выполняется
+    локально по индексам, без обращения к API.
+
+    Parameters
+    ----------
+    path : str, optional
+        Путь к файлу базы данных. По умолчанию ':memory:' — зеркало в памяти.
+    """
+
+    COLUMNS: tuple[str, ...] = (
+        'id', 'version', 'ip', 'host', 'port', 'user', 'password', 'type',
+        'country', 'unixtime', 'unixtime_end', 'descr', 'active',
+    )
+
+    def __init__(self, path: str = ':memory:') -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript('''
+                CREATE TABLE IF NOT EXISTS proxies (
+                    id INTEGER PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    ip TEXT NOT NULL,
+                    host TEXT NOT NULL,
+                    port INTEGER NOT NULL,
+                    user TEXT NOT NULL,
+                    password TEXT NOT NULL,
+                    type TEXT NOT NULL,
+                    country TEXT NOT NULL,
+                    unixtime INTEGER NOT NULL,
+                    unixtime_end INTEGER NOT NULL,
+                    descr TEXT NOT NULL,
+                    active INTEGER NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS proxies_descr ON proxies (descr);
+                CREATE INDEX IF NOT EXISTS proxies_country ON proxies (country, unixtime_end);
+                CREATE INDEX IF NOT EXISTS proxies_unixtime_end ON proxies (unixtime_end);
+                CREATE TABLE IF NOT EXISTS meta (
+                    key TEXT PRIMARY KEY,
+                    value REAL NOT NULL
+                );
+            ''')
+
+    def _row(self, proxy: Proxy) -> tuple:
+        return tuple(int(value) if isinstance(value, bool) else value
+                     for value in (getattr(proxy, name) for name in self.COLUMNS))
+
+    def _proxy(self, row: tuple) -> Proxy:
+        fields = dict(zip(self.COLUMNS, row))
+        fields['active'] = bool(fields['active'])
+        return Proxy(**fields)
+
+    @property
+    def synced_at(self) -> float | None:
+        """Время последней синхронизации (unixtime) или None."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = 'synced_at'"
+            ).fetchone()
+        return row[0] if row else None
+
+    def is_fresh(self, max_age: float) -> bool:
+        """
+        Проверяет, выполнялась ли синхронизация не позже `max_age` секунд назад.
+
+        Parameters
+        ----------
+        max_age : float
+            Допустимый возраст зеркала в секундах.
+
+        Returns
+        -------
+        bool
+            True, если зеркало можно использовать без синхронизации.
+        """
+        synced_at = self.synced_at
+        return synced_at is not None and time.time() - synced_at <= max_age
+
+    def apply(self, proxies: Iterable[dict | Proxy]) -> SyncResult:
+        """
+        Приводит зеркало к полному списку прокси аккаунта.
+
+        Записываются только новые и изменившиеся прокси; прокси,
+        отсутствующие в `proxies`, удаляются.
+
+        Parameters
+        ----------
+        proxies : Iterable[dict | Proxy]
+            Полный список прокси аккаунта (state='all').
+
+        Returns
+        -------
+        SyncResult
+            Итог синхронизации.
+        """
+        rows = [self._row(proxy if isinstance(proxy, Proxy) else Proxy.from_api(proxy))
+                for proxy in proxies]
+        placeholders = ', '.join('?' * len(self.COLUMNS))
+        with self._lock, self._connection:
+            stored = {row[0]: row for row in self._connection.execute(
+                f'SELECT {", ".join(self.COLUMNS)} FROM proxies'
+            )}
+            changed = [row for row in rows if stored.get(row[0]) != row]
+            added = sum(1 for row in changed if row[0] not in stored)
+            removed = stored.keys() - {row[0] for row in rows}
+
+            self._connection.executemany(
+                f'INSERT OR REPLACE INTO proxies ({", ".join(self.COLUMNS)}) VALUES ({placeholders})',
+                changed,
+            )
+            self._connection.executemany(
+                'DELETE FROM proxies WHERE id = ?', ((proxy_id,) for proxy_id in removed)
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at', ?)", (time.time(),)
+            )
+            total = self._connection.execute('SELECT COUNT(*) FROM proxies').fetchone()[0]
+        return SyncResult(added, len(changed) - added, len(removed), total)
+
+    def sync(self, client: Proxy6, *, limit: int = 1000, max_age: float | None = None) -> SyncResult | None:
+        """
+        Синхронизирует зеркало с аккаунтом через `Proxy6.iter_proxies`.
+
+        Parameters
+        ----------
+        client : Proxy6
+            Синхронный клиент.
+        limit : int, optional
+            Количество прокси на страницу. По умолчанию 1000.
+        max_age : float | None, optional
+            Не синхронизировать, если зеркало обновлялось не позже
+            `max_age` секунд назад.
+
+        Returns
+        -------
+        SyncResult | None
+            Итог синхронизации или None, если она была пропущена.
+        """
+        if max_age is not None and self.is_fresh(max_age):
+            return None
+        return self.apply(client.iter_proxies(state='all', limit=limit, typed=True))
+
+    async def async_sync(self, client: AsyncProxy6, *, limit: int = 1000, prefetch: int = 0,
+                         max_age: float | None = None) -> SyncResult | None:
+        """
+        Синхронизирует зеркало с аккаунтом через `AsyncProxy6.aiter_proxies`.
+
+        Parameters
+        ----------
+        client : AsyncProxy6
+            Асинхронный клиент с активной HTTP-сессией.
+        limit : int, optional
+            Количество прокси на страницу (по умолчанию 1000).
+        prefetch : int, optional
+            Число страниц, загружаемых параллельно (по умолчанию 0).
+        max_age : float | None, optional
+            Не синхронизировать, если зеркало обновлялось не позже
+            `max_age` секунд назад.
+
+        Returns
+        -------
+        SyncResult | None
+            Итог синхронизации или None, если она была пропущена.
+        """
+        if max_age is not None and self.is_fresh(max_age):
+            return None
+        proxies = [proxy async for proxy in client.aiter_proxies(
+            state='all', limit=limit, prefetch=prefetch, typed=True
+        )]
+        return self.apply(proxies)
+
+    def get(self, proxy_id: int) -> Proxy | None:
+        """
+        Возвращает прокси по ID.
+
+        Parameters
+        ----------
+        proxy_id : int
+            Внутренний номер прокси.
+
+        Returns
+        -------
+        Proxy | None
+            Запись прокси или None, если ее нет в зеркале.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                f'SELECT {", ".join(self.COLUMNS)} FROM proxies WHERE id = ?', (int(proxy_id),)
+            ).fetchone()
+        return self._proxy(row) if row else None
+
+    def find(
+        self,
+        *,
+        descr: str | None = None,
+        country: str | None = None,
+        type: str | None = None,
+        active: bool | None = None,
+        expires_before: int | datetime | None = None,
+        expires_after: int | datetime | None = None,
+    ) -> list[Proxy]:
+        """
+        Ищет прокси в зеркале; условия объединяются через И.
+
+        Parameters
+        ----------
+        descr : str | None, optional
+            Технический комментарий.
+        country : str | None, optional
+            Код страны (ISO2).
+        type : str | None, optional
+            Тип прокси: 'http' или 'socks'.
+        active : bool | None, optional
+            Признак активности.
+        expires_before : int | datetime | None, optional
+            Окончание строго раньше момента (unixtime или datetime).
+        expires_after : int | datetime | None, optional
+            Окончание не раньше момента (unixtime или datetime).
+
+        Returns
+        -------
+        list[Proxy]
+            Найденные прокси в порядке окончания срока.
+        """
+        conditions = []
+        values: list[object] = []
+        for column, value in (('descr', descr), ('country', country), ('type', type)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                values.append(value)
+        if active is not None:
+            conditions.append('active = ?')
+            values.append(int(active))
+        if expires_before is not None:
+            conditions.append('unixtime_end < ?')
+            values.append(unixtime(expires_before))
+        if expires_after is not None:
+            conditions.append('unixtime_end >= ?')
+            values.append(unixtime(expires_after))
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        with self._lock:
+            rows = self._connection.execute(
+                f'SELECT {", ".join(self.COLUMNS)} FROM proxies {where} ORDER BY unixtime_end, id',
+                values,
+            ).fetchall()
+        return [self._proxy(row) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connection.execute('SELECT COUNT(*) FROM proxies').fetchone()[0]
+
+    def close(self) -> None:
+        """
+        Закрывает соединение с базой данных.
+        """
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> 'InventoryStore':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+
+class RenewalBatch:
+    """
+    Группа прокси, продлеваемая одним вызовом `prolong`.
+
+    Parameters
+    ----------
+    period : int
+        Период продления в днях.
+    version : int
+        Версия прокси; определяет цену продления.
+    ids : tuple[int, ...]
+        ID прокси.
+    expires_at : int
+        Самый ранний срок окончания среди прокси группы (unixtime).
+    """
+
+    __slots__ = ('period', 'version', 'ids', 'expires_at', 'price')
+
+    def __init__(self, period: int, version: int, ids: tuple[int, ...], expires_at: int) -> None:
+        self.period = period
+        self.version = version
+        self.ids = ids
+        self.expires_at = expires_at
+        self.price: float | None = None
+
+    def __repr__(self) -> str:
+        return f'RenewalBatch(period={self.period}, version={self.version}, ids={len(self.ids)})'
+
+
+class RenewalReport:
+    """
+    Итог работы `RenewalScheduler.run`.
+
+    Attributes
+    ----------
+    renewed : list[RenewalBatch]
+        Успешно продленные группы.
+    failed : list[tuple[RenewalBatch, Proxy6Error]]
+        Группы, продление которых завершилось ошибкой API.
+    skipped : list[RenewalBatch]
+        Группы и остатки разделенных групп, не уместившиеся в бюджет.
+    cost : float
+        Оценка стоимости продленных групп по `get_price`.
+    """
+
+    def __init__(self) -> None:
+        self.renewed: list[RenewalBatch] = []
+        self.failed: list[tuple[RenewalBatch, Proxy6Error]] = []
+        self.skipped: list[RenewalBatch] = []
+        self.cost = 0.0
+
+    @property
+    def renewed_ids(self) -> list[int]:
+        """ID всех продленных прокси."""
+        return [proxy_id for batch in self.renewed for proxy_id in batch.ids]
+
+    def __repr__(self) -> str:
+        return (f'RenewalReport(renewed={len(self.renewed_ids)}, failed={len(self.failed)}, '
+                f'skipped={len(self.skipped)}, cost={self.cost})')
+
+
+class RenewalScheduler:
+    """
+    Пакетное продление заканчивающихся прокси.
+
+    Прокси группируются по периоду продления и версии в максимальные
+    пакеты, укладывающиеся в ограничение длины URL. Цена каждого пакета
+    запрашивается через `get_price`, пакеты принимаются в порядке
+    срочности, пока хватает бюджета, после чего `prolong` вызывается
+    конкурентно. Пакет, не умещающийся в остаток бюджета целиком,
+    делится: самые срочные прокси, на которые хватает денег (их число
+    подбирается двоичным поиском по `get_price`), продлеваются, остальные
+    пропускаются.
+
+    Parameters
+    ----------
+    client : AsyncProxy6
+        Асинхронный клиент с активной HTTP-сессией.
+    period : int | Callable[[Proxy], int | None], optional
+        Период продления в днях либо функция, возвращающая период для
+        прокси или None, если прокси продлевать не нужно. По умолчанию 30.
+    budget : float | None, optional
+        Максимальная сумма продления в рублях. По умолчанию — текущий баланс
+        аккаунта из `info`.
+    concurrency : int, optional
+        Максимальное число одновременных запросов к API. По умолчанию 4.
+    max_url_length : int, optional
+        Ограничение длины URL запроса `prolong`. По умолчанию `MAX_URL_LENGTH`.
+
+    Notes
+    -----
+    В API нет метода расчета стоимости продления, а `prolong` клиента
+    не возвращает списанную сумму, поэтому бюджет и `RenewalReport.cost`
+    оцениваются по цене покупки того же количества (`get_price`).
+    Фактическое списание может отличаться.
+    """
+
+    def __init__(self, client: AsyncProxy6, *, period: int | Callable[[Proxy], int | None] = 30,
+                 budget: float | None = None, concurrency: int = 4,
+                 max_url_length: int = MAX_URL_LENGTH):
+        self.client = client
+        self.period = period
+        self.budget = budget
+        self.concurrency = concurrency
+        self.max_url_length = max_url_length
+
+    def plan(self, proxies: Iterable[dict | Proxy]) -> list[RenewalBatch]:
+        """
+        Разбивает прокси на пакеты продления без обращения к API.
+
+        Parameters
+        ----------
+        proxies : Iterable[dict | Proxy]
+            Прокси-кандидаты на продление.
+
+        Returns
+        -------
+        list[RenewalBatch]
+            Пакеты в порядке срочности (по самому раннему сроку окончания).
+        """
+        groups: dict[tuple[int, int], list[Proxy]] = {}
+        for record in proxies:
+            proxy = record if isinstance(record, Proxy) else Proxy.from_api(record)
+            period = self.period(proxy) if callable(self.period) else self.period
+            if period:
+                groups.setdefault((period, proxy.version), []).append(proxy)
+
+        batches = []
+        for (period, version), group in groups.items():
+            group.sort(key=lambda proxy: (proxy.unixtime_end, proxy.id))
+            expires = {proxy.id: proxy.unixtime_end for proxy in group}
+            overhead = len(f'{self.client.url}prolong?period={period}&ids=')
+            for ids in chunk_ids([proxy.id for proxy in group], max_length=self.max_url_length - overhead):
+                batches.append(RenewalBatch(period, version, ids, expires[ids[0]]))
+        batches.sort(key=lambda batch: batch.expires_at)
+        return batches
+
+    async def run(self, proxies: Iterable[dict | Proxy] | None = None) -> RenewalReport:
+        """
+        Продлевает прокси в пределах бюджета.
+
+        Parameters
+        ----------
+        proxies : Iterable[dict | Proxy] | None, optional
+            Прокси-кандидаты. По умолчанию — все прокси аккаунта
+            в состоянии 'expiring'.
+
+        Returns
+        -------
+        RenewalReport
+            Продленные, неудавшиеся и пропущенные из-за бюджета пакеты.
+            Частично оплаченный пакет попадает в отчет двумя частями.
+        """
+        if proxies is None:
+            proxies = [proxy async for proxy in self.client.aiter_proxies(state='expiring', typed=True)]
+        batches = self.plan(proxies)
+        report = RenewalReport()
+        if not batches:
+            return report
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        quotes: dict[tuple[int, int, int], asyncio.Task] = {}
+
+        async def fetch(count: int, period: int, version: int) -> float:
+            async with semaphore:
+                return float(await self.client.get_price(count=count, period=period, version=version))
+
+        async def price(count: int, period: int, version: int) -> float:
+            # Одновременные запросы одной цены ожидают одну задачу
+            key = (count, period, version)
+            if key not in quotes:
+                quotes[key] = asyncio.ensure_future(fetch(*key))
+            return await quotes[key]
+
+        async def quote(batch: RenewalBatch) -> None:
+            batch.price = await price(len(batch.ids), batch.period, batch.version)
+
+        async def affordable(batch: RenewalBatch, budget: float) -> int:
+            # Наибольшее число первых (самых срочных) ID пакета, укладывающееся в бюджет
+            low, high = 0, len(batch.ids) - 1
+            while low < high:
+                middle = (low + high + 1) // 2
+                if await price(middle, batch.period, batch.version) <= budget:
+                    low = middle
+                else:
+                    high = middle - 1
+            return low
+
+        async def prolong(batch: RenewalBatch) -> None:
+            async with semaphore:
+                try:
+                    await self.client.prolong(period=batch.period, ids=batch.ids)
+                except Proxy6Error as e:
+                    report.failed.append((batch, e))
+                    return
+            report.renewed.append(batch)
+            report.cost += batch.price
+
+        try:
+            await asyncio.gather(*(quote(batch) for batch in batches))
+            remaining = self.budget
+            if remaining is None:
+                remaining = float((await self.client.info())['balance'])
+
+            accepted = []
+            for batch in batches:
+                if batch.price <= remaining:
+                    remaining -= batch.price
+                    accepted.append(batch)
+                    continue
+                size = await affordable(batch, remaining)
+                if not size:
+                    report.skipped.append(batch)
+                    continue
+                head = RenewalBatch(batch.period, batch.version, batch.ids[:size], batch.expires_at)
+                tail = RenewalBatch(batch.period, batch.version, batch.ids[size:], batch.expires_at)
+                head.price = await price(size, batch.period, batch.version)
+                tail.price = batch.price - head.price
+                remaining -= head.price
+                accepted.append(head)
+                report.skipped.append(tail)
+        finally:
+            for task in quotes.values():
+                task.cancel()
+
+        await asyncio.gather(*(prolong(batch) for batch in accepted))
+        return report
+
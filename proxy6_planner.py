@@ -0,0 +1,500 @@
+"""
+Proxy6 API Client — планирование покупки прокси по нескольким странам
+
+Copyright (c) 2026 Alexsey Novikov
+
+Распространяется под лицензией MIT.
+Подробнее см. в файле LICENSE или на https://opensource.org/licenses/MIT.
+"""
+
+
+import asyncio
+import bisect
+import time
+from collections.abc import Iterable, Mapping, Sequence
+
+from proxy6_client import AsyncProxy6, Proxy6Error, Proxy6NoProxiesError
+
+
+class PurchaseOrder:
+    """
+    Покупка прокси в одной стране одним вызовом `buy`.
+
+    Parameters
+    ----------
+    country : str
+        Код страны в формате ISO2.
+    count : int
+        Количество прокси.
+    price : float
+        Стоимость покупки по `get_price`.
+    """
+
+    __slots__ = ('country', 'count', 'price')
+
+    def __init__(self, country: str, count: int, price: float) -> None:
+        self.country = country
+        self.count = count
+        self.price = price
+
+    def __repr__(self) -> str:
+        return f'PurchaseOrder(country={self.country!r}, count={self.count}, price={self.price})'
+
+
+class PurchasePlan:
+    """
+    Распределение покупки по странам с минимальной суммарной стоимостью.
+
+    Parameters
+    ----------
+    period : int
+        Период аренды в днях.
+    version : int
+        Версия прокси.
+    orders : list[PurchaseOrder]
+        Покупки по странам.
+    available : dict[str, int]
+        Количество доступных прокси по странам на момент планирования.
+    """
+
+    def __init__(self, period: int, version: int, orders: list[PurchaseOrder],
+                 available: dict[str, int]) -> None:
+        self.period = period
+        self.version = version
+        self.orders = orders
+        self.available = available
+
+    @property
+    def count(self) -> int:
+        """Общее количество прокси."""
+        return sum(order.count for order in self.orders)
+
+    @property
+    def total(self) -> float:
+        """Суммарная стоимость в рублях."""
+        return sum(order.price for order in self.orders)
+
+    def allocation(self) -> dict[str, int]:
+        """Возвращает количество прокси по странам."""
+        return {order.country: order.count for order in self.orders}
+
+    def __repr__(self) -> str:
+        return f'PurchasePlan(count={self.count}, total={self.total}, allocation={self.allocation()})'
+
+
+class PurchaseReport:
+    """
+    Итог выполнения плана `PurchasePlanner.execute`.
+
+    Attributes
+    ----------
+    bought : list[tuple[PurchaseOrder, dict]]
+        Выполненные покупки и ответы `buy`.
+    failed : list[tuple[PurchaseOrder, Proxy6Error]]
+        Покупки, завершившиеся ошибкой API.
+    rolled_back : list[int]
+        ID прокси, удаленных при откате частично выполненного плана.
+    rollback_error : Proxy6Error | None
+        Ошибка удаления при откате, если она возникла.
+    """
+
+    def __init__(self) -> None:
+        self.bought: list[tuple[PurchaseOrder, dict]] = []
+        self.failed: list[tuple[PurchaseOrder, Proxy6Error]] = []
+        self.rolled_back: list[int] = []
+        self.rollback_error: Proxy6Error | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True, если все покупки плана выполнены."""
+        return not self.failed
+
+    @property
+    def bought_ids(self) -> list[int]:
+        """ID всех купленных прокси."""
+        return [int(proxy_id) for _, data in self.bought for proxy_id in data.get('list', {})]
+
+    @property
+    def cost(self) -> float:
+        """Фактическая стоимость выполненных покупок по ответам `buy`."""
+        return sum(float(data.get('price', order.price)) for order, data in self.bought)
+
+    def __repr__(self) -> str:
+        return (f'PurchaseReport(bought={len(self.bought)}, failed={len(self.failed)}, '
+                f'rolled_back={len(self.rolled_back)}, cost={self.cost})')
+
+
+class PurchasePlanner:
+    """
+    Планировщик покупки прокси с минимальной стоимостью.
+
+    Доступность (`get_count`) по странам запрашивается конкурентно, после
+    чего сравниваются кандидатные распределения: минимумы по странам плюс
+    остаток, целиком отданный одной стране (с переносом излишка в страны
+    с наибольшим запасом), либо разделенный пропорционально доступности.
+    Цена в Proxy6 зависит только от количества в одной покупке, поэтому
+    котируются лишь размеры заказов из этих кандидатов — конкурентными
+    вызовами `get_price` не более `max_quotes` штук, либо локально по
+    сетке `PriceMatrix`.
+
+    Parameters
+    ----------
+    client : AsyncProxy6
+        Асинхронный клиент с активной HTTP-сессией.
+    version : int, optional
+        Версия прокси: 4 - IPv4, 3 - IPv4 Shared, 6 - IPv6 (по умолчанию 6).
+    concurrency : int, optional
+        Максимальное число одновременных запросов к API. По умолчанию 8.
+    prices : PriceMatrix | None, optional
+        Сетка цен; если задана, `get_price` не вызывается, а стоимость
+        заказов оценивается по сетке.
+    max_quotes : int, optional
+        Максимальное число различных количеств, котируемых через `get_price`
+        за один план. По умолчанию 64.
+    """
+
+    def __init__(self, client: AsyncProxy6, *, version: int = 6, concurrency: int = 8,
+                 prices: 'PriceMatrix | None' = None, max_quotes: int = 64):
+        self.client = client
+        self.version = version
+        self.concurrency = concurrency
+        self.prices = prices
+        self.max_quotes = max_quotes
+
+    async def plan(self, *, count: int, period: int, minimums: Mapping[str, int] | None = None,
+                   countries: Iterable[str] = ()) -> PurchasePlan:
+        """
+        Составляет план покупки с минимальной суммарной стоимостью.
+
+        Parameters
+        ----------
+        count : int
+            Общее количество прокси.
+        period : int
+            Период аренды в днях.
+        minimums : Mapping[str, int] | None, optional
+            Минимальное количество прокси по странам.
+        countries : Iterable[str], optional
+            Дополнительные страны без минимума, в которые можно
+            распределить остаток.
+
+        Returns
+        -------
+        PurchasePlan
+            План покупки; страны с нулевым количеством в него не входят.
+
+        Raises
+        ------
+        ValueError
+            Если сумма минимумов превышает `count` или не задано ни одной страны.
+        Proxy6NoProxiesError
+            Если доступных прокси недостаточно для выполнения плана.
+        Proxy6Error
+            При ошибке API или сетевой ошибке.
+        """
+        minimums = dict(minimums or {})
+        for country in countries:
+            minimums.setdefault(country, 0)
+        if not minimums:
+            raise ValueError('At least one country is required')
+        if sum(minimums.values()) > count:
+            raise ValueError(f'Sum of minimums exceeds count: {sum(minimums.values())} > {count}')
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def available(country: str) -> int:
+            async with semaphore:
+                return int(await self.client.get_count(country=country, version=self.version))
+
+        counts = await asyncio.gather(*(available(country) for country in minimums))
+        limits = {country: min(limit, count) for country, limit in zip(minimums, counts)}
+        for country, minimum in minimums.items():
+            if limits[country] < minimum:
+                raise Proxy6NoProxiesError(
+                    f'Not enough proxies in {country}: {minimum} required, {limits[country]} available'
+                )
+        if sum(limits.values()) < count:
+            raise Proxy6NoProxiesError(f'Not enough proxies: {count} required, {sum(limits.values())} available')
+
+        if self.prices is not None:
+            await self.prices.ensure()
+            candidates = _allocations(count, minimums, limits)
+            quantities = {quantity for allocation in candidates for quantity in allocation.values() if quantity}
+            prices = {quantity: self.prices.price(count=quantity, period=period, version=self.version)
+                      for quantity in quantities}
+        else:
+            candidates = []
+            quantities = set()
+            for allocation in _allocations(count, minimums, limits):
+                needed = quantities.union(quantity for quantity in allocation.values() if quantity)
+                if candidates and len(needed) > self.max_quotes:
+                    break
+                candidates.append(allocation)
+                quantities = needed
+
+            async def quote(quantity: int) -> float:
+                async with semaphore:
+                    return float(await self.client.get_price(count=quantity, period=period, version=self.version))
+
+            ordered = sorted(quantities)
+            prices = dict(zip(ordered, await asyncio.gather(*(quote(quantity) for quantity in ordered))))
+
+        best = min(candidates, key=lambda allocation: sum(
+            prices[quantity] for quantity in allocation.values() if quantity
+        ))
+        orders = [PurchaseOrder(country, quantity, prices[quantity])
+                  for country, quantity in best.items() if quantity]
+        return PurchasePlan(period, self.version, orders, dict(zip(minimums, counts)))
+
+    async def execute(self, plan: PurchasePlan, *, type: str = 'http', descr: str | None = None,
+                      auto_prolong: bool = False, rollback: bool = False) -> PurchaseReport:
+        """
+        Выполняет покупки плана конкурентно.
+
+        Parameters
+        ----------
+        plan : PurchasePlan
+            План из `plan`.
+        type : str, optional
+            Тип прокси: 'socks' или 'http' (по умолчанию 'http').
+        descr : str | None, optional
+            Технический комментарий для купленных прокси.
+        auto_prolong : bool, optional
+            Включить автопродление для купленных прокси.
+        rollback : bool, optional
+            Удалить уже купленные прокси, если часть покупок не удалась.
+            По умолчанию False.
+
+        Returns
+        -------
+        PurchaseReport
+            Выполненные и неудавшиеся покупки, а также ID прокси,
+            удаленных при откате.
+
+        Notes
+        -----
+        Покупки независимы: ошибка одной из них не отменяет остальные.
+        Удаление при откате не возвращает средства за купленные прокси.
+        """
+        report = PurchaseReport()
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def buy(order: PurchaseOrder) -> None:
+            async with semaphore:
+                try:
+                    data = await self.client.buy(count=order.count, period=plan.period, country=order.country,
+                                                 version=plan.version, type=type, descr=descr,
+                                                 auto_prolong=auto_prolong)
+                except Proxy6Error as e:
+                    report.failed.append((order, e))
+                    return
+            report.bought.append((order, data))
+
+        await asyncio.gather(*(buy(order) for order in plan.orders))
+
+        if rollback and report.failed and report.bought:
+            ids = tuple(report.bought_ids)
+            try:
+                await self.client.delete(ids=ids)
+            except Proxy6Error as e:
+                report.rollback_error = e
+            else:
+                report.rolled_back.extend(ids)
+        return report
+
+
+class PriceMatrix:
+    """
+    Предрассчитанная сетка цен (количество × период × версия) с TTL.
+
+    Сетка загружается конкурентными вызовами `get_price` и затем
+    обслуживает любые запросы цены локально: значения между узлами
+    сетки интерполируются линейно по цене одного прокси за день,
+    за пределами сетки используется цена ближайшего узла.
+
+    Parameters
+    ----------
+    client : AsyncProxy6
+        Асинхронный клиент с активной HTTP-сессией.
+    counts : Sequence[int], optional
+        Узлы сетки по количеству прокси.
+    periods : Sequence[int], optional
+        Узлы сетки по периоду аренды в днях.
+    versions : Sequence[int], optional
+        Версии прокси. По умолчанию 4, 3 и 6.
+    ttl : float, optional
+        Время жизни сетки в секундах. По умолчанию 600.
+    concurrency : int, optional
+        Максимальное число одновременных запросов к API. По умолчанию 8.
+    """
+
+    DEFAULT_COUNTS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+    DEFAULT_PERIODS = (3, 7, 14, 30, 60, 90)
+
+    def __init__(self, client: AsyncProxy6, *, counts: Sequence[int] = DEFAULT_COUNTS,
+                 periods: Sequence[int] = DEFAULT_PERIODS, versions: Sequence[int] = (4, 3, 6),
+                 ttl: float = 600.0, concurrency: int = 8):
+        self.client = client
+        self.counts = sorted(set(counts))
+        self.periods = sorted(set(periods))
+        self.versions = tuple(versions)
+        self.ttl = ttl
+        self.concurrency = concurrency
+        self.updated_at: float | None = None
+        self._prices: dict[tuple[int, int, int], float] = {}
+        self._lock = asyncio.Lock()
+
+    def is_fresh(self) -> bool:
+        """True, если сетка загружена и ее TTL не истек."""
+        return self.updated_at is not None and time.monotonic() - self.updated_at < self.ttl
+
+    async def refresh(self) -> None:
+        """
+        Загружает все ячейки сетки конкурентно.
+
+        Raises
+        ------
+        Proxy6Error
+            При ошибке API или сетевой ошибке; ранее загруженная сетка сохраняется.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        cells = [(count, period, version)
+                 for version in self.versions for period in self.periods for count in self.counts]
+
+        async def quote(count: int, period: int, version: int) -> float:
+            async with semaphore:
+                return float(await self.client.get_price(count=count, period=period, version=version))
+
+        prices = await asyncio.gather(*(quote(*cell) for cell in cells))
+        self._prices = dict(zip(cells, prices))
+        self.updated_at = time.monotonic()
+
+    async def ensure(self) -> 'PriceMatrix':
+        """
+        Загружает сетку, если она еще не загружена или устарела.
+
+        Одновременные вызовы выполняют одну загрузку.
+
+        Returns
+        -------
+        PriceMatrix
+            Этот же объект.
+        """
+        if not self.is_fresh():
+            async with self._lock:
+                if not self.is_fresh():
+                    await self.refresh()
+        return self
+
+    def price(self, *, count: int, period: int, version: int = 6) -> float:
+        """
+        Возвращает стоимость покупки по загруженной сетке без обращения к API.
+
+        Parameters
+        ----------
+        count : int
+            Количество прокси.
+        period : int
+            Период аренды в днях.
+        version : int, optional
+            Версия прокси (по умолчанию IPv6).
+
+        Returns
+        -------
+        float
+            Стоимость в рублях: точное значение для узла сетки,
+            иначе интерполированная оценка.
+
+        Raises
+        ------
+        KeyError
+            Если сетка не загружена или версия в нее не входит.
+        """
+        exact = self._prices.get((count, period, version))
+        if exact is not None:
+            return exact
+        if version not in self.versions or not self._prices:
+            raise KeyError((count, period, version))
+
+        def unit(grid_count: int, grid_period: int) -> float:
+            return self._prices[grid_count, grid_period, version] / (grid_count * grid_period)
+
+        (count_low, count_high), count_weight = _bracket(self.counts, count)
+        (period_low, period_high), period_weight = _bracket(self.periods, period)
+        low = unit(count_low, period_low) * (1 - count_weight) + unit(count_high, period_low) * count_weight
+        high = unit(count_low, period_high) * (1 - count_weight) + unit(count_high, period_high) * count_weight
+        return (low * (1 - period_weight) + high * period_weight) * count * period
+
+    def grid(self, version: int = 6) -> dict[int, dict[int, float]]:
+        """
+        Возвращает загруженные цены версии в виде {период: {количество: цена}}.
+
+        Parameters
+        ----------
+        version : int, optional
+            Версия прокси (по умолчанию IPv6).
+
+        Returns
+        -------
+        dict[int, dict[int, float]]
+            Цены по узлам сетки.
+        """
+        return {period: {count: self._prices[count, period, version] for count in self.counts}
+                for period in self.periods if (self.counts[0], period, version) in self._prices}
+
+
+def _allocations(count: int, minimums: dict[str, int], limits: dict[str, int]) -> list[dict[str, int]]:
+    """Возвращает кандидатные распределения покупки по странам в порядке приоритета."""
+    remainder = count - sum(minimums.values())
+    spare = {country: limits[country] - minimum for country, minimum in minimums.items()}
+    order = sorted(spare, key=spare.__getitem__, reverse=True)
+
+    def fill(allocation: dict[str, int], left: int, countries: list[str]) -> dict[str, int]:
+        for country in countries:
+            extra = min(left, limits[country] - allocation[country])
+            allocation[country] += extra
+            left -= extra
+        return allocation
+
+    allocations = [fill(dict(minimums), remainder, [main] + [country for country in order if country != main])
+                   for main in order]
+    total = sum(spare.values())
+    if total:
+        shares = {country: remainder * spare[country] // total for country in minimums}
+        allocation = {country: minimum + shares[country] for country, minimum in minimums.items()}
+        allocations.append(fill(allocation, remainder - sum(shares.values()), order))
+
+    unique: dict[tuple, dict[str, int]] = {}
+    for allocation in allocations:
+        unique.setdefault(tuple(allocation.items()), allocation)
+    return list(unique.values())
+
+
+def _bracket(nodes: list[int], value: int) -> tuple[tuple[int, int], float]:
+    """Возвращает соседние узлы сетки и вес правого узла для линейной интерполяции."""
+    position = bisect.bisect_left(nodes, value)
+    if position == 0:
+        return (nodes[0], nodes[0]), 0.0
+    if position == len(nodes):
+        return (nodes[-1], nodes[-1]), 0.0
+    low, high = nodes[position - 1], nodes[position]
+    return (low, high), (value - low) / (high - low)
+
+
+async def price_matrix(client: AsyncProxy6, **options) -> PriceMatrix:
+    """
+    Создает и загружает сетку цен.
+
+    Parameters
+    ----------
+    client : AsyncProxy6
+        Асинхронный клиент с активной HTTP-сессией.
+    **options
+        Параметры `PriceMatrix`: counts, periods, versions, ttl, concurrency.
+
+    Returns
+    -------
+    PriceMatrix
+        Загруженная сетка; для обновления по TTL вызывайте `ensure`.
+    """
+    return await PriceMatrix(client, **options).ensure()
@@ -0,0 +1,1135 @@
+"""
+Proxy6 API Client — пул ротации прокси аккаунта
+
+Copyright (c) 2026 Alexsey Novikov
+
+Распространяется под лицензией MIT.
+Подробнее см. в файле LICENSE или на https://opensource.org/licenses/MIT.
+"""
+
+
+import abc
+import asyncio
+import bisect
+import contextlib
+import hashlib
+import heapq
+import random
+import struct
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator
+
+from proxy6_client import AsyncProxy6, Proxy, Proxy6, Proxy6Error
+from proxy6_probe import ProxyProber
+
+
+class RotationStrategy(abc.ABC):
+    """
+    Базовая стратегия выбора прокси из пула.
+
+    Стратегия получает полный список прокси через `reset` при пересборке
+    пула; единичные изменения списка (карантин выключателей) пул вносит
+    в тот же список на месте и сообщает через `add` и `discard`.
+    `select` должен выполняться за O(1).
+    """
+
+    def reset(self, proxies: list[Proxy]) -> None:
+        """
+        Перестраивает внутреннее состояние стратегии.
+
+        Parameters
+        ----------
+        proxies : list[Proxy]
+            Непустой список доступных прокси.
+        """
+        self.proxies = proxies
+
+    @abc.abstractmethod
+    def select(self) -> Proxy:
+        """Возвращает следующий прокси."""
+
+    def add(self, proxy: Proxy) -> None:
+        """
+        Учитывает прокси, добавленный в конец списка `proxies`.
+
+        По умолчанию состояние перестраивается через `reset`.
+
+        Parameters
+        ----------
+        proxy : Proxy
+            Добавленный прокси.
+        """
+        self.reset(self.proxies)
+
+    def discard(self, proxy: Proxy) -> None:
+        """
+        Учитывает прокси, удаленный из непустого списка `proxies`; на его
+        место перенесен последний элемент списка.
+
+        По умолчанию состояние перестраивается через `reset`.
+
+        Parameters
+        ----------
+        proxy : Proxy
+            Удаленный прокси.
+        """
+        self.reset(self.proxies)
+
+    def report(self, proxy: Proxy, latency: float) -> None:
+        """
+        Учитывает измеренную задержку запроса через прокси.
+
+        Parameters
+        ----------
+        proxy : Proxy
+            Использованный прокси.
+        latency : float
+            Задержка в секундах.
+        """
+
+
+class RoundRobin(RotationStrategy):
+    """Выбор прокси по кругу."""
+
+    def reset(self, proxies: list[Proxy]) -> None:
+        previous = getattr(self, 'proxies', [])
+        position = getattr(self, '_position', -1)
+        super().reset(proxies)
+        # Продолжаем обход после прокси, выданного последним, а не с начала списка
+        last = previous[position].id if 0 <= position < len(previous) else None
+        self._position = next(
+            (index for index, proxy in enumerate(proxies) if proxy.id == last),
+            max(min(position, len(proxies)) - 1, -1),
+        )
+
+    def select(self) -> Proxy:
+        self._position = (self._position + 1) % len(self.proxies)
+        return self.proxies[self._position]
+
+    def add(self, proxy: Proxy) -> None:
+        pass
+
+    def discard(self, proxy: Proxy) -> None:
+        pass
+
+
+class RandomChoice(RotationStrategy):
+    """Равновероятный случайный выбор прокси."""
+
+    def select(self) -> Proxy:
+        return self.proxies[random.randrange(len(self.proxies))]
+
+    def add(self, proxy: Proxy) -> None:
+        pass
+
+    def discard(self, proxy: Proxy) -> None:
+        pass
+
+
+class LeastRecentlyUsed(RotationStrategy):
+    """Выбор прокси, который дольше всех не использовался."""
+
+    def reset(self, proxies: list[Proxy]) -> None:
+        super().reset(proxies)
+        previous = getattr(self, '_order', OrderedDict())
+        # Сохраняем порядок использования для прокси, оставшихся в пуле
+        order = OrderedDict((proxy.id, proxy) for proxy in proxies if proxy.id not in previous)
+        current = {proxy.id: proxy for proxy in proxies}
+        order.update((proxy_id, current[proxy_id]) for proxy_id in previous if proxy_id in current)
+        self._order = order
+
+    def select(self) -> Proxy:
+        proxy_id, proxy = next(iter(self._order.items()))
+        self._order.move_to_end(proxy_id)
+        return proxy
+
+    def add(self, proxy: Proxy) -> None:
+        self._order[proxy.id] = proxy
+        self._order.move_to_end(proxy.id, last=False)
+
+    def discard(self, proxy: Proxy) -> None:
+        self._order.pop(proxy.id, None)
+
+
+class LatencyWeighted(RotationStrategy):
+    """
+    Случайный выбор с вероятностью, обратно пропорциональной задержке.
+
+    Задержка каждого прокси сглаживается экспоненциальным скользящим
+    средним, выбор выполняется за O(1) методом псевдонимов (Vose).
+    Таблицы перестраиваются за O(n) не чаще раза в `rebuild_interval`.
+
+    Parameters
+    ----------
+    default_latency : float, optional
+        Задержка прокси без измерений в секундах. По умолчанию 1.0.
+    alpha : float, optional
+        Вес нового измерения в скользящем среднем. По умолчанию 0.2.
+    rebuild_interval : float, optional
+        Минимальный интервал перестроения таблиц в секундах. По умолчанию 1.0.
+    """
+
+    def __init__(self, *, default_latency: float = 1.0, alpha: float = 0.2,
+                 rebuild_interval: float = 1.0) -> None:
+        self.default_latency = default_latency
+        self.alpha = alpha
+        self.rebuild_interval = rebuild_interval
+        self.latency: dict[int, float] = {}
+        self._dirty = False
+        self._built_at = 0.0
+
+    def reset(self, proxies: list[Proxy]) -> None:
+        super().reset(proxies)
+        self._build()
+
+    def _build(self) -> None:
+        """Строит таблицы вероятностей и псевдонимов."""
+        size = len(self.proxies)
+        weights = [1.0 / max(self.latency.get(proxy.id, self.default_latency), 1e-6) for proxy in self.proxies]
+        scale = size / sum(weights)
+        scaled = [weight * scale for weight in weights]
+        probability = [1.0] * size
+        alias = list(range(size))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            probability[less] = scaled[less]
+            alias[less] = more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        self._probability = probability
+        self._alias = alias
+        self._dirty = False
+        self._built_at = time.monotonic()
+
+    def select(self) -> Proxy:
+        if len(self._probability) != len(self.proxies) or \
+                (self._dirty and time.monotonic() - self._built_at >= self.rebuild_interval):
+            self._build()
+        column = random.randrange(len(self.proxies))
+        if random.random() >= self._probability[column]:
+            column = self._alias[column]
+        return self.proxies[column]
+
+    def report(self, proxy: Proxy, latency: float) -> None:
+        previous = self.latency.get(proxy.id)
+        self.latency[proxy.id] = latency if previous is None else previous + self.alpha * (latency - previous)
+        self._dirty = True
+
+    def add(self, proxy: Proxy) -> None:
+        self._dirty = True
+
+    def discard(self, proxy: Proxy) -> None:
+        self._dirty = True
+
+
+STRATEGIES: dict[str, type[RotationStrategy]] = {
+    'round_robin': RoundRobin,
+    'random': RandomChoice,
+    'weighted': LatencyWeighted,
+    'lru': LeastRecentlyUsed,
+}
+
+
+class HashRing:
+    """
+    Кольцо консистентного хеширования прокси с виртуальными узлами.
+
+    Каждый прокси размещается на кольце в `replicas` точках; ключ
+    (целевой хост, ID сессии) закрепляется за первым прокси по часовой
+    стрелке от хеша ключа. При добавлении или удалении прокси меняют
+    прокси только ~1/n ключей, поиск выполняется за O(log n).
+
+    Parameters
+    ----------
+    proxies : Iterable[Proxy], optional
+        Прокси кольца.
+    replicas : int, optional
+        Количество виртуальных узлов на прокси. По умолчанию 100.
+    """
+
+    def __init__(self, proxies: Iterable[Proxy] = (), *, replicas: int = 100) -> None:
+        self.replicas = replicas
+        self._points: list[int] = []
+        self._owners: dict[int, int] = {}
+        self._proxies: dict[int, Proxy] = {}
+        self._insert(list(proxies))
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        """Стабильный между процессами 64-битный хеш строки."""
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), 'big')
+
+    def _node_points(self, proxy_id: int) -> tuple[int, ...]:
+        """Точки виртуальных узлов прокси: восемь 64-битных точек из одного хеша."""
+        blocks = (self.replicas + 7) // 8
+        digest = b''.join(hashlib.blake2b(f'{proxy_id}#{block}'.encode(), digest_size=64).digest()
+                          for block in range(blocks))
+        return struct.unpack(f'>{blocks * 8}Q', digest)[:self.replicas]
+
+    def add(self, proxy: Proxy) -> None:
+        """
+        Добавляет прокси на кольцо или обновляет его запись.
+
+        Parameters
+        ----------
+        proxy : Proxy
+            Прокси.
+        """
+        if proxy.id in self._proxies:
+            self._proxies[proxy.id] = proxy
+            return
+        self._proxies[proxy.id] = proxy
+        for point in self._node_points(proxy.id):
+            # Совпадение 64-битных точек разных прокси практически невозможно
+            if self._owners.setdefault(point, proxy.id) == proxy.id:
+                bisect.insort(self._points, point)
+
+    def _insert(self, proxies: list[Proxy]) -> None:
+        """Добавляет много прокси одной сортировкой вместо вставок по одному узлу."""
+        new = [proxy for proxy in proxies if proxy.id not in self._proxies]
+        if len(new) == 1:
+            self.add(new[0])
+        elif new:
+            for proxy in new:
+                self._proxies[proxy.id] = proxy
+                for point in self._node_points(proxy.id):
+                    self._owners.setdefault(point, proxy.id)
+            self._points = sorted(self._owners)
+        self._proxies.update((proxy.id, proxy) for proxy in proxies)
+
+    def remove(self, proxy_id: int) -> None:
+        """
+        Удаляет прокси с кольца.
+
+        Parameters
+        ----------
+        proxy_id : int
+            ID прокси. Отсутствующий ID игнорируется.
+        """
+        if proxy_id in self._proxies:
+            self._discard({proxy_id})
+
+    def _discard(self, proxy_ids: set[int]) -> None:
+        """Удаляет виртуальные узлы указанных прокси; массовое удаление — за один проход."""
+        if len(proxy_ids) * 8 > len(self._proxies):
+            for proxy_id in proxy_ids:
+                del self._proxies[proxy_id]
+            self._owners = {point: owner for point, owner in self._owners.items() if owner not in proxy_ids}
+            self._points = [point for point in self._points if point in self._owners]
+            return
+        for proxy_id in proxy_ids:
+            del self._proxies[proxy_id]
+            for point in self._node_points(proxy_id):
+                if self._owners.get(point) == proxy_id:
+                    del self._owners[point]
+                    del self._points[bisect.bisect_left(self._points, point)]
+
+    def sync(self, proxies: Iterable[Proxy]) -> None:
+        """
+        Приводит состав кольца к указанному списку, меняя только разницу.
+
+        Parameters
+        ----------
+        proxies : Iterable[Proxy]
+            Актуальный список прокси.
+        """
+        current = {proxy.id: proxy for proxy in proxies}
+        removed = self._proxies.keys() - current.keys()
+        if removed:
+            self._discard(removed)
+        self._insert(list(current.values()))
+
+    def get(self, key: str) -> Proxy:
+        """
+        Возвращает прокси, закрепленный за ключом.
+
+        Parameters
+        ----------
+        key : str
+            Ключ привязки, например целевой хост или ID сессии.
+
+        Returns
+        -------
+        Proxy
+            Прокси ключа.
+
+        Raises
+        ------
+        LookupError
+            Если кольцо пусто.
+        """
+        if not self._points:
+            raise LookupError('Hash ring is empty')
+        position = bisect.bisect(self._points, self._hash(key)) % len(self._points)
+        return self._proxies[self._owners[self._points[position]]]
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def __contains__(self, proxy_id: object) -> bool:
+        return proxy_id in self._proxies
+
+
+class _BreakerState:
+    """Состояние автомата одного прокси."""
+
+    __slots__ = ('state', 'outcomes', 'opened_at', 'trials', 'inflight')
+
+    def __init__(self, window: int) -> None:
+        self.state = CircuitBreaker.CLOSED
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.trials = 0
+        self.inflight = 0
+
+
+class CircuitBreaker:
+    """
+    Автоматические выключатели (circuit breaker) для прокси пула.
+
+    Для каждого прокси ведется окно последних результатов запросов.
+    Если доля ошибок в окне (медленный ответ дольше `slow_call_time`
+    тоже считается ошибкой) достигает `error_rate`, выключатель
+    размыкается и прокси уходит в карантин на `cooldown` секунд. Затем
+    прокси переходит в полуоткрытое состояние и снова выдается пулом,
+    но не более чем для `half_open_calls` пробных запросов:
+    `half_open_calls` успешных запросов подряд замыкают выключатель,
+    любая ошибка снова размыкает его. Пробные запросы, результат
+    которых не сообщен за `cooldown` секунд, считаются потерянными,
+    и прокси снова выдается для проверки.
+
+    Parameters
+    ----------
+    error_rate : float, optional
+        Доля ошибок в окне, при которой выключатель размыкается. По умолчанию 0.5.
+    slow_call_time : float | None, optional
+        Задержка в секундах, начиная с которой успешный запрос считается
+        ошибкой; None — не учитывать задержку. По умолчанию None.
+    window : int, optional
+        Размер окна последних результатов. По умолчанию 20.
+    min_calls : int, optional
+        Минимальное число результатов в окне для оценки доли ошибок. По умолчанию 5.
+    cooldown : float, optional
+        Длительность карантина в секундах. По умолчанию 30.
+    half_open_calls : int, optional
+        Число пробных запросов в полуоткрытом состоянии. По умолчанию 3.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, *, error_rate: float = 0.5, slow_call_time: float | None = None,
+                 window: int = 20, min_calls: int = 5, cooldown: float = 30.0,
+                 half_open_calls: int = 3) -> None:
+        self.error_rate = error_rate
+        self.slow_call_time = slow_call_time
+        self.window = window
+        self.min_calls = min_calls
+        self.cooldown = cooldown
+        self.half_open_calls = half_open_calls
+        self.opened = 0
+        self.next_retry = float('inf')
+        self._states: dict[int, _BreakerState] = {}
+        # Сроки окончания карантина (opened_at + cooldown, ID прокси); записи,
+        # не совпадающие с текущим состоянием, отбрасываются лениво
+        self._deadlines: list[tuple[float, int]] = []
+
+    def _state(self, proxy_id: int) -> _BreakerState:
+        state = self._states.get(proxy_id)
+        if state is None:
+            state = self._states[proxy_id] = _BreakerState(self.window)
+        return state
+
+    def _open(self, proxy_id: int, state: _BreakerState, now: float) -> None:
+        if state.state != self.OPEN:
+            self.opened += 1
+        state.state = self.OPEN
+        state.opened_at = now
+        state.outcomes.clear()
+        self._schedule(proxy_id, state)
+
+    def _half_open(self, state: _BreakerState, now: float) -> None:
+        state.state = self.HALF_OPEN
+        state.opened_at = now
+        state.trials = 0
+        state.inflight = 0
+
+    def _blocked(self, state: _BreakerState) -> bool:
+        """True для карантина и для полуоткрытого состояния с исчерпанным лимитом проб."""
+        return state.state == self.OPEN or \
+            (state.state == self.HALF_OPEN and state.trials + state.inflight >= self.half_open_calls)
+
+    def _schedule(self, proxy_id: int, state: _BreakerState) -> None:
+        deadline = state.opened_at + self.cooldown
+        heapq.heappush(self._deadlines, (deadline, proxy_id))
+        self.next_retry = min(self.next_retry, deadline)
+
+    def _pending(self, deadline: float, proxy_id: int) -> bool:
+        """True, если запись кучи соответствует текущему состоянию прокси."""
+        state = self._states.get(proxy_id)
+        return state is not None and self._blocked(state) and state.opened_at + self.cooldown == deadline
+
+    def _update_next_retry(self) -> None:
+        deadlines = self._deadlines
+        while deadlines and not self._pending(*deadlines[0]):
+            heapq.heappop(deadlines)
+        self.next_retry = deadlines[0][0] if deadlines else float('inf')
+
+    def allows(self, proxy_id: int, now: float | None = None) -> bool:
+        """
+        Проверяет, может ли прокси выдаваться пулом.
+
+        Разомкнутый выключатель с истекшим карантином переводится
+        в полуоткрытое состояние.
+
+        Parameters
+        ----------
+        proxy_id : int
+            ID прокси.
+        now : float | None, optional
+            Текущее время `time.monotonic()`.
+
+        Returns
+        -------
+        bool
+            False, если прокси в карантине или все пробные запросы
+            полуоткрытого состояния уже выданы.
+        """
+        state = self._states.get(proxy_id)
+        if state is None or not self._blocked(state):
+            return True
+        now = time.monotonic() if now is None else now
+        if now - state.opened_at < self.cooldown:
+            return False
+        self._half_open(state, now)
+        self._update_next_retry()
+        return True
+
+    def acquire(self, proxy_id: int) -> bool:
+        """
+        Учитывает выдачу прокси пулом.
+
+        В полуоткрытом состоянии каждая выдача занимает один пробный запрос
+        до получения его результата в `record`.
+
+        Parameters
+        ----------
+        proxy_id : int
+            ID выданного прокси.
+
+        Returns
+        -------
+        bool
+            False, если после этой выдачи лимит пробных запросов исчерпан
+            и прокси больше не должен выдаваться.
+        """
+        state = self._states.get(proxy_id)
+        if state is None or state.state != self.HALF_OPEN:
+            return True
+        state.inflight += 1
+        if self._blocked(state):
+            self._schedule(proxy_id, state)
+            return False
+        return True
+
+    def release(self, proxy_id: int) -> bool:
+        """
+        Освобождает пробный запрос без учета результата.
+
+        Используется, когда запрос через выданный прокси не состоялся
+        не по вине прокси.
+
+        Parameters
+        ----------
+        proxy_id : int
+            ID выданного прокси.
+
+        Returns
+        -------
+        bool
+            True, если доступность прокси для выдачи могла измениться.
+        """
+        state = self._states.get(proxy_id)
+        if state is None or state.state != self.HALF_OPEN or not state.inflight:
+            return False
+        state.inflight -= 1
+        return True
+
+    def expire(self, now: float | None = None) -> list[int]:
+        """
+        Переводит в полуоткрытое состояние прокси с истекшим карантином.
+
+        Parameters
+        ----------
+        now : float | None, optional
+            Текущее время `time.monotonic()`.
+
+        Returns
+        -------
+        list[int]
+            ID прокси, снова доступных для выдачи.
+        """
+        now = time.monotonic() if now is None else now
+        if self.next_retry > now:
+            return []
+        expired = []
+        deadlines = self._deadlines
+        while deadlines and deadlines[0][0] <= now:
+            deadline, proxy_id = heapq.heappop(deadlines)
+            if self._pending(deadline, proxy_id):
+                self._half_open(self._states[proxy_id], now)
+                expired.append(proxy_id)
+        self._update_next_retry()
+        return expired
+
+    def record(self, proxy_id: int, ok: bool, latency: float | None = None) -> bool:
+        """
+        Учитывает результат запроса через прокси.
+
+        Parameters
+        ----------
+        proxy_id : int
+            ID прокси.
+        ok : bool
+            True, если запрос выполнен успешно.
+        latency : float | None, optional
+            Задержка запроса в секундах.
+
+        Returns
+        -------
+        bool
+            True, если доступность прокси для выдачи могла измениться.
+        """
+        if ok and self.slow_call_time is not None and latency is not None:
+            ok = latency < self.slow_call_time
+        state = self._state(proxy_id)
+        now = time.monotonic()
+        if state.state == self.OPEN:
+            return False
+        if state.state == self.HALF_OPEN:
+            state.inflight = max(state.inflight - 1, 0)
+            if not ok:
+                self._open(proxy_id, state, now)
+                return True
+            state.trials += 1
+            if state.trials >= self.half_open_calls:
+                state.state = self.CLOSED
+            return True
+
+        state.outcomes.append(ok)
+        failures = state.outcomes.count(False)
+        if len(state.outcomes) >= self.min_calls and failures / len(state.outcomes) >= self.error_rate:
+            self._open(proxy_id, state, now)
+            return True
+        return False
+
+    def probed(self, proxy_id: int, ok: bool) -> None:
+        """
+        Учитывает результат повторной проверки прокси в карантине.
+
+        Успешная проверка досрочно переводит выключатель в полуоткрытое
+        состояние, неудачная — продлевает карантин.
+
+        Parameters
+        ----------
+        proxy_id : int
+            ID прокси.
+        ok : bool
+            Результат проверки.
+        """
+        state = self._state(proxy_id)
+        if ok:
+            self._half_open(state, time.monotonic())
+        else:
+            state.state = self.OPEN
+            state.opened_at = time.monotonic()
+            self._schedule(proxy_id, state)
+        self._update_next_retry()
+
+    def state(self, proxy_id: int) -> str:
+        """Возвращает состояние выключателя прокси: 'closed', 'open' или 'half_open'."""
+        state = self._states.get(proxy_id)
+        return self.CLOSED if state is None else state.state
+
+    def quarantined(self) -> list[int]:
+        """Возвращает ID прокси в карантине."""
+        return [proxy_id for proxy_id, state in self._states.items() if state.state == self.OPEN]
+
+    def forget(self, proxy_ids: Iterable[int]) -> None:
+        """Удаляет состояние прокси, которых больше нет в пуле."""
+        for proxy_id in proxy_ids:
+            self._states.pop(proxy_id, None)
+        self._update_next_retry()
+
+    def counts(self) -> dict[str, int]:
+        """
+        Возвращает количество прокси по состояниям.
+
+        Returns
+        -------
+        dict[str, int]
+            Прокси в состояниях closed, open и half_open, а также общее
+            число размыканий `opened`.
+        """
+        counts = {self.CLOSED: 0, self.OPEN: 0, self.HALF_OPEN: 0}
+        for state in self._states.values():
+            counts[state.state] += 1
+        counts['opened'] = self.opened
+        return counts
+
+
+class ProxyPool:
+    """
+    Потокобезопасный пул ротации прокси.
+
+    Из пула автоматически исключаются неактивные прокси и прокси, до
+    окончания которых осталось меньше `min_ttl` секунд; проверка срока
+    выполняется за O(1) при каждой выдаче по ближайшему сроку окончания.
+
+    Parameters
+    ----------
+    proxies : Iterable[dict | Proxy], optional
+        Записи прокси из `get_proxy` или `iter_proxies`.
+    strategy : str | RotationStrategy, optional
+        Стратегия выбора: 'round_robin' (по умолчанию), 'random',
+        'weighted' (по измеренной задержке) или 'lru', либо экземпляр
+        `RotationStrategy`.
+    min_ttl : float, optional
+        Минимальное оставшееся время жизни прокси в секундах.
+        По умолчанию 3600.
+    replicas : int, optional
+        Количество виртуальных узлов на прокси в кольце `sticky`. По умолчанию 100.
+        Кольцо строится при первом вызове `sticky` и синхронизируется с
+        составом пула лениво, только при следующих вызовах `sticky`.
+    breaker : CircuitBreaker | None, optional
+        Автоматические выключатели: прокси с частыми ошибками или медленными
+        ответами по данным `report` исключаются из выдачи на время карантина.
+
+    Examples
+    --------
+    >>> pool = ProxyPool.from_client(client, strategy='weighted')
+    >>> proxy = pool.checkout()
+    >>> pool.report(proxy, latency=0.35)
+    >>> pool.report(proxy, ok=False)  # ошибка запроса через прокси
+    >>> pool.sticky('example.com')  # всегда один и тот же прокси для хоста
+    """
+
+    def __init__(self, proxies: Iterable[dict | Proxy] = (), *,
+                 strategy: str | RotationStrategy = 'round_robin', min_ttl: float = 3600.0,
+                 replicas: int = 100, breaker: CircuitBreaker | None = None) -> None:
+        self.strategy = STRATEGIES[strategy]() if isinstance(strategy, str) else strategy
+        self.min_ttl = min_ttl
+        self.ring = HashRing(replicas=replicas)
+        self.breaker = breaker
+        self._ring_synced = False
+        self._lock = self._create_lock()
+        self._all: dict[int, Proxy] = {}
+        self._available: list[Proxy] = []
+        self._positions: dict[int, int] = {}
+        self._next_expiry = float('inf')
+        self.replace(proxies)
+
+    def _create_lock(self) -> contextlib.AbstractContextManager:
+        return threading.Lock()
+
+    @classmethod
+    def from_client(cls, client: Proxy6, *, descr: str | None = None, **options) -> 'ProxyPool':
+        """
+        Создает пул из активных прокси аккаунта.
+
+        Parameters
+        ----------
+        client : Proxy6
+            Синхронный клиент.
+        descr : str | None, optional
+            Технический комментарий для фильтрации прокси.
+        **options
+            Параметры конструктора: strategy, min_ttl, replicas, breaker.
+
+        Returns
+        -------
+        ProxyPool
+            Заполненный пул.
+        """
+        return cls(client.iter_proxies(state='active', descr=descr, typed=True), **options)
+
+    def refresh(self, client: Proxy6, *, descr: str | None = None) -> None:
+        """
+        Заменяет содержимое пула актуальным списком активных прокси аккаунта.
+
+        Parameters
+        ----------
+        client : Proxy6
+            Синхронный клиент.
+        descr : str | None, optional
+            Технический комментарий для фильтрации прокси.
+        """
+        self.replace(client.iter_proxies(state='active', descr=descr, typed=True))
+
+    def replace(self, proxies: Iterable[dict | Proxy]) -> None:
+        """
+        Заменяет содержимое пула.
+
+        Parameters
+        ----------
+        proxies : Iterable[dict | Proxy]
+            Записи прокси из `get_proxy` или `iter_proxies`.
+        """
+        records = {}
+        for record in proxies:
+            proxy = record if isinstance(record, Proxy) else Proxy.from_api(record)
+            records[proxy.id] = proxy
+        with self._lock:
+            if self.breaker is not None:
+                self.breaker.forget(self._all.keys() - records.keys())
+            self._all = records
+            self._rebuild(time.time())
+
+    def add(self, proxy: dict | Proxy) -> None:
+        """
+        Добавляет прокси в пул или обновляет его запись.
+
+        Parameters
+        ----------
+        proxy : dict | Proxy
+            Запись прокси.
+        """
+        proxy = proxy if isinstance(proxy, Proxy) else Proxy.from_api(proxy)
+        with self._lock:
+            self._all[proxy.id] = proxy
+            self._rebuild(time.time())
+
+    def remove(self, proxy_id: int) -> None:
+        """
+        Удаляет прокси из пула.
+
+        Parameters
+        ----------
+        proxy_id : int
+            ID прокси. Отсутствующий ID игнорируется.
+        """
+        with self._lock:
+            if self._all.pop(int(proxy_id), None) is not None:
+                if self.breaker is not None:
+                    self.breaker.forget([int(proxy_id)])
+                self._rebuild(time.time())
+
+    def _eligible(self, proxy: Proxy, now: float) -> bool:
+        """Проверяет, может ли прокси выдаваться из пула."""
+        return (proxy.active and (not proxy.unixtime_end or proxy.unixtime_end - now >= self.min_ttl)
+                and (self.breaker is None or self.breaker.allows(proxy.id)))
+
+    def _refresh_available(self) -> None:
+        """
+        Пересобирает пул, если истек срок прокси, и возвращает в выдачу прокси
+        с истекшим карантином; вызывается под блокировкой.
+        """
+        now = time.time()
+        if self._next_expiry - now < self.min_ttl:
+            self._rebuild(now)
+        elif self.breaker is not None and self.breaker.next_retry <= time.monotonic():
+            for proxy_id in self.breaker.expire():
+                self._update(proxy_id, now)
+
+    def _rebuild(self, now: float) -> None:
+        """Пересобирает список доступных прокси; вызывается под блокировкой."""
+        self._available = [proxy for proxy in self._all.values() if self._eligible(proxy, now)]
+        self._positions = {proxy.id: index for index, proxy in enumerate(self._available)}
+        self._next_expiry = min((proxy.unixtime_end for proxy in self._available if proxy.unixtime_end),
+                                default=float('inf'))
+        if self._available:
+            self.strategy.reset(self._available)
+        self._ring_synced = False
+
+    def _update(self, proxy_id: int, now: float) -> None:
+        """Добавляет прокси в выдачу или исключает из нее за O(1); вызывается под блокировкой."""
+        proxy = self._all.get(proxy_id)
+        if proxy is not None and self._eligible(proxy, now):
+            self._include(proxy)
+        else:
+            self._exclude(proxy_id)
+
+    def _include(self, proxy: Proxy) -> None:
+        if proxy.id in self._positions:
+            return
+        self._positions[proxy.id] = len(self._available)
+        self._available.append(proxy)
+        if proxy.unixtime_end:
+            self._next_expiry = min(self._next_expiry, proxy.unixtime_end)
+        if len(self._available) == 1:
+            self.strategy.reset(self._available)
+        else:
+            self.strategy.add(proxy)
+        if self._ring_synced:
+            self.ring.add(proxy)
+
+    def _exclude(self, proxy_id: int) -> None:
+        index = self._positions.pop(proxy_id, None)
+        if index is None:
+            return
+        proxy = self._available[index]
+        last = self._available.pop()
+        if last is not proxy:
+            self._available[index] = last
+            self._positions[last.id] = index
+        if self._available:
+            self.strategy.discard(proxy)
+        if self._ring_synced:
+            self.ring.remove(proxy_id)
+
+    def _acquire(self, proxy: Proxy) -> Proxy:
+        """Занимает пробный запрос выключателя для выданного прокси; вызывается под блокировкой."""
+        if self.breaker is not None and not self.breaker.acquire(proxy.id):
+            self._exclude(proxy.id)
+        return proxy
+
+    def checkout(self) -> Proxy:
+        """
+        Выбирает прокси согласно стратегии.
+
+        Returns
+        -------
+        Proxy
+            Выбранный прокси.
+
+        Raises
+        ------
+        LookupError
+            Если в пуле нет доступных прокси.
+        """
+        with self._lock:
+            self._refresh_available()
+            if not self._available:
+                raise LookupError('No proxies available in pool')
+            return self._acquire(self.strategy.select())
+
+    def sticky(self, key: str) -> Proxy:
+        """
+        Возвращает прокси, закрепленный за ключом консистентным хешированием.
+
+        Пока прокси доступен в пуле, ключ всегда получает его; при изменении
+        состава пула переназначается только малая доля ключей.
+
+        Parameters
+        ----------
+        key : str
+            Ключ привязки, например целевой хост или ID сессии.
+
+        Returns
+        -------
+        Proxy
+            Прокси ключа.
+
+        Raises
+        ------
+        LookupError
+            Если в пуле нет доступных прокси.
+        """
+        with self._lock:
+            self._refresh_available()
+            if not self._ring_synced:
+                self.ring.sync(self._available)
+                self._ring_synced = True
+            return self._acquire(self.ring.get(key))
+
+    def report(self, proxy: Proxy, latency: float | None = None, *, ok: bool = True) -> None:
+        """
+        Сообщает результат запроса через прокси.
+
+        Задержка используется стратегией 'weighted', результат —
+        автоматическими выключателями `breaker`.
+
+        Parameters
+        ----------
+        proxy : Proxy
+            Прокси, выданный `checkout`.
+        latency : float | None, optional
+            Задержка в секундах.
+        ok : bool, optional
+            False, если запрос через прокси завершился ошибкой или таймаутом.
+        """
+        with self._lock:
+            if ok and latency is not None:
+                self.strategy.report(proxy, latency)
+            if self.breaker is not None and self.breaker.record(proxy.id, ok, latency):
+                self._update(proxy.id, time.time())
+
+    def quarantined(self) -> list[Proxy]:
+        """Возвращает прокси, исключенные из выдачи автоматическими выключателями."""
+        if self.breaker is None:
+            return []
+        with self._lock:
+            return [self._all[proxy_id] for proxy_id in self.breaker.quarantined() if proxy_id in self._all]
+
+    def release(self, proxy: Proxy) -> None:
+        """
+        Возвращает прокси, запрос через который не состоялся не по его вине.
+
+        Результат запроса не учитывается; занятый пробный запрос
+        полуоткрытого выключателя освобождается.
+
+        Parameters
+        ----------
+        proxy : Proxy
+            Прокси, выданный `checkout`.
+        """
+        with self._lock:
+            if self.breaker is not None and self.breaker.release(proxy.id):
+                self._update(proxy.id, time.time())
+
+    def _probed(self, proxy: Proxy, ok: bool) -> None:
+        """Учитывает результат повторной проверки прокси из карантина."""
+        with self._lock:
+            self.breaker.probed(proxy.id, ok)
+            self._update(proxy.id, time.time())
+
+    def reprobe(self, client: Proxy6) -> int:
+        """
+        Повторно проверяет прокси в карантине методом API `check`.
+
+        Работающие прокси досрочно возвращаются в выдачу в полуоткрытом
+        состоянии, для остальных карантин продлевается.
+
+        Parameters
+        ----------
+        client : Proxy6
+            Синхронный клиент.
+
+        Returns
+        -------
+        int
+            Количество прокси, возвращенных в выдачу.
+        """
+        restored = 0
+        for proxy in self.quarantined():
+            try:
+                ok = bool(client.check(ids=proxy.id))
+            except Proxy6Error:
+                ok = False
+            self._probed(proxy, ok)
+            restored += ok
+        return restored
+
+    def __len__(self) -> int:
+        return len(self._available)
+
+    def __iter__(self) -> Iterator[Proxy]:
+        return iter(list(self._available))
+
+    def __contains__(self, proxy_id: object) -> bool:
+        return proxy_id in self._positions
+
+
+class AsyncProxyPool(ProxyPool):
+    """
+    Пул ротации прокси для asyncio.
+
+    `checkout` и `report` не содержат точек ожидания и поэтому атомарны
+    в пределах цикла событий; пул работает без блокировок потоков.
+    Должен использоваться из одного цикла событий.
+
+    Parameters
+    ----------
+    proxies : Iterable[dict | Proxy], optional
+        Записи прокси из `get_proxy` или `aiter_proxies`.
+    strategy : str | RotationStrategy, optional
+        Стратегия выбора, см. `ProxyPool`.
+    min_ttl : float, optional
+        Минимальное оставшееся время жизни прокси в секундах.
+        По умолчанию 3600.
+    replicas : int, optional
+        Количество виртуальных узлов на прокси в кольце `sticky`, см. `ProxyPool`.
+        По умолчанию 100.
+    breaker : CircuitBreaker | None, optional
+        Автоматические выключатели прокси, см. `ProxyPool`.
+    """
+
+    def _create_lock(self) -> contextlib.AbstractContextManager:
+        return contextlib.nullcontext()
+
+    @classmethod
+    async def from_client(cls, client: AsyncProxy6, *, descr: str | None = None,
+                          **options) -> 'AsyncProxyPool':
+        """
+        Создает пул из активных прокси аккаунта.
+
+        Parameters
+        ----------
+        client : AsyncProxy6
+            Асинхронный клиент с активной HTTP-сессией.
+        descr : str | None, optional
+            Технический комментарий для фильтрации прокси.
+        **options
+            Параметры конструктора: strategy, min_ttl, replicas, breaker.
+
+        Returns
+        -------
+        AsyncProxyPool
+            Заполненный пул.
+        """
+        pool = cls(**options)
+        await pool.refresh(client, descr=descr)
+        return pool
+
+    async def refresh(self, client: AsyncProxy6, *, descr: str | None = None) -> None:
+        """
+        Заменяет содержимое пула актуальным списком активных прокси аккаунта.
+
+        Parameters
+        ----------
+        client : AsyncProxy6
+            Асинхронный клиент с активной HTTP-сессией.
+        descr : str | None, optional
+            Технический комментарий для фильтрации прокси.
+        """
+        self.replace([proxy async for proxy in client.aiter_proxies(state='active', descr=descr, typed=True)])
+
+    async def reprobe(self, checker: AsyncProxy6 | ProxyProber, *, concurrency: int = 8) -> int:
+        """
+        Повторно проверяет прокси в карантине конкурентно.
+
+        Работающие прокси досрочно возвращаются в выдачу в полуоткрытом
+        состоянии, для остальных карантин продлевается.
+
+        Parameters
+        ----------
+        checker : AsyncProxy6 | ProxyProber
+            Клиент для проверки методом API `check` либо `ProxyProber`
+            для локальной проверки прямым соединением (с его ограничением
+            `concurrency`).
+        concurrency : int, optional
+            Максимальное число одновременных вызовов `check`. По умолчанию 8.
+
+        Returns
+        -------
+        int
+            Количество прокси, возвращенных в выдачу.
+        """
+        quarantined = {str(proxy.id): proxy for proxy in self.quarantined()}
+        restored = 0
+        if isinstance(checker, ProxyProber):
+            async for result in checker.probe_many([proxy.to_dict() for proxy in quarantined.values()]):
+                self._probed(quarantined[str(result.proxy_id)], result.ok)
+                restored += result.ok
+            return restored
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def probe(proxy: Proxy) -> None:
+            nonlocal restored
+            async with semaphore:
+                try:
+                    status = await checker.check(ids=proxy.id)
+                except Proxy6Error:
+                    status = False
+            ok = status is True or status == 'true'
+            self._probed(proxy, ok)
+            restored += ok
+
+        await asyncio.gather(*(probe(proxy) for proxy in quarantined.values()))
+        return restored
@@ -0,0 +1,283 @@
+"""
+Proxy6 API Client — локальная проверка доступности прокси без обращения к API
+
+Copyright (c) 2026 Alexsey Novikov
+
+Распространяется под лицензией MIT.
+Подробнее см. в файле LICENSE или на https://opensource.org/licenses/MIT.
+"""
+
+
+import asyncio
+import base64
+import ipaddress
+import itertools
+import struct
+import time
+from collections.abc import AsyncIterator, Iterable, Mapping
+
+
+class ProbeError(Exception):
+    """
+    Исключение, возникающее при ошибке рукопожатия с прокси:
+    отказ в соединении с целевым хостом, ошибка авторизации
+    или некорректный ответ прокси.
+    """
+    ...
+
+
+async def _http_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                        host: str, port: int, user: str | None, password: str | None) -> float:
+    """
+    Устанавливает туннель через HTTP-прокси методом CONNECT.
+
+    Returns
+    -------
+    float
+        Момент (`time.monotonic()`) получения первого байта ответа прокси.
+    """
+    lines = [f'CONNECT {host}:{port} HTTP/1.1', f'Host: {host}:{port}']
+    if user is not None:
+        credentials = base64.b64encode(f'{user}:{password or ""}'.encode()).decode()
+        lines.append(f'Proxy-Authorization: Basic {credentials}')
+    writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode())
+    await writer.drain()
+
+    first = await reader.readexactly(1)
+    first_byte_at = time.monotonic()
+    head = first + await reader.readuntil(b'\r\n\r\n')
+    status_line = head.split(b'\r\n', 1)[0].decode('latin-1')
+    parts = status_line.split(' ', 2)
+    if len(parts) < 2 or parts[1] != '200':
+        raise ProbeError(f'HTTP CONNECT failed: {status_line}')
+    return first_byte_at
+
+
+async def _socks5_connect(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                          host: str, port: int, user: str | None, password: str | None) -> float:
+    """
+    Устанавливает туннель через SOCKS5-прокси (RFC 1928, RFC 1929).
+
+    Returns
+    -------
+    float
+        Момент (`time.monotonic()`) получения первого байта ответа прокси.
+    """
+    methods = b'\x00\x02' if user is not None else b'\x00'
+    writer.write(b'\x05' + bytes([len(methods)]) + methods)
+    await writer.drain()
+
+    version, method = await reader.readexactly(2)
+    first_byte_at = time.monotonic()
+    if version != 5 or method == 0xFF:
+        raise ProbeError('SOCKS5 handshake rejected: no acceptable auth method')
+    if method == 0x02:
+        username = (user or '').encode()
+        secret = (password or '').encode()
+        writer.write(b'\x01' + bytes([len(username)]) + username + bytes([len(secret)]) + secret)
+        await writer.drain()
+        _, status = await reader.readexactly(2)
+        if status != 0:
+            raise ProbeError('SOCKS5 authentication failed')
+
+    try:
+        address = ipaddress.ip_address(host)
+        target = (b'\x01' if address.version == 4 else b'\x04') + address.packed
+    except ValueError:
+        encoded = host.encode('idna')
+        target = b'\x03' + bytes([len(encoded)]) + encoded
+    writer.write(b'\x05\x01\x00' + target + struct.pack('!H', port))
+    await writer.drain()
+
+    _, reply, _, address_type = await reader.readexactly(4)
+    if reply != 0:
+        raise ProbeError(f'SOCKS5 connect failed: reply code {reply}')
+    if address_type == 0x01:
+        await reader.readexactly(4 + 2)
+    elif address_type == 0x04:
+        await reader.readexactly(16 + 2)
+    else:
+        length = (await reader.readexactly(1))[0]
+        await reader.readexactly(length + 2)
+    return first_byte_at
+
+
+async def _handshake(proxy: Mapping, reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                     host: str, port: int) -> float:
+    """Выполняет рукопожатие в зависимости от типа прокси ('http' или 'socks')."""
+    handshake = _socks5_connect if proxy.get('type') == 'socks' else _http_connect
+    return await handshake(reader, writer, host, port, proxy.get('user'), proxy.get('pass'))
+
+
+async def open_tunnel(proxy: Mapping, host: str, port: int, *,
+                      timeout: float = 10.0) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """
+    Открывает TCP-туннель к `host:port` через прокси.
+
+    Parameters
+    ----------
+    proxy : Mapping
+        Запись прокси из `get_proxy`: поля `host`, `port`, `user`, `pass`
+        и `type` ('http' — HTTPS CONNECT, 'socks' — SOCKS5).
+    host : str
+        Целевой хост.
+    port : int
+        Целевой порт.
+    timeout : float, optional
+        Таймаут соединения и рукопожатия в секундах. По умолчанию 10.
+
+    Returns
+    -------
+    tuple[asyncio.StreamReader, asyncio.StreamWriter]
+        Потоки установленного туннеля.
+
+    Raises
+    ------
+    ProbeError
+        Если прокси отказал в установке туннеля.
+    OSError, asyncio.TimeoutError
+        При сетевой ошибке или превышении таймаута.
+    """
+    async def connect() -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        reader, writer = await asyncio.open_connection(proxy['host'], int(proxy['port']))
+        try:
+            await _handshake(proxy, reader, writer, host, port)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    return await asyncio.wait_for(connect(), timeout)
+
+
+class ProbeResult:
+    """
+    Результат локальной проверки одного прокси.
+
+    Parameters
+    ----------
+    proxy_id : str | None
+        ID прокси из записи `get_proxy`.
+    ok : bool
+        True, если туннель к целевому хосту установлен.
+    connect_time : float | None
+        Время установки TCP-соединения с прокси в секундах.
+    first_byte_time : float | None
+        Время от начала рукопожатия до первого байта ответа прокси в секундах.
+    total_time : float | None
+        Время до установки туннеля или ошибки в секундах.
+    error : str | None
+        Описание ошибки.
+    """
+
+    __slots__ = ('proxy_id', 'ok', 'connect_time', 'first_byte_time', 'total_time', 'error')
+
+    def __init__(self, proxy_id: str | None, ok: bool, connect_time: float | None = None,
+                 first_byte_time: float | None = None, total_time: float | None = None,
+                 error: str | None = None) -> None:
+        self.proxy_id = proxy_id
+        self.ok = ok
+        self.connect_time = connect_time
+        self.first_byte_time = first_byte_time
+        self.total_time = total_time
+        self.error = error
+
+    def __repr__(self) -> str:
+        return f'ProbeResult(proxy_id={self.proxy_id!r}, ok={self.ok}, total_time={self.total_time})'
+
+
+class ProxyProber:
+    """
+    Локальная проверка прокси прямым соединением, без вызова API `check`.
+
+    Для каждого прокси устанавливается TCP-соединение и выполняется
+    рукопожатие HTTP CONNECT или SOCKS5 к целевому хосту; измеряются
+    время соединения и время до первого байта ответа прокси.
+
+    Parameters
+    ----------
+    target_host : str, optional
+        Целевой хост, к которому прокси должен открыть туннель.
+    target_port : int, optional
+        Целевой порт. По умолчанию 443.
+    timeout : float, optional
+        Таймаут проверки одного прокси в секундах. По умолчанию 10.
+    concurrency : int, optional
+        Максимальное число одновременных проверок. По умолчанию 500.
+    """
+
+    def __init__(self, *, target_host: str = 'www.google.com', target_port: int = 443,
+                 timeout: float = 10.0, concurrency: int = 500):
+        self.target_host = target_host
+        self.target_port = target_port
+        self.timeout = timeout
+        self.concurrency = concurrency
+
+    async def probe(self, proxy: Mapping) -> ProbeResult:
+        """
+        Проверяет один прокси.
+
+        Parameters
+        ----------
+        proxy : Mapping
+            Запись прокси из `get_proxy`.
+
+        Returns
+        -------
+        ProbeResult
+            Результат проверки; сетевые ошибки и ошибки рукопожатия
+            не выбрасываются, а записываются в `error`.
+        """
+        proxy_id = proxy.get('id')
+        started = time.monotonic()
+        timings: dict[str, float] = {}
+        streams: list[asyncio.StreamWriter] = []
+
+        async def handshake() -> None:
+            reader, writer = await asyncio.open_connection(proxy['host'], int(proxy['port']))
+            streams.append(writer)
+            connected = time.monotonic()
+            timings['connect'] = connected - started
+            first_byte_at = await _handshake(proxy, reader, writer, self.target_host, self.target_port)
+            timings['first_byte'] = first_byte_at - connected
+
+        try:
+            await asyncio.wait_for(handshake(), self.timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError,
+                asyncio.LimitOverrunError, ProbeError) as e:
+            return ProbeResult(proxy_id, False, timings.get('connect'), timings.get('first_byte'),
+                               time.monotonic() - started, str(e) or type(e).__name__)
+        finally:
+            for writer in streams:
+                writer.close()
+        return ProbeResult(proxy_id, True, timings['connect'], timings['first_byte'],
+                           time.monotonic() - started)
+
+    async def probe_many(self, proxies: Iterable[Mapping]) -> AsyncIterator[ProbeResult]:
+        """
+        Проверяет прокси конкурентно и выдает результаты по мере готовности.
+
+        Parameters
+        ----------
+        proxies : Iterable[Mapping]
+            Записи прокси, например из `AsyncProxy6.aiter_proxies` после
+            материализации или `get_proxy(...).values()`.
+
+        Yields
+        ------
+        ProbeResult
+            Результат проверки в порядке завершения.
+        """
+        proxies = iter(proxies)
+        pending = {asyncio.ensure_future(self.probe(proxy))
+                   for proxy in itertools.islice(proxies, self.concurrency)}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for proxy in itertools.islice(proxies, len(done)):
+                    pending.add(asyncio.ensure_future(self.probe(proxy)))
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,660 @@
+"""
+Proxy6 API Client — колоночное хранение и индексы списка прокси для запросов по парку
+
+Copyright (c) 2026 Alexsey Novikov
+
+Распространяется под лицензией MIT.
+Подробнее см. в файле LICENSE или на https://opensource.org/licenses/MIT.
+"""
+
+
+import bisect
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+
+from proxy6_client import AsyncProxy6, Proxy, Proxy6
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необязателен: без него операции выполняются на чистом Python
+    np = None
+
+
+class ProxyTable:
+    """
+    Колоночная таблица прокси с векторизованными фильтрацией,
+    сортировкой и группировкой.
+
+    Числовые поля хранятся в `array.array`, строковые поля с малым числом
+    различных значений (страна, тип, комментарий) — как коды в словаре
+    значений. Если установлен NumPy, операции выполняются над
+    `numpy.frombuffer`-представлениями колонок без копирования данных.
+
+    Результаты `filter` и `sort_by` — представления: они разделяют колонки
+    исходной таблицы и хранят только массив номеров строк.
+
+    Parameters
+    ----------
+    records : Iterable[dict | Proxy], optional
+        Записи прокси из `get_proxy` или записи `Proxy`.
+    """
+
+    NUMERIC: dict[str, str] = {
+        'id': 'q',
+        'port': 'I',
+        'version': 'B',
+        'unixtime': 'q',
+        'unixtime_end': 'q',
+        'active': 'B',
+    }
+    CATEGORICAL: tuple[str, ...] = ('country', 'type', 'descr')
+    TEXT: tuple[str, ...] = ('ip', 'host', 'user', 'password')
+
+    def __init__(self, records: Iterable[dict | Proxy] = ()) -> None:
+        self._numeric: dict[str, array] = {name: array(code) for name, code in self.NUMERIC.items()}
+        self._codes: dict[str, array] = {name: array('I') for name in self.CATEGORICAL}
+        self._labels: dict[str, list[str]] = {name: [] for name in self.CATEGORICAL}
+        self._lookup: dict[str, dict[str, int]] = {name: {} for name in self.CATEGORICAL}
+        self._text: dict[str, list[str]] = {name: [] for name in self.TEXT}
+        self._selection: array | None = None
+        self.extend(records)
+
+    @classmethod
+    def from_client(cls, client: Proxy6, *, state: str = 'all', descr: str | None = None) -> 'ProxyTable':
+        """
+        Загружает таблицу постранично через `Proxy6.iter_proxies`.
+
+        Parameters
+        ----------
+        client : Proxy6
+            Синхронный клиент.
+        state : str, optional
+            Статус прокси. По умолчанию 'all'.
+        descr : str | None, optional
+            Фильтр по комментарию.
+
+        Returns
+        -------
+        ProxyTable
+            Таблица прокси аккаунта.
+        """
+        return cls(client.iter_proxies(state=state, descr=descr, typed=True))
+
+    @classmethod
+    async def afrom_client(cls, client: AsyncProxy6, *, state: str = 'all', descr: str | None = None,
+                           prefetch: int = 0) -> 'ProxyTable':
+        """
+        Загружает таблицу постранично через `AsyncProxy6.aiter_proxies`.
+
+        Parameters
+        ----------
+        client : AsyncProxy6
+            Асинхронный клиент с активной HTTP-сессией.
+        state : str, optional
+            Статус прокси. По умолчанию 'all'.
+        descr : str | None, optional
+            Фильтр по комментарию.
+        prefetch : int, optional
+            Число страниц, загружаемых параллельно. По умолчанию 0.
+
+        Returns
+        -------
+        ProxyTable
+            Таблица прокси аккаунта.
+        """
+        table = cls()
+        async for proxy in client.aiter_proxies(state=state, descr=descr, prefetch=prefetch, typed=True):
+            table.append(proxy)
+        return table
+
+    def append(self, record: dict | Proxy) -> None:
+        """
+        Добавляет запись в конец таблицы.
+
+        Parameters
+        ----------
+        record : dict | Proxy
+            Запись прокси из `get_proxy` или запись `Proxy`.
+
+        Raises
+        ------
+        ValueError
+            Если таблица является представлением другой таблицы.
+        """
+        if self._selection is not None:
+            raise ValueError('cannot append to a table view')
+        proxy = record if isinstance(record, Proxy) else Proxy.from_api(record)
+        for name, column in self._numeric.items():
+            column.append(int(getattr(proxy, name)))
+        for name, codes in self._codes.items():
+            value = getattr(proxy, name)
+            code = self._lookup[name].get(value)
+            if code is None:
+                code = self._lookup[name][value] = len(self._labels[name])
+                self._labels[name].append(value)
+            codes.append(code)
+        for name, column in self._text.items():
+            column.append(getattr(proxy, name))
+
+    def extend(self, records: Iterable[dict | Proxy]) -> None:
+        """
+        Добавляет записи в конец таблицы.
+
+        Parameters
+        ----------
+        records : Iterable[dict | Proxy]
+            Записи прокси.
+        """
+        for record in records:
+            self.append(record)
+
+    def _view(self, selection: array) -> 'ProxyTable':
+        view = object.__new__(type(self))
+        view._numeric = self._numeric
+        view._codes = self._codes
+        view._labels = self._labels
+        view._lookup = self._lookup
+        view._text = self._text
+        view._selection = selection
+        return view
+
+    def _rows(self) -> array | range:
+        if self._selection is None:
+            return range(len(self._numeric['id']))
+        return self._selection
+
+    def _raw(self, name: str) -> array:
+        if name in self._numeric:
+            return self._numeric[name]
+        if name in self._codes:
+            return self._codes[name]
+        raise KeyError(f'unknown or non-vectorized column: {name}')
+
+    def _np_rows(self) -> 'np.ndarray':
+        if self._selection is None:
+            return np.arange(len(self._numeric['id']), dtype=np.int64)
+        return np.frombuffer(self._selection, dtype=np.int64)
+
+    def _np_column(self, name: str) -> 'np.ndarray':
+        return np.frombuffer(self._raw(name), dtype=self._raw(name).typecode)
+
+    def __len__(self) -> int:
+        return len(self._rows())
+
+    def column(self, name: str) -> 'list | array | np.ndarray':
+        """
+        Возвращает значения колонки для строк таблицы.
+
+        Числовые колонки возвращаются копией: `numpy.ndarray` только для
+        чтения при наличии NumPy, иначе `array.array`. Представление поверх
+        живого буфера удерживало бы его экспорт, и `append`/`extend`
+        исходной таблицы завершались бы `BufferError`.
+
+        Parameters
+        ----------
+        name : str
+            Название поля `Proxy`.
+
+        Returns
+        -------
+        list | array | numpy.ndarray
+            Значения колонки; для строковых полей — список строк.
+        """
+        if name in self._codes:
+            labels = self._labels[name]
+            codes = self._codes[name]
+            return [labels[codes[row]] for row in self._rows()]
+        if name in self._text:
+            column = self._text[name]
+            return [column[row] for row in self._rows()]
+        if np is not None:
+            values = self._np_column(name)
+            values = values.copy() if self._selection is None else values[self._np_rows()]
+            values.flags.writeable = False
+            return values
+        column = self._numeric[name]
+        if self._selection is None:
+            return array(column.typecode, column)
+        return array(column.typecode, (column[row] for row in self._selection))
+
+    def filter(
+        self,
+        *,
+        country: str | Iterable[str] | None = None,
+        type: str | None = None,
+        descr: str | Iterable[str] | None = None,
+        version: int | None = None,
+        active: bool | None = None,
+        expires_before: int | datetime | None = None,
+        expires_after: int | datetime | None = None,
+    ) -> 'ProxyTable':
+        """
+        Отбирает строки, удовлетворяющие всем заданным условиям.
+
+        Parameters
+        ----------
+        country : str | Iterable[str] | None, optional
+            Код страны или набор кодов.
+        type : str | None, optional
+            Тип прокси: 'http' или 'socks'.
+        descr : str | Iterable[str] | None, optional
+            Комментарий или набор комментариев.
+        version : int | None, optional
+            Версия прокси.
+        active : bool | None, optional
+            Признак активности.
+        expires_before : int | datetime | None, optional
+            Окончание строго раньше момента (unixtime или datetime).
+        expires_after : int | datetime | None, optional
+            Окончание не раньше момента (unixtime или datetime).
+
+        Returns
+        -------
+        ProxyTable
+            Представление с отобранными строками.
+        """
+        equals: list[tuple[str, set[int]]] = []
+        for name, wanted in (('country', country), ('type', type), ('descr', descr)):
+            if wanted is None:
+                continue
+            values = {wanted} if isinstance(wanted, str) else set(wanted)
+            equals.append((name, {self._lookup[name][v] for v in values if v in self._lookup[name]}))
+        for name, wanted in (('version', version), ('active', active)):
+            if wanted is not None:
+                equals.append((name, {int(wanted)}))
+        ranges: list[tuple[int | None, int | None]] = []
+        if expires_before is not None or expires_after is not None:
+            ranges.append((unixtime(expires_after), unixtime(expires_before)))
+
+        if np is not None:
+            rows = self._np_rows()
+            mask = np.ones(len(rows), dtype=bool)
+            for name, codes in equals:
+                mask &= np.isin(self._np_column(name)[rows], list(codes))
+            for low, high in ranges:
+                ends = self._np_column('unixtime_end')[rows]
+                if low is not None:
+                    mask &= ends >= low
+                if high is not None:
+                    mask &= ends < high
+            selection = array('q')
+            selection.frombytes(rows[mask].astype(np.int64).tobytes())
+            return self._view(selection)
+
+        rows = self._rows()
+        for name, codes in equals:
+            column = self._raw(name)
+            rows = [row for row in rows if column[row] in codes]
+        for low, high in ranges:
+            ends = self._numeric['unixtime_end']
+            if low is not None:
+                rows = [row for row in rows if ends[row] >= low]
+            if high is not None:
+                rows = [row for row in rows if ends[row] < high]
+        return self._view(array('q', rows))
+
+    def sort_by(self, name: str, *, reverse: bool = False) -> 'ProxyTable':
+        """
+        Сортирует строки по колонке (стабильно).
+
+        Parameters
+        ----------
+        name : str
+            Название числовой или категориальной колонки.
+        reverse : bool, optional
+            Сортировать по убыванию. По умолчанию False.
+
+        Returns
+        -------
+        ProxyTable
+            Представление с отсортированными строками.
+        """
+        if np is not None:
+            rows = self._np_rows()
+            keys = self._np_column(name)[rows].astype(np.int64)
+            if name in self._codes:
+                keys = self._label_ranks(name)[keys]
+            order = np.argsort(-keys if reverse else keys, kind='stable')
+            selection = array('q')
+            selection.frombytes(rows[order].astype(np.int64).tobytes())
+            return self._view(selection)
+
+        column = self._raw(name)
+        if name in self._codes:
+            labels = self._labels[name]
+            key = lambda row: labels[column[row]]
+        else:
+            key = column.__getitem__
+        return self._view(array('q', sorted(self._rows(), key=key, reverse=reverse)))
+
+    def _label_ranks(self, name: str) -> 'np.ndarray':
+        labels = self._labels[name]
+        ranks = np.empty(len(labels), dtype=np.int64)
+        for rank, code in enumerate(sorted(range(len(labels)), key=labels.__getitem__)):
+            ranks[code] = rank
+        return ranks
+
+    def groupby(self, name: str) -> dict[object, 'ProxyTable']:
+        """
+        Разбивает строки на группы по значению колонки.
+
+        Parameters
+        ----------
+        name : str
+            Название числовой или категориальной колонки.
+
+        Returns
+        -------
+        dict[object, ProxyTable]
+            Представления групп по значению колонки.
+        """
+        if np is not None:
+            rows = self._np_rows()
+            keys = self._np_column(name)[rows]
+            order = np.argsort(keys, kind='stable')
+            values, starts = np.unique(keys[order], return_index=True)
+            groups = {}
+            for value, chunk in zip(values.tolist(), np.split(rows[order], starts[1:])):
+                selection = array('q')
+                selection.frombytes(chunk.astype(np.int64).tobytes())
+                groups[self._label(name, value)] = self._view(selection)
+            return groups
+
+        column = self._raw(name)
+        grouped: dict[int, array] = {}
+        for row in self._rows():
+            grouped.setdefault(column[row], array('q')).append(row)
+        return {self._label(name, value): self._view(rows) for value, rows in grouped.items()}
+
+    def count_by(self, name: str) -> dict[object, int]:
+        """
+        Считает строки по значениям колонки.
+
+        Parameters
+        ----------
+        name : str
+            Название числовой или категориальной колонки.
+
+        Returns
+        -------
+        dict[object, int]
+            Количество строк для каждого значения.
+        """
+        if np is not None:
+            values, counts = np.unique(self._np_column(name)[self._np_rows()], return_counts=True)
+            return {self._label(name, value): count
+                    for value, count in zip(values.tolist(), counts.tolist())}
+        column = self._raw(name)
+        counts = Counter(column[row] for row in self._rows())
+        return {self._label(name, value): count for value, count in counts.items()}
+
+    def _label(self, name: str, value: int) -> object:
+        if name in self._codes:
+            return self._labels[name][value]
+        if name == 'active':
+            return bool(value)
+        return value
+
+    def row(self, index: int) -> Proxy:
+        """
+        Собирает запись `Proxy` для строки таблицы.
+
+        Parameters
+        ----------
+        index : int
+            Номер строки в таблице (представлении).
+
+        Returns
+        -------
+        Proxy
+            Запись прокси.
+        """
+        row = self._rows()[index]
+        fields = {name: column[row] for name, column in self._numeric.items()}
+        fields['active'] = bool(fields['active'])
+        for name, codes in self._codes.items():
+            fields[name] = self._labels[name][codes[row]]
+        for name, column in self._text.items():
+            fields[name] = column[row]
+        return Proxy(**fields)
+
+    def __iter__(self) -> Iterator[Proxy]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def ids(self) -> list[int]:
+        """
+        Возвращает ID прокси строк таблицы.
+
+        Returns
+        -------
+        list[int]
+            ID прокси в порядке строк.
+        """
+        column = self._numeric['id']
+        return [column[row] for row in self._rows()]
+
+    def __repr__(self) -> str:
+        return f'ProxyTable(rows={len(self)})'
+
+
+class ProxyIndex:
+    """
+    Поддерживаемый в памяти индекс прокси для поиска по группам и срокам.
+
+    Хеш-индексы по комментарию, стране и типу дают поиск группы за O(1),
+    отсортированный индекс по `unixtime_end` — диапазонные запросы по сроку
+    окончания за O(log n + k). Индексы обновляются при каждом `add`/`remove`.
+
+    Parameters
+    ----------
+    proxies : Iterable[dict | Proxy], optional
+        Начальный набор прокси.
+    """
+
+    KEYS: tuple[str, ...] = ('descr', 'country', 'type')
+
+    def __init__(self, proxies: Iterable[dict | Proxy] = ()) -> None:
+        self._proxies: dict[int, Proxy] = {}
+        self._hash: dict[str, dict[str, set[int]]] = {key: {} for key in self.KEYS}
+        self._expiry: list[tuple[int, int]] = []
+        self.replace(proxies)
+
+    def replace(self, proxies: Iterable[dict | Proxy]) -> None:
+        """
+        Перестраивает индекс по полному набору прокси.
+
+        Parameters
+        ----------
+        proxies : Iterable[dict | Proxy]
+            Записи прокси из `get_proxy` или записи `Proxy`.
+        """
+        self._proxies = {}
+        self._hash = {key: {} for key in self.KEYS}
+        for record in proxies:
+            proxy = record if isinstance(record, Proxy) else Proxy.from_api(record)
+            self._proxies[proxy.id] = proxy
+        for proxy in self._proxies.values():
+            for key in self.KEYS:
+                self._hash[key].setdefault(getattr(proxy, key), set()).add(proxy.id)
+        self._expiry = sorted((proxy.unixtime_end, proxy.id) for proxy in self._proxies.values())
+
+    def add(self, record: dict | Proxy) -> None:
+        """
+        Добавляет прокси или обновляет уже проиндексированный.
+
+        Parameters
+        ----------
+        record : dict | Proxy
+            Запись прокси.
+        """
+        proxy = record if isinstance(record, Proxy) else Proxy.from_api(record)
+        self.remove(proxy.id)
+        self._proxies[proxy.id] = proxy
+        for key in self.KEYS:
+            self._hash[key].setdefault(getattr(proxy, key), set()).add(proxy.id)
+        bisect.insort(self._expiry, (proxy.unixtime_end, proxy.id))
+
+    def remove(self, proxy_id: int) -> Proxy | None:
+        """
+        Удаляет прокси из индекса.
+
+        Parameters
+        ----------
+        proxy_id : int
+            Внутренний номер прокси.
+
+        Returns
+        -------
+        Proxy | None
+            Удаленная запись или None, если прокси не был проиндексирован.
+        """
+        proxy = self._proxies.pop(int(proxy_id), None)
+        if proxy is None:
+            return None
+        for key in self.KEYS:
+            group = self._hash[key][getattr(proxy, key)]
+            group.discard(proxy.id)
+            if not group:
+                del self._hash[key][getattr(proxy, key)]
+        position = bisect.bisect_left(self._expiry, (proxy.unixtime_end, proxy.id))
+        del self._expiry[position]
+        return proxy
+
+    def get(self, proxy_id: int) -> Proxy | None:
+        """
+        Возвращает прокси по ID.
+
+        Parameters
+        ----------
+        proxy_id : int
+            Внутренний номер прокси.
+
+        Returns
+        -------
+        Proxy | None
+            Запись прокси или None.
+        """
+        return self._proxies.get(int(proxy_id))
+
+    def groups(self, key: str) -> dict[str, int]:
+        """
+        Возвращает размеры групп по ключу хеш-индекса.
+
+        Parameters
+        ----------
+        key : str
+            'descr', 'country' или 'type'.
+
+        Returns
+        -------
+        dict[str, int]
+            Количество прокси в каждой группе.
+        """
+        return {value: len(ids) for value, ids in self._hash[key].items()}
+
+    def expiring(self, before: int | datetime, after: int | datetime | None = None) -> list[Proxy]:
+        """
+        Возвращает прокси со сроком окончания в диапазоне [after, before).
+
+        Parameters
+        ----------
+        before : int | datetime
+            Верхняя граница (не включается), unixtime или datetime.
+        after : int | datetime | None, optional
+            Нижняя граница (включается). По умолчанию без ограничения.
+
+        Returns
+        -------
+        list[Proxy]
+            Прокси в порядке окончания срока.
+        """
+        return [self._proxies[proxy_id] for _, proxy_id in self._expiry_range(after, before)]
+
+    def _expiry_range(self, after: int | datetime | None,
+                      before: int | datetime | None) -> list[tuple[int, int]]:
+        low = 0 if after is None else bisect.bisect_left(self._expiry, (unixtime(after), -1))
+        high = len(self._expiry) if before is None else bisect.bisect_left(
+            self._expiry, (unixtime(before), -1)
+        )
+        return self._expiry[low:high]
+
+    def find(
+        self,
+        *,
+        descr: str | None = None,
+        country: str | None = None,
+        type: str | None = None,
+        expires_before: int | datetime | None = None,
+        expires_after: int | datetime | None = None,
+    ) -> list[Proxy]:
+        """
+        Ищет прокси по группам и сроку окончания; условия объединяются через И.
+
+        Parameters
+        ----------
+        descr : str | None, optional
+            Технический комментарий.
+        country : str | None, optional
+            Код страны (ISO2).
+        type : str | None, optional
+            Тип прокси: 'http' или 'socks'.
+        expires_before : int | datetime | None, optional
+            Окончание строго раньше момента.
+        expires_after : int | datetime | None, optional
+            Окончание не раньше момента.
+
+        Returns
+        -------
+        list[Proxy]
+            Найденные прокси в порядке окончания срока.
+        """
+        groups = []
+        for key, value in (('descr', descr), ('country', country), ('type', type)):
+            if value is not None:
+                groups.append(self._hash[key].get(value, set()))
+        groups.sort(key=len)
+
+        if expires_before is not None or expires_after is not None:
+            entries = self._expiry_range(expires_after, expires_before)
+            return [self._proxies[proxy_id] for _, proxy_id in entries
+                    if all(proxy_id in group for group in groups)]
+        if not groups:
+            return [self._proxies[proxy_id] for _, proxy_id in self._expiry]
+
+        ids = groups[0].intersection(*groups[1:])
+        return sorted((self._proxies[proxy_id] for proxy_id in ids),
+                      key=lambda proxy: (proxy.unixtime_end, proxy.id))
+
+    def __len__(self) -> int:
+        return len(self._proxies)
+
+    def __contains__(self, proxy_id: object) -> bool:
+        return proxy_id in self._proxies
+
+    def __iter__(self) -> Iterator[Proxy]:
+        return iter(list(self._proxies.values()))
+
+    def __repr__(self) -> str:
+        return f'ProxyIndex(proxies={len(self)})'
+
+
+def unixtime(moment: int | datetime | None) -> int | None:
+    """
+    Приводит момент времени к unixtime.
+
+    Parameters
+    ----------
+    moment : int | datetime | None
+        Unixtime или `datetime`.
+
+    Returns
+    -------
+    int | None
+        Unixtime; None, если момент не задан.
+    """
+    if isinstance(moment, datetime):
+        return int(moment.timestamp())
+    return moment